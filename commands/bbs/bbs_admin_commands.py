@@ -2,8 +2,8 @@
 
 from evennia import default_cmds
 from evennia.commands.default.muxcommand import MuxCommand
-from evennia import create_object
-from typeclasses.bbs_controller import BBSController
+from world.utils.bbs_utils import get_or_create_bbs_controller
+from world.bbs.storage import migrate_legacy_boards
 
 class CmdResetBBS(MuxCommand):
     """
@@ -30,14 +30,30 @@ class CmdResetBBS(MuxCommand):
         # Reset the confirmation
         self.caller.ndb.confirmation = None
 
-        # Find or create the BBSController
-        try:
-            controller = BBSController.objects.get(db_key="BBSController")
-        except BBSController.DoesNotExist:
-            controller = create_object(BBSController, key="BBSController")
-            self.caller.msg("BBSController created.")
-
-        # Reset the boards and initialize next_board_id
-        controller.db.boards = {}
-        controller.db.next_board_id = 1  # Initialize next_board_id to 1
-        self.caller.msg("BBSController has been reset. All boards and posts have been deleted.")
\ No newline at end of file
+        # Delete every board; posts and read markers go with them
+        controller = get_or_create_bbs_controller()
+        controller.reset()
+        self.caller.msg("BBSController has been reset. All boards and posts have been deleted.")
+
+class CmdMigrateBBS(MuxCommand):
+    """
+    Move boards from the old BBSController object into the BBS tables.
+
+    Usage:
+      +bbs/migrate
+
+    Copies every board, post and read marker stored on the old
+    BBSController's boards attribute. Boards that already exist by name
+    are skipped, so it is safe to run more than once. The old object is
+    left untouched.
+    """
+    key = "+bbs/migrate"
+    locks = "cmd:perm(Admin)"
+    help_category = "Event & Bulletin Board"
+
+    def func(self):
+        boards, posts = migrate_legacy_boards()
+        if not boards:
+            self.caller.msg("No boards to migrate.")
+            return
+        self.caller.msg(f"Migrated {boards} board{'s' if boards != 1 else ''} and {posts} post{'s' if posts != 1 else ''}.")
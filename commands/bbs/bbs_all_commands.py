@@ -1,32 +1,44 @@
 #commands/bbs/bbs_all_commands.py
 
-# Standard Library Imports
-from datetime import datetime
-
-# Django Imports
-from django.utils import timezone
-
 # Evennia Imports
 from evennia import default_cmds
 from evennia.commands.default.muxcommand import MuxCommand
-from evennia import create_object
-from evennia.server.sessionhandler import SESSION_HANDLER
 
 # Local Imports
-from typeclasses.bbs_controller import BBSController
 from world.utils.bbs_utils import get_or_create_bbs_controller
+from world.bbs.subscribers import BBS_SUBSCRIBERS
 from typeclasses.groups import Group, get_group_by_name, get_character_groups
-import pytz
 from world.utils.time_utils import TIME_MANAGER
 from utils.search_helpers import search_character
 
+# Most results +bbs/search shows
+BBS_SEARCH_LIMIT = 20
+
+
+def parse_page(args):
+    """
+    Get the page number from a '<board>/page <number>' argument.
+
+    Returns:
+        int or None: The page, or None if args don't ask for a page
+    """
+    if "/" not in args:
+        return None
+    page = args.split("/", 1)[1].strip().lower()
+    if not page.startswith("page"):
+        return None
+    page = page[4:].strip()
+    return int(page) if page.isdigit() else 1
+
 class CmdBBS(MuxCommand):
     """
     Access the bulletin board system.
     
     Usage:
       +bbs                        - List all available boards
-      +bbs <board>               - List all posts on a board
+      +bbs <board>               - List the first page of posts on a board
+      +bbs <board>/page <number> - List another page of posts on a board
+      +bbs/next, +bbs/prev       - Show the next or previous page of the last board listed
       +bbs <board>/<post>        - Read a specific post
       +bbs/post <board>/<title> = <message>
                                 - Post a new message
@@ -37,6 +49,11 @@ class CmdBBS(MuxCommand):
       +bbs/readall <board>       - Mark all posts in a board as read
       +bbs/unsubscribe <board>   - Unsubscribe from a board (hide it from your listings)
       +bbs/subscribe <board>     - Resubscribe to a board you previously unsubscribed from
+      +bbs/search <terms>[=<board>]
+                                - Search post titles and text for all the terms
+      +bbs/archive <board>[/page <number>]
+                                - List a board's archived posts
+      +bbs/archive <board>/<post> - Read an archived post
       
     Admin/Builder commands:
       +bbs/create <name> = <description>[/group=<group1>,<group2>...]
@@ -57,6 +74,8 @@ class CmdBBS(MuxCommand):
       +bbs/unpin <board>/<post> - Unpin a post
       +bbs/deleteboard <board>  - Delete an entire board
       +bbs/readonly <board>     - Toggle read-only mode for a board
+      +bbs/retention <board> = <max posts>[, <max days>]
+                                - Archive posts past a count or age (0 = no limit)
       +bbs/viewas <board> = <player>
                                 - View a board as if you were another player
                                 - Useful for verifying permissions
@@ -108,6 +127,8 @@ class CmdBBS(MuxCommand):
       +bbs/create Staff = Staff Discussion
       +bbs/create IC = In Character / private /group=Vampire,Werewolf
       +bbs/readonly Announcements
+      +bbs/search spice harvest
+      +bbs/search landsraad vote=Announcements
     """
     key = "+bbs"
     aliases = ["bbs", "@bbs", "bb", "+bb"]
@@ -131,77 +152,19 @@ class CmdBBS(MuxCommand):
             message (str): The notification message to send
             exclude_char (Character, optional): Character to exclude from notification
         """
-        session_list = SESSION_HANDLER.get_sessions()
-        controller = get_or_create_bbs_controller()
-        
-        for session in session_list:
-            if not session.logged_in:
+        # Online characters who can read the board and haven't unsubscribed
+        for puppet in BBS_SUBSCRIBERS.get_subscribers(board['id']):
+            if exclude_char and puppet == exclude_char:
                 continue
-            puppet = session.get_puppet()
-            if not puppet or (exclude_char and puppet == exclude_char):
-                continue
-            
-            # Check if user has access to the board
-            if controller.has_access(board['id'], puppet.key):
-                # Check if user has unsubscribed from the board
-                unsubscribed_boards = puppet.attributes.get("unsubscribed_bbs_boards", [])
-                if board['id'] in unsubscribed_boards:
-                    # Skip notification for unsubscribed boards
-                    continue
-                
-                puppet.msg(f"|w{message}|n")
+            puppet.msg(f"|w{message}|n")
 
-    def format_datetime(self, dt_str, target_char=None):
-        """Format datetime string in the user's timezone."""
-        if not target_char:
-            target_char = self.caller
-            
-        try:
-            # Parse the datetime string to a datetime object
-            dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")
-            dt = dt.replace(tzinfo=timezone.utc)
-            
-            # Get the caller's timezone
-            tz_name = target_char.attributes.get("timezone", "UTC")
-            try:
-                # Try to get the timezone from pytz
-                tz = pytz.timezone(TIME_MANAGER.normalize_timezone_name(tz_name))
-                # Convert to the caller's timezone
-                local_dt = dt.astimezone(tz)
-                # Format without timezone indicator
-                return local_dt.strftime("%Y-%m-%d %H:%M")
-            except (pytz.exceptions.UnknownTimeZoneError, AttributeError, ValueError):
-                # Fallback to UTC if there's any error
-                return dt.strftime("%Y-%m-%d %H:%M")
-        except ValueError:
-            # If we can't parse the datetime string, return it as is
-            return dt_str
+    def format_datetime(self, timestamp, target_char=None):
+        """Format an epoch post time in the user's timezone."""
+        return TIME_MANAGER.get_formatter(target_char or self.caller).format(timestamp)
             
-    def format_date(self, dt_str, target_char=None):
-        """Format datetime string in the user's timezone, showing only the date."""
-        if not target_char:
-            target_char = self.caller
-            
-        try:
-            # Parse the datetime string to a datetime object
-            dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")
-            dt = dt.replace(tzinfo=timezone.utc)
-            
-            # Get the caller's timezone
-            tz_name = target_char.attributes.get("timezone", "UTC")
-            try:
-                # Try to get the timezone from pytz
-                tz = pytz.timezone(TIME_MANAGER.normalize_timezone_name(tz_name))
-                # Convert to the caller's timezone
-                local_dt = dt.astimezone(tz)
-                # Format without timezone indicator, only date
-                return local_dt.strftime("%Y-%m-%d")
-            except (pytz.exceptions.UnknownTimeZoneError, AttributeError, ValueError):
-                # Fallback to UTC if there's any error
-                return dt.strftime("%Y-%m-%d")
-        except ValueError:
-            # If we can't parse the datetime string, return it as is
-            return dt_str
+    def format_date(self, timestamp, target_char=None):
+        """Format an epoch post time in the user's timezone, showing only the date."""
+        return TIME_MANAGER.get_formatter(target_char or self.caller).format_date(timestamp)
 
     def func(self):
         # Check for --asPlayer option
@@ -257,9 +220,18 @@ class CmdBBS(MuxCommand):
                 self.do_unsubscribe()
             elif switch == "subscribe":
                 self.do_subscribe()
+            elif switch == "search":
+                self.do_search()
+            elif switch == "archive":
+                self.do_archive()
+            elif switch == "next":
+                self.do_page(1)
+            elif switch == "prev":
+                self.do_page(-1)
             
             # Admin/Builder commands
-            elif switch in ["create", "editboard", "lock", "pin", "unpin", "deleteboard", "readonly", "viewas"]:
+            elif switch in ["create", "editboard", "lock", "pin", "unpin", "deleteboard", "readonly", "viewas",
+                            "retention"]:
                 if not (self.check_admin_access() or self.check_builder_access()):
                     self.caller.msg("You don't have permission to use this command.")
                     return
@@ -280,12 +252,24 @@ class CmdBBS(MuxCommand):
                     self.do_readonly()
                 elif switch == "viewas":
                     self.do_viewas()
+                elif switch == "retention":
+                    self.do_retention()
             else:
                 self.caller.msg("Invalid switch or insufficient permissions.")
             return
 
         # No switch - handle reading posts
-        if "/" in self.args:
+        page = parse_page(self.args)
+        if page:
+            # Listing one page of a board
+            board_ref = self.args.split("/", 1)[0].strip()
+            board_ref = int(board_ref) if board_ref.isdigit() else board_ref
+            controller = get_or_create_bbs_controller()
+            if as_player:
+                self.list_posts_as_player(controller, board_ref, as_player, page)
+            else:
+                self.list_posts(controller, board_ref, page)
+        elif "/" in self.args:
             # Reading specific post
             board_ref, post_number = self.args.split("/", 1)
             try:
@@ -323,7 +307,7 @@ class CmdBBS(MuxCommand):
         title, content = [arg.strip() for arg in post_data.split("=", 1)]
 
         controller = get_or_create_bbs_controller()
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
             return
@@ -334,8 +318,7 @@ class CmdBBS(MuxCommand):
             self.caller.msg(f"You do not have write access to post on the board '{board['name']}'.")
             return
             
-        post_number = len(board['posts']) + 1
-        controller.create_post(board['id'], title, content, self.caller.key)
+        post_number = controller.create_post(board['id'], title, content, self.caller.key)
         
         self.caller.msg(f"Post '{title}' added to board '{board['name']}'.")
         
@@ -353,7 +336,7 @@ class CmdBBS(MuxCommand):
         post_number, new_content = [arg.strip() for arg in post_data.split("=", 1)]
 
         controller = get_or_create_bbs_controller()
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
             return
@@ -364,12 +347,11 @@ class CmdBBS(MuxCommand):
             self.caller.msg("Post number must be an integer.")
             return
             
-        posts = board['posts']
-        if post_number < 1 or post_number > len(posts):
-            self.caller.msg(f"Invalid post number. Board '{board['name']}' has {len(posts)} posts.")
+        post = controller.get_post(board['id'], post_number - 1) if post_number >= 1 else None
+        if not post:
+            self.caller.msg(f"Invalid post number. Board '{board['name']}' has {board['post_count']} posts.")
             return
             
-        post = posts[post_number - 1]
         is_author = self.caller.key == post['author']
         is_admin = self.check_admin_access() or self.check_builder_access()
         
@@ -399,7 +381,7 @@ class CmdBBS(MuxCommand):
         board_ref, post_number = [arg.strip() for arg in self.args.split("/", 1)]
 
         controller = get_or_create_bbs_controller()
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
             return
@@ -410,12 +392,11 @@ class CmdBBS(MuxCommand):
             self.caller.msg("Post number must be an integer.")
             return
             
-        posts = board['posts']
-        if post_number < 1 or post_number > len(posts):
-            self.caller.msg(f"Invalid post number. Board '{board['name']}' has {len(posts)} posts.")
+        post = controller.get_post(board['id'], post_number - 1) if post_number >= 1 else None
+        if not post:
+            self.caller.msg(f"Invalid post number. Board '{board['name']}' has {board['post_count']} posts.")
             return
             
-        post = posts[post_number - 1]
         if self.check_admin_access() or self.check_builder_access() or self.caller.key == post['author']:
             controller.delete_post(board['id'], post_number - 1)
             self.caller.msg(f"Post {post_number} has been deleted from board '{board['name']}'.")
@@ -463,7 +444,7 @@ class CmdBBS(MuxCommand):
 
         name = name_desc.strip()
         controller = get_or_create_bbs_controller()
-        controller.create_board(name, description, not is_public, group_names=group_names)
+        controller.create_board(name, description, is_public, group_names=group_names)
         
         msg = f"Board '{name}' created as {'public' if is_public else 'private'}"
         if group_names:
@@ -481,7 +462,7 @@ class CmdBBS(MuxCommand):
         field, value = [arg.strip() for arg in field_value.split(",", 1)]
 
         controller = get_or_create_bbs_controller()
-        board = controller.get_board(board_name)
+        board = controller.get_board(board_name, posts=False)
         if not board:
             self.caller.msg(f"No board found with the name '{board_name}'.")
             return
@@ -516,7 +497,7 @@ class CmdBBS(MuxCommand):
             
         board_ref, post_number = [arg.strip() for arg in self.args.split("/", 1)]
         controller = get_or_create_bbs_controller()
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
             return
@@ -538,7 +519,7 @@ class CmdBBS(MuxCommand):
             
         board_ref, post_number = [arg.strip() for arg in self.args.split("/", 1)]
         controller = get_or_create_bbs_controller()
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
             return
@@ -571,7 +552,7 @@ class CmdBBS(MuxCommand):
             
         board_ref = self.args.strip()
         controller = get_or_create_bbs_controller()
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
             return
@@ -581,43 +562,67 @@ class CmdBBS(MuxCommand):
         result = controller.set_read_only(board['id'], not current_status)
         self.caller.msg(result)
 
+    def do_retention(self):
+        """Handle the retention switch - set how many posts stay live on a board."""
+        if not self.args:
+            self.caller.msg("Usage: +bbs/retention <board> = <max posts>[, <max days>]")
+            return
+
+        controller = get_or_create_bbs_controller()
+        board_ref, _, limits = [arg.strip() for arg in self.args.partition("=")]
+        if not limits:
+            board = controller.get_board(board_ref, posts=False)
+            if not board:
+                self.caller.msg(f"No board found with the name or number '{board_ref}'.")
+                return
+            self.caller.msg(f"Board '{board['name']}' keeps {controller.describe_retention(board)}.")
+            return
+
+        limits = [limit.strip() for limit in limits.split(",", 1)]
+        if not all(limit.isdigit() for limit in limits):
+            self.caller.msg("Retention limits must be whole numbers; use 0 for no limit.")
+            return
+        max_posts = int(limits[0])
+        max_days = int(limits[1]) if len(limits) > 1 else 0
+        self.caller.msg(controller.set_retention(board_ref, max_posts, max_days))
+
     def do_scan(self):
         """Handle the scan switch - show unread posts on all accessible boards."""
         controller = get_or_create_bbs_controller()
-        boards = controller.db.boards
+        boards = controller.get_boards()
         if not boards:
             self.caller.msg("No boards available.")
             return
 
         # Get the character's unsubscribed boards list
         unsubscribed_boards = self.caller.attributes.get("unsubscribed_bbs_boards", [])
+        is_staff = self.check_admin_access() or self.check_builder_access()
+
+        # Unread posts for every board come from one read-mark lookup
+        unread_map = controller.get_unread_map(self.caller.key, boards)
 
         # Count total unread posts
         total_unread = 0
         unread_boards = []
 
-        # Sort boards by ID
-        sorted_boards = sorted(boards.items(), key=lambda x: x[0])
-
-        for board_id, board in sorted_boards:
-            if not controller.has_access(board_id, self.caller.key):
-                continue
-            
+        # Boards come sorted by ID
+        for board in boards:
+            board_id = board['id']
             # Skip unsubscribed boards unless admin/builder
-            if board_id in unsubscribed_boards and not (self.check_admin_access() or self.check_builder_access()):
+            if board_id in unsubscribed_boards and not is_staff:
                 continue
 
-            unread_posts = controller.get_unread_posts(board_id, self.caller.key)
-            if not unread_posts:
+            unread_posts = unread_map[board_id]
+            if not unread_posts or not controller.has_access(board_id, self.caller.key):
                 continue
 
             total_unread += len(unread_posts)
-            unread_boards.append((board['name'], len(unread_posts)))
+            unread_boards.append((board, unread_posts))
 
         # If this is a login notification (no explicit command), show concise output
         if not hasattr(self, 'session') or not self.session:
             if total_unread > 0:
-                board_summary = ", ".join(f"{name}: {count}" for name, count in unread_boards)
+                board_summary = ", ".join(f"{board['name']}: {len(posts)}" for board, posts in unread_boards)
                 self.caller.msg(f"|wYou have {total_unread} unread post{'s' if total_unread != 1 else ''} "
                               f"on the bulletin board ({board_summary}).|n")
             return
@@ -629,18 +634,7 @@ class CmdBBS(MuxCommand):
         output.append("|wUnread Postings on the Global Bulletin Board|n")
         output.append(f"{'|b-|n'*78}")
 
-        for board_id, board in sorted_boards:
-            if not controller.has_access(board_id, self.caller.key):
-                continue
-            
-            # Skip unsubscribed boards unless admin/builder
-            if board_id in unsubscribed_boards and not (self.check_admin_access() or self.check_builder_access()):
-                continue
-
-            unread_posts = controller.get_unread_posts(board_id, self.caller.key)
-            if not unread_posts:
-                continue
-
+        for board, unread_posts in unread_boards:
             # Format unread posts numbers
             unread_str = ", ".join(str(x) for x in unread_posts)
             
@@ -648,24 +642,24 @@ class CmdBBS(MuxCommand):
             access_type = ""
             if board.get('group_names'):  # If board has group restrictions
                 access_type = "*"  # restricted
-            elif not controller.has_write_access(board_id, self.caller.key):
+            elif not controller.has_write_access(board['id'], self.caller.key):
                 access_type = "-"  # read only
 
             # Format board name with access type
             board_name = f"|w{board['name']}|n {access_type}"
             
-            output.append(f"{board_name} (#{board_id}): {len(unread_posts)} unread ({unread_str})")
+            output.append(f"{board_name} (#{board['id']}): {len(unread_posts)} unread ({unread_str})")
 
         # Add footer with capacity information
         output.append(f"{'|b-|n'*78}")
         if total_unread > 0:
-            total_posts = sum(len(b['posts']) for b in boards.values() if b['id'] not in unsubscribed_boards or (self.check_admin_access() or self.check_builder_access()))
+            total_posts = sum(b['post_count'] for b in boards if b['id'] not in unsubscribed_boards or is_staff)
             if total_posts > 0:  # Avoid division by zero
                 capacity = (total_unread / total_posts) * 100
                 output.append(f"Total unread posts: {total_unread} ({capacity:.1f}% of all posts)")
         
         # Show unsubscribe reminder if there are unsubscribed boards
-        if unsubscribed_boards and (self.check_admin_access() or self.check_builder_access()):
+        if unsubscribed_boards and is_staff:
             output.append("Note: Some boards are hidden due to unsubscribe settings. Use +bbs/subscribe to show them again.")
         
         output.append(f"{'|b=|n'*78}")
@@ -690,7 +684,7 @@ class CmdBBS(MuxCommand):
             
         board_ref = self.args.strip()
         controller = get_or_create_bbs_controller()
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
             return
@@ -702,20 +696,20 @@ class CmdBBS(MuxCommand):
             return
             
         # Mark all posts as read
-        for i in range(len(board['posts'])):
-            controller.mark_post_read(board_ref, i, self.caller.key)
+        controller.mark_all_read(board['id'], self.caller.key)
             
         self.caller.msg(f"All posts in board '{board['name']}' have been marked as read.")
 
     def list_boards(self, controller):
         """List all available boards."""
-        boards = controller.db.boards
+        boards = controller.get_boards()
         if not boards:
             self.caller.msg("No boards available.")
             return
 
         # Get the character's unsubscribed boards list
         unsubscribed_boards = self.caller.attributes.get("unsubscribed_bbs_boards", [])
+        is_staff = self.check_admin_access() or self.check_builder_access()
 
         # Table Header
         output = []
@@ -723,22 +717,25 @@ class CmdBBS(MuxCommand):
         output.append("|w{:<3} {:<8} {:<29} {:<15} {:<10} {:<7}|n".format("ID", "Access", "Name", "Last Post", "# msgs", "Unread"))
         output.append(f"{'|b-|n'*78}")
 
-        # Sort boards by ID and convert to list of tuples
-        sorted_boards = sorted(boards.items(), key=lambda x: x[0])
+        # Unread posts for every board come from one read-mark lookup
+        unread_map = controller.get_unread_map(self.caller.key, boards)
+        formatter = TIME_MANAGER.get_formatter(self.caller)
 
-        for board_id, board in sorted_boards:
+        # Boards come sorted by ID
+        for board in boards:
+            board_id = board['id']
             # Skip boards the character doesn't have access to
             if not controller.has_access(board_id, self.caller.key):
                 # Only admins and builders can see boards they don't have access to
-                if not (self.check_admin_access() or self.check_builder_access()):
+                if not is_staff:
                     continue
                 
             # Skip unsubscribed boards unless admin/builder
-            if board_id in unsubscribed_boards and not (self.check_admin_access() or self.check_builder_access()):
+            if board_id in unsubscribed_boards and not is_staff:
                 continue
 
             # Check if user has write access, considering admin/builder status
-            has_write = controller.has_write_access(board_id, self.caller.key) or self.check_admin_access() or self.check_builder_access()
+            has_write = is_staff or controller.has_write_access(board_id, self.caller.key)
             read_only = "*" if not has_write else " "
             
             # Determine access type
@@ -751,16 +748,14 @@ class CmdBBS(MuxCommand):
             
             # Get last post time, ensuring it's a date/time string
             last_post = "No posts"
-            if board['posts']:
-                last_post = max((post['created_at'] for post in board['posts']), default="No posts")
-                if last_post != "No posts":
-                    # Only show date, not time
-                    last_post = self.format_date(last_post)
+            if board['last_post']:
+                # Only show date, not time
+                last_post = formatter.format_date(board['last_post'])
 
-            num_posts = len(board['posts'])
+            num_posts = board['post_count']
             
             # Get unread post count
-            unread_posts = controller.get_unread_posts(board_id, self.caller.key)
+            unread_posts = unread_map[board_id]
             unread_count = len(unread_posts)
             unread_display = str(unread_count) if unread_count > 0 else "-"
 
@@ -780,9 +775,9 @@ class CmdBBS(MuxCommand):
 
         self.caller.msg("\n".join(output))
 
-    def list_posts(self, controller, board_ref):
-        """List all posts in the specified board."""
-        board = controller.get_board(board_ref)
+    def list_posts(self, controller, board_ref, page=1):
+        """List one page of posts in the specified board."""
+        board = controller.get_post_page(board_ref, self.caller.key, page)
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
             return
@@ -792,9 +787,9 @@ class CmdBBS(MuxCommand):
             self.caller.msg(f"You do not have access to view posts on the board '{board['name']}'.")
             return
 
-        posts = board['posts']
-        pinned_posts = [post for post in posts if post.get('pinned', False)]
-        unpinned_posts = [post for post in posts if not post.get('pinned', False)]
+        # Remember the page for +bbs/next and +bbs/prev
+        self.caller.ndb.bbs_listing = (board['id'], board['page'])
+        formatter = TIME_MANAGER.get_formatter(self.caller)
 
         # Table Header
         output = []
@@ -819,33 +814,52 @@ class CmdBBS(MuxCommand):
         elif group_names:
             output.append("|yThis board is restricted to specific groups|n")
 
+        output.extend(self.format_post_page(board, formatter))
+        self.caller.msg("\n".join(output))
+
+    def format_post_page(self, board, formatter):
+        """
+        Format the rows and footer of one page of a board listing.
+
+        Args:
+            board (dict): Board page from get_post_page
+            formatter (TimeFormatter): Formats times for the viewer
+
+        Returns:
+            list: Output lines
+        """
+        output = []
         output.append("|w{:<5} {:<1} {:<30} {:<15} {:<15}|n".format("ID", "", "Message", "Posted", "By"))
         output.append(f"{'|b-|n'*78}")
 
-        # List pinned posts first with correct IDs
-        for i, post in enumerate(pinned_posts):
-            post_id = posts.index(post) + 1
-            formatted_time = self.format_datetime(post['created_at'])
-            is_unread = controller.is_post_unread(board['id'], post_id - 1, self.caller.key)
-            unread_flag = "|rU|n" if is_unread else " "
-            output.append(f"{board['id']}/{post_id:<5} {unread_flag:<1} [Pinned] |w{post['title']:<30}|n {formatted_time:<15} {post['author']}")
-
-        # List unpinned posts with correct IDs
-        for post in unpinned_posts:
-            post_id = posts.index(post) + 1
-            formatted_time = self.format_datetime(post['created_at'])
-            is_unread = controller.is_post_unread(board['id'], post_id - 1, self.caller.key)
-            unread_flag = "|rU|n" if is_unread else " "
-            output.append(f"{board['id']}/{post_id:<5} {unread_flag:<1} |w{post['title']:<30}|n {formatted_time:<15} {post['author']}")
+        # Pinned posts come first in the page order
+        for post in board['posts']:
+            pinned = "[Pinned] " if post['pinned'] else ""
+            unread_flag = "|rU|n" if post['unread'] else " "
+            formatted_time = formatter.format(post['created_at'])
+            output.append(f"{board['id']}/{post['number']:<5} {unread_flag:<1} {pinned}|w{post['title']:<30}|n {formatted_time:<15} {post['author']}")
 
         # Table Footer
+        output.append(f"{'|b-|n'*78}")
+        output.append(f"Page {board['page']} of {board['pages']} - {board['post_count']} posts, "
+                      f"{board['unread_count']} unread")
+        if board['pages'] > 1:
+            output.append(f"Use +bbs/next, +bbs/prev or +bbs {board['id']}/page <number> to see more.")
         output.append(f"{'|b=|n'*78}")
+        return output
 
-        self.caller.msg("\n".join(output))
+    def do_page(self, step):
+        """Handle the next and prev switches - move through the last board listed."""
+        listing = self.caller.ndb.bbs_listing
+        if not listing:
+            self.caller.msg("You are not viewing a board. Use +bbs <board> first.")
+            return
+        board_id, page = listing
+        self.list_posts(get_or_create_bbs_controller(), board_id, page + step)
 
     def read_post(self, controller, board_ref, post_number):
         """Read a specific post in a board."""
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
             return
@@ -855,12 +869,11 @@ class CmdBBS(MuxCommand):
             self.caller.msg(f"You do not have access to view posts on the board '{board['name']}'.")
             return
 
-        posts = board['posts']
-        if post_number < 1 or post_number > len(posts):
-            self.caller.msg(f"Invalid post number. Board '{board['name']}' has {len(posts)} posts.")
+        post = controller.get_post(board['id'], post_number - 1) if post_number >= 1 else None
+        if not post:
+            self.caller.msg(f"Invalid post number. Board '{board['name']}' has {board['post_count']} posts.")
             return
 
-        post = posts[post_number - 1]
         edit_info = f"(edited on {self.format_datetime(post['edited_at'])})" if post['edited_at'] else ""
         
         # Mark the post as read
@@ -900,7 +913,7 @@ class CmdBBS(MuxCommand):
         
         # Get the board
         controller = get_or_create_bbs_controller()
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
             return
@@ -954,15 +967,13 @@ class CmdBBS(MuxCommand):
             
         self.caller.msg(f"{'|b=|n'*78}")
         
-    def list_posts_as_player(self, controller, board_ref, target_player):
-        """List all posts in the specified board as if viewed by the target player."""
-        board = controller.get_board(board_ref)
+    def list_posts_as_player(self, controller, board_ref, target_player, page=1):
+        """List one page of posts in the specified board as if viewed by the target player."""
+        board = controller.get_post_page(board_ref, target_player.key, page)
         if not board:
             return
 
-        posts = board['posts']
-        pinned_posts = [post for post in posts if post.get('pinned', False)]
-        unpinned_posts = [post for post in posts if not post.get('pinned', False)]
+        formatter = TIME_MANAGER.get_formatter(target_player)
 
         # Table Header
         output = []
@@ -975,33 +986,12 @@ class CmdBBS(MuxCommand):
         elif board.get('group_names'):
             output.append("|yThis board is restricted to specific groups|n")
 
-        output.append("|w{:<5} {:<1} {:<30} {:<15} {:<15}|n".format("ID", "", "Message", "Posted", "By"))
-        output.append(f"{'|b-|n'*78}")
-
-        # List pinned posts first with correct IDs
-        for i, post in enumerate(pinned_posts):
-            post_id = posts.index(post) + 1
-            formatted_time = self.format_datetime(post['created_at'], target_player)
-            is_unread = controller.is_post_unread(board['id'], post_id - 1, target_player.key)
-            unread_flag = "|rU|n" if is_unread else " "
-            output.append(f"{board['id']}/{post_id:<5} {unread_flag:<1} [Pinned] |w{post['title']:<30}|n {formatted_time:<15} {post['author']}")
-
-        # List unpinned posts with correct IDs
-        for post in unpinned_posts:
-            post_id = posts.index(post) + 1
-            formatted_time = self.format_datetime(post['created_at'], target_player)
-            is_unread = controller.is_post_unread(board['id'], post_id - 1, target_player.key)
-            unread_flag = "|rU|n" if is_unread else " "
-            output.append(f"{board['id']}/{post_id:<5} {unread_flag:<1} |w{post['title']:<30}|n {formatted_time:<15} {post['author']}")
-
-        # Table Footer
-        output.append(f"{'|b=|n'*78}")
-
+        output.extend(self.format_post_page(board, formatter))
         self.caller.msg("\n".join(output))
 
     def list_boards_as_player(self, controller, target_player):
         """List all available boards as if viewed by the target player."""
-        boards = controller.db.boards
+        boards = controller.get_boards()
         if not boards:
             self.caller.msg("No boards available.")
             return
@@ -1013,10 +1003,13 @@ class CmdBBS(MuxCommand):
         output.append("|w{:<3} {:<8} {:<29} {:<15} {:<10} {:<7}|n".format("ID", "Access", "Name", "Last Post", "# msgs", "Unread"))
         output.append(f"{'|b-|n'*78}")
 
-        # Sort boards by ID and convert to list of tuples
-        sorted_boards = sorted(boards.items(), key=lambda x: x[0])
+        # Unread posts for every board come from one read-mark lookup
+        unread_map = controller.get_unread_map(target_player.key, boards)
+        formatter = TIME_MANAGER.get_formatter(target_player)
 
-        for board_id, board in sorted_boards:
+        # Boards come sorted by ID
+        for board in boards:
+            board_id = board['id']
             # Skip boards the character doesn't have access to
             if not controller.has_access(board_id, target_player.key):
                 continue
@@ -1035,16 +1028,14 @@ class CmdBBS(MuxCommand):
             
             # Get last post time, ensuring it's a date/time string
             last_post = "No posts"
-            if board['posts']:
-                last_post = max((post['created_at'] for post in board['posts']), default="No posts")
-                if last_post != "No posts":
-                    # Only show date, not time
-                    last_post = self.format_date(last_post, target_player)
+            if board['last_post']:
+                # Only show date, not time
+                last_post = formatter.format_date(board['last_post'])
 
-            num_posts = len(board['posts'])
+            num_posts = board['post_count']
             
             # Get unread post count
-            unread_posts = controller.get_unread_posts(board_id, target_player.key)
+            unread_posts = unread_map[board_id]
             unread_count = len(unread_posts)
             unread_display = str(unread_count) if unread_count > 0 else "-"
 
@@ -1062,33 +1053,31 @@ class CmdBBS(MuxCommand):
     def do_scan_as_player(self, target_player):
         """Handle the scan switch - show unread posts on all accessible boards as if viewed by the target player."""
         controller = get_or_create_bbs_controller()
-        boards = controller.db.boards
+        boards = controller.get_boards()
         if not boards:
             self.caller.msg("No boards available.")
             return
 
+        # Unread posts for every board come from one read-mark lookup
+        unread_map = controller.get_unread_map(target_player.key, boards)
+
         # Count total unread posts
         total_unread = 0
         unread_boards = []
 
-        # Sort boards by ID
-        sorted_boards = sorted(boards.items(), key=lambda x: x[0])
-
-        for board_id, board in sorted_boards:
-            if not controller.has_access(board_id, target_player.key):
-                continue
-
-            unread_posts = controller.get_unread_posts(board_id, target_player.key)
-            if not unread_posts:
+        # Boards come sorted by ID
+        for board in boards:
+            unread_posts = unread_map[board['id']]
+            if not unread_posts or not controller.has_access(board['id'], target_player.key):
                 continue
 
             total_unread += len(unread_posts)
-            unread_boards.append((board['name'], len(unread_posts)))
+            unread_boards.append((board, unread_posts))
 
         # If this is a login notification (no explicit command), show concise output
         if not hasattr(self, 'session') or not self.session:
             if total_unread > 0:
-                board_summary = ", ".join(f"{name}: {count}" for name, count in unread_boards)
+                board_summary = ", ".join(f"{board['name']}: {len(posts)}" for board, posts in unread_boards)
                 self.caller.msg(f"|w{target_player.key} has {total_unread} unread post{'s' if total_unread != 1 else ''} "
                               f"on the bulletin board ({board_summary}).|n")
             return
@@ -1100,14 +1089,7 @@ class CmdBBS(MuxCommand):
         output.append(f"|wUnread Postings on the Global Bulletin Board (as {target_player.key})|n")
         output.append(f"{'|b-|n'*78}")
 
-        for board_id, board in sorted_boards:
-            if not controller.has_access(board_id, target_player.key):
-                continue
-
-            unread_posts = controller.get_unread_posts(board_id, target_player.key)
-            if not unread_posts:
-                continue
-
+        for board, unread_posts in unread_boards:
             # Format unread posts numbers
             unread_str = ", ".join(str(x) for x in unread_posts)
             
@@ -1115,18 +1097,18 @@ class CmdBBS(MuxCommand):
             access_type = ""
             if board.get('group_names'):  # If board has group restrictions
                 access_type = "*"  # restricted
-            elif not controller.has_write_access(board_id, target_player.key):
+            elif not controller.has_write_access(board['id'], target_player.key):
                 access_type = "-"  # read only
 
             # Format board name with access type
             board_name = f"|w{board['name']}|n {access_type}"
             
-            output.append(f"{board_name} (#{board_id}): {len(unread_posts)} unread ({unread_str})")
+            output.append(f"{board_name} (#{board['id']}): {len(unread_posts)} unread ({unread_str})")
 
         # Add footer with capacity information
         output.append(f"{'|b-|n'*78}")
         if total_unread > 0:
-            total_posts = sum(len(b['posts']) for b in boards.values())
+            total_posts = sum(b['post_count'] for b in boards)
             if total_posts > 0:  # Avoid division by zero
                 capacity = (total_unread / total_posts) * 100
                 output.append(f"Total unread posts: {total_unread} ({capacity:.1f}% of all posts)")
@@ -1142,7 +1124,7 @@ class CmdBBS(MuxCommand):
             
         board_ref = self.args.strip()
         controller = get_or_create_bbs_controller()
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
             return
@@ -1152,14 +1134,13 @@ class CmdBBS(MuxCommand):
             return
             
         # Mark all posts as read
-        for i in range(len(board['posts'])):
-            controller.mark_post_read(board_ref, i, target_player.key)
+        controller.mark_all_read(board['id'], target_player.key)
             
         self.caller.msg(f"All posts in board '{board['name']}' have been marked as read for {target_player.key}.")
 
     def read_post_as_player(self, controller, board_ref, post_number, target_player):
         """Read a specific post in a board as if viewed by the target player."""
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
             return
@@ -1167,12 +1148,11 @@ class CmdBBS(MuxCommand):
             self.caller.msg(f"{target_player.key} does not have access to view posts on the board '{board['name']}'.")
             return
 
-        posts = board['posts']
-        if post_number < 1 or post_number > len(posts):
-            self.caller.msg(f"Invalid post number. Board '{board['name']}' has {len(posts)} posts.")
+        post = controller.get_post(board['id'], post_number - 1) if post_number >= 1 else None
+        if not post:
+            self.caller.msg(f"Invalid post number. Board '{board['name']}' has {board['post_count']} posts.")
             return
 
-        post = posts[post_number - 1]
         edit_info = f"(edited on {self.format_datetime(post['edited_at'], target_player)})" if post['edited_at'] else ""
         
         # Mark the post as read
@@ -1187,6 +1167,106 @@ class CmdBBS(MuxCommand):
         self.caller.msg(f"{post['content']}")
         self.caller.msg(f"{'|b=|n'*78}")
 
+    def do_archive(self):
+        """Handle the archive switch - list or read a board's archived posts."""
+        if not self.args:
+            self.caller.msg("Usage: +bbs/archive <board>[/page <number>] or +bbs/archive <board>/<post>")
+            return
+
+        board_ref, _, post_ref = [arg.strip() for arg in self.args.partition("/")]
+        controller = get_or_create_bbs_controller()
+        board = controller.get_board(board_ref, posts=False)
+        if not board:
+            self.caller.msg(f"No board found with the name or number '{board_ref}'.")
+            return
+        if not (controller.has_access(board['id'], self.caller.key) or
+                self.check_admin_access() or
+                self.check_builder_access()):
+            self.caller.msg(f"You do not have access to view posts on the board '{board['name']}'.")
+            return
+
+        formatter = TIME_MANAGER.get_formatter(self.caller)
+        if post_ref.isdigit():
+            post = controller.get_archived_post(board['id'], int(post_ref))
+            if not post:
+                self.caller.msg(f"No archived post {post_ref} on board '{board['name']}'.")
+                return
+            edit_info = f"(edited on {formatter.format(post['edited_at'])})" if post['edited_at'] else ""
+            output = []
+            output.append(f"{'|b=|n'*78}")
+            output.append(f"{'|y*|n' * 15} {board['name']} (Archive) {'|y*|n' * 15}")
+            output.append(f"Title: {post['title']}")
+            output.append(f"Author: {post['author']}")
+            output.append(f"Date: {formatter.format(post['created_at'])} {edit_info}")
+            output.append(f"{'-'*78}")
+            output.append(f"{post['content']}")
+            output.append(f"{'|b=|n'*78}")
+            self.caller.msg("\n".join(output))
+            return
+
+        archive = controller.get_archive_page(board['id'], parse_page(self.args) or 1)
+        if not archive['post_count']:
+            self.caller.msg(f"Board '{board['name']}' has no archived posts.")
+            return
+
+        output = []
+        output.append(f"{'|b=|n'*78}")
+        output.append(f"{'|y*|n' * 15} |w{board['name']} (Archive)|n {'|y*|n' * 15}")
+        output.append("|w{:<7} {:<30} {:<15} {:<15}|n".format("ID", "Message", "Posted", "By"))
+        output.append(f"{'|b-|n'*78}")
+        for post in archive['posts']:
+            output.append(f"{post['number']:<7} |w{post['title']:<30}|n "
+                          f"{formatter.format(post['created_at']):<15} {post['author']}")
+        output.append(f"{'|b-|n'*78}")
+        output.append(f"Page {archive['page']} of {archive['pages']} - {archive['post_count']} archived posts")
+        if archive['pages'] > 1:
+            output.append(f"Use +bbs/archive {board['id']}/page <number> to see more.")
+        output.append(f"{'|b=|n'*78}")
+        self.caller.msg("\n".join(output))
+
+    def do_search(self):
+        """Handle the search switch - find posts containing all the given terms."""
+        if not self.args:
+            self.caller.msg("Usage: +bbs/search <terms>[=<board>]")
+            return
+
+        terms, board_ref = self.args, None
+        if "=" in self.args:
+            terms, board_ref = [arg.strip() for arg in self.args.split("=", 1)]
+
+        controller = get_or_create_bbs_controller()
+        is_staff = self.check_admin_access() or self.check_builder_access()
+        if board_ref:
+            board = controller.get_board(board_ref, posts=False)
+            if not board:
+                self.caller.msg(f"No board found with the name or number '{board_ref}'.")
+                return
+            if not (is_staff or controller.has_access(board['id'], self.caller.key)):
+                self.caller.msg(f"You do not have access to view posts on the board '{board['name']}'.")
+                return
+            board_ref = board['id']
+
+        results, total = controller.search_posts(terms, self.caller.key, board_ref=board_ref,
+                                                 limit=BBS_SEARCH_LIMIT, bypass_access=is_staff)
+        if not results:
+            self.caller.msg(f"No posts found matching '{terms}'.")
+            return
+
+        formatter = TIME_MANAGER.get_formatter(self.caller)
+        output = []
+        output.append(f"{'|b=|n'*78}")
+        shown = f", showing the best {len(results)}" if total > len(results) else ""
+        output.append(f"|wSearch results for '{terms}'|n ({total} match{'es' if total != 1 else ''}{shown})")
+        output.append("|w{:<8} {:<15} {:<30} {:<10} {:<12}|n".format("ID", "Board", "Message", "Posted", "By"))
+        output.append(f"{'|b-|n'*78}")
+        for post in results:
+            post_ref = f"{post['board_id']}/{post['number']}"
+            output.append("{:<8} {:<15} |w{:<30}|n {:<10} {}".format(
+                post_ref, post['board_name'][:15], post['title'][:30],
+                formatter.format_date(post['created_at']), post['author']))
+        output.append(f"{'|b=|n'*78}")
+        self.caller.msg("\n".join(output))
+
     def do_unsubscribe(self):
         """Handle the unsubscribe switch.
         
@@ -1207,7 +1287,7 @@ class CmdBBS(MuxCommand):
         
         board_ref = self.args.strip()
         controller = get_or_create_bbs_controller()
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
@@ -1224,6 +1304,7 @@ class CmdBBS(MuxCommand):
         # Add to unsubscribed list
         unsubscribed_boards.append(board['id'])
         self.caller.attributes.add("unsubscribed_bbs_boards", unsubscribed_boards)
+        BBS_SUBSCRIBERS.refresh_subscription(self.caller, board['id'])
         
         self.caller.msg(f"You have unsubscribed from '{board['name']}'. It will no longer appear in your board listings.")
         self.caller.msg("You can re-subscribe at any time with +bbs/subscribe.")
@@ -1246,7 +1327,7 @@ class CmdBBS(MuxCommand):
         
         board_ref = self.args.strip()
         controller = get_or_create_bbs_controller()
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
@@ -1263,6 +1344,7 @@ class CmdBBS(MuxCommand):
         # Remove from unsubscribed list
         unsubscribed_boards.remove(board['id'])
         self.caller.attributes.add("unsubscribed_bbs_boards", unsubscribed_boards)
+        BBS_SUBSCRIBERS.refresh_subscription(self.caller, board['id'])
         
         self.caller.msg(f"You have re-subscribed to '{board['name']}'. It will now appear in your board listings.")
 
@@ -1308,17 +1390,18 @@ class CmdBBRead(MuxCommand):
     
     Usage:
       +bbread                   - List all available boards
-      +bbread <board>           - List all posts on a board
+      +bbread <board>           - List the first page of posts on a board
+      +bbread <board>/page <n>  - List another page of posts on a board
       +bbread <board>/<post>    - Read a specific post
     
     This command allows you to read posts on the bulletin board system.
     If used without arguments, it shows a list of all available boards.
-    When given just a board number, it shows all posts on that board.
+    When given just a board number, it shows the first page of posts on that board.
     When given a board and post number, it displays the contents of that post.
     
     Examples:
       +bbread                   - Show list of available boards
-      +bbread 1                 - Show all posts on board #1
+      +bbread 1                 - Show the first page of posts on board #1
       +bbread announcements     - Show all posts on the announcements board
       +bbread announcements/1   - Read post #1 on the announcements board
       +bbread 1/2               - Read post #2 on board #1
@@ -1343,6 +1426,13 @@ class CmdBBRead(MuxCommand):
         cmd_bbs.caller = self.caller
         controller = get_or_create_bbs_controller()
         
+        # Board listings can be paged with <board>/page <number>
+        page = parse_page(self.args)
+        if page:
+            board_ref = self.args.split("/", 1)[0].strip()
+            cmd_bbs.list_posts(controller, int(board_ref) if board_ref.isdigit() else board_ref, page)
+            return
+
         # If it doesn't contain a slash, treat as a board reference
         if "/" not in self.args:
             try:
@@ -3,8 +3,7 @@
 
 from evennia import default_cmds
 from evennia.commands.default.muxcommand import MuxCommand
-from evennia import create_object
-from typeclasses.bbs_controller import BBSController
+from world.utils.bbs_utils import get_or_create_bbs_controller
 from typeclasses.groups import Group, get_group_by_name, get_character_groups
 
 class CmdCreateBoard(MuxCommand):
@@ -56,13 +55,7 @@ class CmdCreateBoard(MuxCommand):
 
         name = name_desc.strip()
 
-        # Ensure BBSController exists
-        try:
-            controller = BBSController.objects.get(db_key="BBSController")
-        except BBSController.DoesNotExist:
-            controller = create_object(BBSController, key="BBSController")
-            controller.db.boards = {}  # Initialize with an empty boards dictionary if needed
-            self.caller.msg("BBSController created.")
+        controller = get_or_create_bbs_controller()
 
         # Create the board
         controller.create_board(name, description, public, group_names=group_names)
@@ -89,10 +82,7 @@ class CmdDeleteBoard(MuxCommand):
             return
         board_name = self.args.strip()
 
-        controller = BBSController.objects.get(db_key="BBSController")
-        if not controller:
-            self.caller.msg("BBSController not found.")
-            return
+        controller = get_or_create_bbs_controller()
 
         board = controller.get_board(board_name)
         if not board:
@@ -119,10 +109,7 @@ class CmdRevokeAccess(MuxCommand):
             return
         board_name, character_name = [arg.strip() for arg in self.args.split("=", 1)]
 
-        controller = BBSController.objects.get(db_key="BBSController")
-        if not controller:
-            self.caller.msg("BBSController not found.")
-            return
+        controller = get_or_create_bbs_controller()
 
         board = controller.get_board(board_name)
         if not board:
@@ -154,10 +141,7 @@ class CmdListAccess(MuxCommand):
             return
         board_name = self.args.strip()
 
-        controller = BBSController.objects.get(db_key="BBSController")
-        if not controller:
-            self.caller.msg("BBSController not found.")
-            return
+        controller = get_or_create_bbs_controller()
 
         board = controller.get_board(board_name)
         if not board:
@@ -217,10 +201,7 @@ class CmdLockBoard(MuxCommand):
             return
         board_name = self.args.strip()
 
-        controller = BBSController.objects.get(db_key="BBSController")
-        if not controller:
-            self.caller.msg("BBSController not found.")
-            return
+        controller = get_or_create_bbs_controller()
 
         board = controller.get_board(board_name)
         if not board:
@@ -251,10 +232,7 @@ class CmdPinPost(MuxCommand):
             return
         board_ref, post_number = [arg.strip() for arg in self.args.split("/", 1)]
 
-        controller = BBSController.objects.get(db_key="BBSController")
-        if not controller:
-            self.caller.msg("BBSController not found.")
-            return
+        controller = get_or_create_bbs_controller()
 
         # Determine if board_ref is a name or a number
         try:
@@ -262,7 +240,7 @@ class CmdPinPost(MuxCommand):
         except ValueError:
             pass
 
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
             return
@@ -272,13 +250,12 @@ class CmdPinPost(MuxCommand):
         except ValueError:
             self.caller.msg("Post number must be an integer.")
             return
-        posts = board['posts']
-        if post_number < 1 or post_number > len(posts):
-            self.caller.msg(f"Invalid post number. Board '{board['name']}' has {len(posts)} posts.")
+        if post_number < 1:
+            self.caller.msg(f"Invalid post number. Board '{board['name']}' has {board['post_count']} posts.")
             return
 
-        controller.pin_post(board['id'], post_number - 1)
-        self.caller.msg(f"Post {post_number} in board '{board['name']}' has been pinned to the top.")
+        # Post numbers can skip archived posts; the controller checks the number exists
+        self.caller.msg(controller.pin_post(board['id'], post_number - 1))
 
 
 class CmdUnpinPost(MuxCommand):
@@ -298,10 +275,7 @@ class CmdUnpinPost(MuxCommand):
             return
         board_ref, post_number = [arg.strip() for arg in self.args.split("/", 1)]
 
-        controller = BBSController.objects.get(db_key="BBSController")
-        if not controller:
-            self.caller.msg("BBSController not found.")
-            return
+        controller = get_or_create_bbs_controller()
 
         # Determine if board_ref is a name or a number
         try:
@@ -309,7 +283,7 @@ class CmdUnpinPost(MuxCommand):
         except ValueError:
             pass
 
-        board = controller.get_board(board_ref)
+        board = controller.get_board(board_ref, posts=False)
         if not board:
             self.caller.msg(f"No board found with the name or number '{board_ref}'.")
             return
@@ -319,13 +293,12 @@ class CmdUnpinPost(MuxCommand):
         except ValueError:
             self.caller.msg("Post number must be an integer.")
             return
-        posts = board['posts']
-        if post_number < 1 or post_number > len(posts):
-            self.caller.msg(f"Invalid post number. Board '{board['name']}' has {len(posts)} posts.")
+        if post_number < 1:
+            self.caller.msg(f"Invalid post number. Board '{board['name']}' has {board['post_count']} posts.")
             return
 
-        controller.unpin_post(board['id'], post_number - 1)
-        self.caller.msg(f"Post {post_number} in board '{board['name']}' has been unpinned.")
+        # Post numbers can skip archived posts; the controller checks the number exists
+        self.caller.msg(controller.unpin_post(board['id'], post_number - 1))
 
 
 class CmdEditBoard(MuxCommand):
@@ -355,10 +328,7 @@ class CmdEditBoard(MuxCommand):
         field, new_value = [arg.strip() for arg in updates.split(",", 1)]
         field = field.lower()
 
-        controller = BBSController.objects.get(db_key="BBSController")
-        if not controller:
-            self.caller.msg("BBSController not found.")
-            return
+        controller = get_or_create_bbs_controller()
 
         board = controller.get_board(board_name)
         if not board:
@@ -401,10 +371,7 @@ class CmdEditBoardGroups(MuxCommand):
 
         board_name, group_list = [arg.strip() for arg in self.args.split("=", 1)]
         
-        controller = BBSController.objects.get(db_key="BBSController")
-        if not controller:
-            self.caller.msg("BBSController not found.")
-            return
+        controller = get_or_create_bbs_controller()
 
         board = controller.get_board(board_name)
         if not board:
@@ -461,10 +428,7 @@ class CmdGrantAccess(MuxCommand):
         # Determine access level
         access_level = "read_only" if "/readonly" in options else "full_access"
 
-        controller = BBSController.objects.get(db_key="BBSController")
-        if not controller:
-            self.caller.msg("BBSController not found.")
-            return
+        controller = get_or_create_bbs_controller()
 
         board = controller.get_board(board_name)
         if not board:
@@ -493,10 +457,7 @@ class CmdAddGroup(MuxCommand):
             
         board_name, group_name = [arg.strip() for arg in self.args.split("=", 1)]
         
-        controller = BBSController.objects.get(db_key="BBSController")
-        if not controller:
-            self.caller.msg("BBSController not found.")
-            return
+        controller = get_or_create_bbs_controller()
             
         result = controller.add_group_to_board(board_name, group_name)
         self.caller.msg(result)
@@ -519,10 +480,7 @@ class CmdRemoveGroup(MuxCommand):
             
         board_name, group_name = [arg.strip() for arg in self.args.split("=", 1)]
         
-        controller = BBSController.objects.get(db_key="BBSController")
-        if not controller:
-            self.caller.msg("BBSController not found.")
-            return
+        controller = get_or_create_bbs_controller()
             
         result = controller.remove_group_from_board(board_name, group_name)
         self.caller.msg(result)
@@ -545,10 +503,7 @@ class CmdListGroups(MuxCommand):
             
         board_name = self.args.strip()
         
-        controller = BBSController.objects.get(db_key="BBSController")
-        if not controller:
-            self.caller.msg("BBSController not found.")
-            return
+        controller = get_or_create_bbs_controller()
             
         board = controller.get_board(board_name)
         if not board:
@@ -1,7 +1,7 @@
 from evennia.commands.cmdset import CmdSet
 
 
-from commands.bbs.bbs_admin_commands import CmdResetBBS
+from commands.bbs.bbs_admin_commands import CmdResetBBS, CmdMigrateBBS
 
 from commands.bbs.bbs_all_commands import (
     CmdBBS
@@ -33,4 +33,5 @@ class BBSCmdSet(CmdSet):
         self.add(CmdUnpinPost())
         self.add(CmdEditBoard())
         self.add(CmdResetBBS())
+        self.add(CmdMigrateBBS())
         self.add(CmdGrantAccess())
\ No newline at end of file
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import Mock
-from evennia import create_object
-from typeclasses.bbs_controller import BBSController
+from world.bbs.models import Board, Post
+from world.bbs.storage import BBS_STORAGE
 from commands.bbs.bbs_admin_commands import CmdResetBBS
 from commands.bbs.bbs_builder_commands import (
     CmdCreateBoard,
@@ -14,7 +14,7 @@ from commands.bbs.bbs_builder_commands import (
     CmdEditBoard,
     CmdGrantAccess
 )
-from commands.bbs.bbs_all_commands import CmdPost, CmdReadBBS, CmdEditPost, CmdDeletePost
+from commands.bbs.bbs_all_commands import CmdBBS, CmdBBPost, CmdBBRead
 
 class TestBBSAdminCommands(unittest.TestCase):
 
@@ -24,8 +24,8 @@ class TestBBSAdminCommands(unittest.TestCase):
         """
         self.caller = Mock()
         self.caller.key = "Caller"
-        BBSController.objects.filter(db_key="BBSController").delete()  # Remove any existing BBSControllers
-        self.bbs_controller = create_object(BBSController, key="BBSController")
+        BBS_STORAGE.reset()  # Remove any existing boards
+        self.bbs_controller = BBS_STORAGE
 
         if not self.bbs_controller.get_board("General"):
             self.bbs_controller.create_board("General", "General discussion board", public=True)
@@ -38,7 +38,7 @@ class TestBBSAdminCommands(unittest.TestCase):
         """
         Clean up test environment.
         """
-        BBSController.objects.filter(db_key="BBSController").delete()
+        BBS_STORAGE.reset()
 
     def test_create_board(self):
         """
@@ -166,8 +166,8 @@ class TestCmdResetBBS(unittest.TestCase):
         self.cmd = CmdResetBBS()
         self.cmd.caller = self.caller
 
-        BBSController.objects.filter(db_key="BBSController").delete()  # Ensure no BBSControllers exist
-        self.bbs_controller = create_object(BBSController, key="BBSController")
+        BBS_STORAGE.reset()  # Ensure no boards exist
+        self.bbs_controller = BBS_STORAGE
         self.bbs_controller.create_board("General", "General discussion board")
         self.bbs_controller.create_post("General", "Welcome", "Welcome to the general board!", "Author")
 
@@ -175,7 +175,7 @@ class TestCmdResetBBS(unittest.TestCase):
         """
         Clean up test environment.
         """
-        BBSController.objects.filter(db_key="BBSController").delete()
+        BBS_STORAGE.reset()
 
     def test_reset_without_confirmation(self):
         """
@@ -193,25 +193,8 @@ class TestCmdResetBBS(unittest.TestCase):
         self.caller.ndb.confirmation = "yes"
         self.cmd.func()
         self.caller.msg.assert_called_with("BBSController has been reset. All boards and posts have been deleted.")
-        self.assertEqual(self.bbs_controller.db.boards, {})
-        self.assertEqual(self.bbs_controller.db.next_board_id, 1)
-
-    def test_create_bbs_controller_if_not_exist(self):
-        """
-        Test that a new BBSController is created if it does not exist.
-        """
-        # Delete existing BBSController
-        self.bbs_controller.delete()
-        self.bbs_controller = None
-
-        self.caller.ndb.confirmation = "yes"
-        self.cmd.func()
-        self.caller.msg.assert_any_call("BBSController created.")
-        self.caller.msg.assert_any_call("BBSController has been reset. All boards and posts have been deleted.")
-        new_controller = BBSController.objects.get(db_key="BBSController")
-        self.assertIsNotNone(new_controller)
-        self.assertEqual(new_controller.db.boards, {})
-        self.assertEqual(new_controller.db.next_board_id, 1)
+        self.assertEqual(self.bbs_controller.get_boards(), [])
+        self.assertFalse(Board.objects.exists())
 
 
 class TestBBSAllCommands(unittest.TestCase):
@@ -223,9 +206,10 @@ class TestBBSAllCommands(unittest.TestCase):
         self.caller = Mock()
         self.caller.key = "Caller"
         self.caller.permissions = ["Player"]  # Basic permissions
+        self.caller.locks.check_lockstring.return_value = False  # Not staff
 
-        BBSController.objects.filter(db_key="BBSController").delete()  # Remove any existing BBSControllers
-        self.bbs_controller = create_object(BBSController, key="BBSController")
+        BBS_STORAGE.reset()  # Remove any existing boards
+        self.bbs_controller = BBS_STORAGE
         self.bbs_controller.create_board("General", "General discussion board", public=True)
         self.bbs_controller.create_board("PrivateBoard", "Private discussion board", public=False)
         self.bbs_controller.grant_access("PrivateBoard", "Caller", "full_access")
@@ -236,13 +220,13 @@ class TestBBSAllCommands(unittest.TestCase):
         """
         Clean up test environment.
         """
-        BBSController.objects.filter(db_key="BBSController").delete()
+        BBS_STORAGE.reset()
 
     def test_cmd_post(self):
         """
         Test posting a message on a board.
         """
-        cmd = CmdPost()
+        cmd = CmdBBPost()
         cmd.caller = self.caller
         cmd.args = "General/Welcome = Welcome to the general board!"
         cmd.func()
@@ -256,7 +240,7 @@ class TestBBSAllCommands(unittest.TestCase):
         """
         Test reading a specific post in a board.
         """
-        cmd = CmdReadBBS()
+        cmd = CmdBBRead()
         cmd.caller = self.caller
         cmd.args = "1/1"
         cmd.func()
@@ -268,11 +252,12 @@ class TestBBSAllCommands(unittest.TestCase):
         """
         self.bbs_controller.create_post("General", "To Delete", "This post will be deleted.", "Caller")
         self.caller.is_superuser = False
-        cmd = CmdDeletePost()
+        cmd = CmdBBS()
         cmd.caller = self.caller
+        cmd.switches = ["delete"]
         cmd.args = "General/3"  # Adjust to target the correct post index
         cmd.func()
-        self.caller.msg.assert_called_with("Author: Post 3 has been deleted from board 'General'.")
+        self.caller.msg.assert_called_with("Post 3 has been deleted from board 'General'.")
         posts = self.bbs_controller.get_posts("General")
         self.assertEqual(len(posts), 2)
 
@@ -284,7 +269,7 @@ class TestBBSAllCommands(unittest.TestCase):
         self.caller.key = "AnotherUser"
         self.caller.permissions = ["Player"]  # No special permissions
 
-        cmd = CmdPost()
+        cmd = CmdBBPost()
         cmd.caller = self.caller
         cmd.args = "PrivateBoard/Test = Trying to post without access"
         cmd.func()
@@ -301,8 +286,9 @@ class TestBBSAllCommands(unittest.TestCase):
         self.caller.is_superuser = False
         self.caller.permissions = ["Player"]
 
-        cmd = CmdEditPost()
+        cmd = CmdBBS()
         cmd.caller = self.caller
+        cmd.switches = ["edit"]
         cmd.args = "General/1 = Trying to edit without permission"
         cmd.func()
         self.caller.msg.assert_called_with("You do not have permission to edit this post.")
@@ -321,13 +307,92 @@ class TestBBSAllCommands(unittest.TestCase):
         posts = self.bbs_controller.get_posts("General")
         self.assertEqual(len(posts), 2)  # Ensure test was setup correctly
 
-        cmd = CmdDeletePost()
+        cmd = CmdBBS()
         cmd.caller = self.caller
+        cmd.switches = ["delete"]
         cmd.args = "General/1"
         cmd.func()
         self.caller.msg.assert_called_with("You do not have permission to delete this post.")
         posts = self.bbs_controller.get_posts("General")
         self.assertEqual(len(posts), 2)  # Ensure the post was not deleted
 
+    def test_post_page(self):
+        """
+        Test paging a board listing with a pinned post.
+        """
+        for number in range(3, 6):
+            self.bbs_controller.create_post("General", f"Post {number}", "Filler.", "Author")
+        self.bbs_controller.pin_post("General", 3)  # Post 4
+        self.bbs_controller.mark_post_read("General", 0, "Caller")
+
+        page = self.bbs_controller.get_post_page("General", "Caller", page=1, page_size=2)
+        self.assertEqual([post['number'] for post in page['posts']], [4, 1])
+        self.assertEqual([post['unread'] for post in page['posts']], [True, False])
+        self.assertEqual((page['post_count'], page['unread_count'], page['pages']), (5, 4, 3))
+
+        page = self.bbs_controller.get_post_page("General", "Caller", page=9, page_size=2)
+        self.assertEqual(page['page'], 3)
+        self.assertEqual([post['number'] for post in page['posts']], [5])
+
+    def test_archive_expired(self):
+        """
+        Test moving posts past a board's retention into its archive.
+        """
+        for number in range(3, 6):
+            self.bbs_controller.create_post("General", f"Post {number}", "Filler.", "Author")
+        self.bbs_controller.pin_post("General", 0)  # Pinned posts are kept
+        self.bbs_controller.mark_post_read("General", 2, "Caller")
+        self.bbs_controller.set_retention("General", max_posts=2)
+
+        self.assertEqual(self.bbs_controller.archive_expired(batch_size=1), 1)
+        self.assertEqual(self.bbs_controller.archive_expired(), 1)
+        self.assertEqual(self.bbs_controller.archive_expired(), 0)
+
+        # Posts left behind keep their numbers
+        posts = self.bbs_controller.get_posts("General")
+        self.assertEqual([(post['number'], post['title']) for post in posts],
+                         [(1, "Welcome"), (4, "Post 4"), (5, "Post 5")])
+        self.assertEqual(self.bbs_controller.get_post("General", 3)['title'], "Post 4")
+        self.assertEqual(self.bbs_controller.get_unread_posts("General", "Caller"), [1, 4, 5])
+
+        # Reading across the gap moves the watermark past it
+        self.bbs_controller.mark_post_read("General", 0, "Caller")
+        self.assertEqual(self.bbs_controller.get_unread_posts("General", "Caller"), [4, 5])
+        page = self.bbs_controller.get_post_page("General", "Caller")
+        self.assertEqual(page['unread_count'], 2)
+        self.assertEqual(self.bbs_controller.create_post("General", "Post 6", "Filler.", "Author"), 6)
+
+        archive = self.bbs_controller.get_archive_page("General")
+        self.assertEqual([post['title'] for post in archive['posts']], ["Second Post", "Post 3"])
+        post = self.bbs_controller.get_archived_post("General", 1)
+        self.assertEqual(post['content'], "This is the second post.")
+
+        # Archiving the newest posts doesn't free their numbers for reuse
+        self.bbs_controller.mark_all_read("General", "Caller")
+        self.bbs_controller.set_retention("General", max_posts=0, max_days=1)
+        Post.objects.filter(board__name="General").update(created_at=0)
+        self.bbs_controller.archive_expired()
+        self.assertEqual(self.bbs_controller.create_post("General", "Post 7", "Filler.", "Author"), 7)
+        self.assertEqual(self.bbs_controller.get_unread_posts("General", "Caller"), [7])
+
+    def test_search_posts(self):
+        """
+        Test searching posts, including edits and board access.
+        """
+        self.bbs_controller.create_post("PrivateBoard", "Secret", "The second secret plan.", "Author")
+        self.bbs_controller.edit_post("General", 0, "Welcome, everyone, to the board!")
+
+        results, total = self.bbs_controller.search_posts("second", "Caller")
+        self.assertEqual(total, 2)
+        self.assertEqual(results[0]['title'], "Second Post")  # Title match ranks first
+
+        results, total = self.bbs_controller.search_posts("everyone board", "Caller")
+        self.assertEqual([post['number'] for post in results], [1])
+        self.assertEqual(self.bbs_controller.search_posts("general", "Caller")[1], 0)
+
+        # Boards the searcher can't read are left out
+        results, total = self.bbs_controller.search_posts("second", "AnotherUser")
+        self.assertEqual([post['board_name'] for post in results], ["General"])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,53 @@
+from evennia.commands.default.muxcommand import MuxCommand
+from world.utils.permission_utils import check_staff_permission, format_permission_error
+
+
+class CmdApprove(MuxCommand):
+    """
+    Approve or unapprove a character.
+
+    Usage:
+      +approve <character>
+      +unapprove <character>
+
+    Approved characters can't change their own stats and are counted
+    on +census. Unapproved characters can edit their own stats again.
+
+    Examples:
+      +approve Paul
+      +unapprove Paul
+    """
+
+    key = "+approve"
+    aliases = ["+unapprove", "approve", "unapprove"]
+    locks = "cmd:perm(Builder)"
+    help_category = "Chargen & Character Info"
+
+    def func(self):
+        caller = self.caller
+        if not check_staff_permission(caller):
+            caller.msg(format_permission_error("Builder"))
+            return
+
+        approve = "unapprove" not in self.cmdstring.lower()
+        if not self.args:
+            caller.msg(f"Usage: {'+approve' if approve else '+unapprove'} <character>")
+            return
+
+        target = caller.search(self.args.strip(), global_search=True,
+                               typeclass="typeclasses.characters.Character")
+        if not target:
+            return
+
+        if bool(target.db.approved) == approve:
+            caller.msg(f"{target.name} is already {'approved' if approve else 'unapproved'}.")
+            return
+
+        # set_approved keeps the +census counters current
+        target.set_approved(approve)
+        if approve:
+            caller.msg(f"|g{target.name} has been approved.|n")
+            target.msg(f"|gYour character has been approved by {caller.name}.|n")
+        else:
+            caller.msg(f"|y{target.name} has been unapproved.|n")
+            target.msg(f"|yYour character has been unapproved by {caller.name}.|n")
@@ -3,7 +3,7 @@ from evennia.commands.default.muxcommand import MuxCommand
 from evennia.utils import ansi
 from commands.commonmux.CmdPose import PoseBreakMixin
 from utils.text import process_special_characters
-import re
+from utils.speech import group_by_comprehension, fan_out, compile_pose, PoseTemplate, NOT_UNDERSTANDS
 
 class CmdEmit(PoseBreakMixin, MuxCommand):
     """
@@ -56,85 +56,37 @@ class CmdEmit(PoseBreakMixin, MuxCommand):
                 return
 
         # Filter receivers based on reality layers
-        filtered_receivers = []
-        for obj in caller.location.contents:
-            if not obj.has_account:
-                continue
-            
-            # Check reality layer tags
-            caller_in_umbra = caller.tags.get("in_umbra", category="state")
-            caller_in_material = caller.tags.get("in_material", category="state")
-            caller_in_dreaming = caller.tags.get("in_dreaming", category="state")
-            
-            obj_in_umbra = obj.tags.get("in_umbra", category="state")
-            obj_in_material = obj.tags.get("in_material", category="state")
-            obj_in_dreaming = obj.tags.get("in_dreaming", category="state")
-            
-            # Check if they share the same reality layer
-            # If neither has any tags, assume they're both in normal reality
-            if (caller_in_umbra and obj_in_umbra) or \
-               (caller_in_material and obj_in_material) or \
-               (caller_in_dreaming and obj_in_dreaming) or \
-               (not any([caller_in_umbra, caller_in_material, caller_in_dreaming]) and 
-                not any([obj_in_umbra, obj_in_material, obj_in_dreaming])):
-                filtered_receivers.append(obj)
+        filtered_receivers = self.get_audience()
 
         # Send pose break before the message
         self.send_pose_break()
 
+        speaking_language = caller.get_speaking_language()
+
         if 'language' in self.switches:
             # The entire emit is in the set language
-            speaking_language = caller.get_speaking_language()
-            _, msg_understand, msg_not_understand, _ = caller.prepare_say(processed_args, language_only=True, skip_english=True)
-
-            for receiver in filtered_receivers:
-                has_universal = any(
-                    merit.lower().replace(' ', '') == 'universallanguage'
-                    for category in receiver.db.stats.get('merits', {}).values()
-                    for merit in category.keys()
-                )
-                
-                if receiver == caller or has_universal or speaking_language in receiver.get_languages():
-                    receiver.msg(msg_understand)
-                else:
-                    receiver.msg(msg_not_understand)
+            template = PoseTemplate.from_speech(processed_args)
+            quote = False
         else:
             # Handle mixed language content
+            template = compile_pose(processed_args)
+            quote = True
+
+        if template.has_speech:
+            groups = group_by_comprehension(caller, filtered_receivers, speaking_language,
+                                            per_viewer_names=False)
+            fan_out(groups, lambda bucket, viewer: template.render(
+                bucket != NOT_UNDERSTANDS, speaking_language, quote=quote))
+        else:
+            # No language-tagged content, send as is
             for receiver in filtered_receivers:
-                if "~" in processed_args:
-                    parts = []
-                    current_pos = 0
-                    for match in re.finditer(r'"~([^"]+)"', processed_args):
-                        # Add text before the speech
-                        parts.append(processed_args[current_pos:match.start()])
-                        
-                        # Process the speech
-                        speech = match.group(1)
-                        _, msg_understand, msg_not_understand, _ = caller.prepare_say(speech, language_only=True, skip_english=True)
-                        
-                        # Check for Universal Language merit
-                        has_universal = any(
-                            merit.lower().replace(' ', '') == 'universallanguage'
-                            for category in receiver.db.stats.get('merits', {}).values()
-                            for merit in category.keys()
-                        )
-                        
-                        speaking_language = caller.get_speaking_language()
-                        if receiver == caller or has_universal or (speaking_language and speaking_language in receiver.get_languages()):
-                            parts.append(f'"{msg_understand}"')
-                        else:
-                            parts.append(f'"{msg_not_understand}"')
-                        
-                        current_pos = match.end()
-                    
-                    # Add any remaining text
-                    parts.append(processed_args[current_pos:])
-                    
-                    # Send the final message
-                    receiver.msg(''.join(parts))
-                else:
-                    # No language-tagged content, send as is
-                    receiver.msg(processed_args)
+                receiver.msg(processed_args)
 
         # Record scene activity
-        caller.record_scene_activity()
+        if template.has_speech:
+            caller.record_scene_activity(
+                template.render(True, speaking_language, quote=quote), kind="emit",
+                language=speaking_language,
+                hidden_message=template.render(False, speaking_language, quote=quote))
+        else:
+            caller.record_scene_activity(processed_args, kind="emit")
@@ -1,9 +1,9 @@
 from evennia.commands.default.muxcommand import MuxCommand
 from evennia.utils.search import search_object
 from evennia.utils import utils
-from evennia import SESSION_HANDLER
 from utils.search_helpers import search_character
 from world.utils.formatting import header, footer, divider
+from world.utils.session_activity import SESSION_ACTIVITY
 from evennia.utils.ansi import strip_ansi, ANSIString
 import time
 
@@ -130,21 +130,12 @@ class CmdFinger(MuxCommand):
     
     def get_session_info(self, target):
         """Get session information for a character."""
-        # Get all sessions and find the one for this character
-        all_sessions = SESSION_HANDLER.get_sessions()
-        
-        target_session = None
-        for session in all_sessions:
-            if session.logged_in and session.get_puppet() == target:
-                target_session = session
-                break
-        
-        if not target_session:
+        if not SESSION_ACTIVITY.is_online(target):
             return None, None, False
         
         # Calculate connection time and idle time
-        delta_conn = time.time() - target_session.conn_time
-        delta_idle = time.time() - target_session.cmd_last_visible
+        delta_conn = SESSION_ACTIVITY.get_connected_seconds(target)
+        delta_idle = SESSION_ACTIVITY.get_idle_seconds(target)
         
         on_time = utils.time_format(delta_conn, 0)
         idle_time = utils.time_format(delta_idle, 1)
@@ -94,7 +94,7 @@ class CmdLanguage(MuxCommand):
                 languages.append(proper_language)
             
             # Update the character's languages
-            self.caller.db.languages = languages
+            self.caller.set_languages(languages)
             
             self.caller.msg(f"You have set {proper_language} as your native language.")
             if old_native != "The Truth" and old_native != proper_language:
@@ -164,18 +164,8 @@ class CmdLanguage(MuxCommand):
         ])
 
         # Merit points section
-        merits = self.caller.db.stats.get('merits', {})
-        language_merit_points = 0
+        language_merit_points = self.caller.get_language_profile().points
         native_language = self.caller.db.native_language or "The Truth"  # Default to The Truth if not set
-        
-        # Calculate total available language points from Language merit (1-5 dots)
-        for category in merits:
-            category_merits = merits[category]
-            for merit_name, merit_data in category_merits.items():
-                if merit_name.lower() == 'language':
-                    # Language merit: each dot gives 1 language point
-                    dots = merit_data.get('perm', 0)
-                    language_merit_points += dots
 
         if language_merit_points > 0:
             # Calculate used languages, excluding The Truth and native language
@@ -242,17 +232,7 @@ class CmdLanguage(MuxCommand):
             used_languages -= 1  # Native language is free
 
         # Check if they have enough points
-        merits = self.caller.db.stats.get('merits', {})
-        language_merit_points = 0
-
-        # Calculate total available language points from Language merit (1-5 dots)
-        for category in merits:
-            category_merits = merits[category]
-            for merit_name, merit_data in category_merits.items():
-                if merit_name.lower() == 'language':
-                    # Language merit: each dot gives 1 language point
-                    dots = merit_data.get('perm', 0)
-                    language_merit_points += dots
+        language_merit_points = self.caller.get_language_profile().points
 
         if used_languages >= language_merit_points:
             self.caller.msg("You don't have enough language points remaining.")
@@ -260,7 +240,7 @@ class CmdLanguage(MuxCommand):
 
         # Add the language
         languages.append(language)
-        self.caller.db.languages = languages
+        self.caller.set_languages(languages)
         
         # Calculate points used for display
         points_used = used_languages + 1  # +1 for the new language
@@ -323,7 +303,7 @@ class CmdLanguage(MuxCommand):
             return
             
         # Set the languages
-        target.db.languages = new_languages
+        target.set_languages(new_languages)
         
         self.caller.msg(f"Set {target.name}'s languages to: {', '.join(new_languages)}")
         target.msg(f"Your known languages have been set to: {', '.join(new_languages)}")
@@ -440,11 +420,12 @@ class CmdLanguage(MuxCommand):
             if lang_key.lower() == language.lower():
                 if proper_lang in current_languages:
                     current_languages.remove(proper_lang)
-                    target.db.languages = current_languages
+                    target.set_languages(current_languages)
                     
                     # If they were speaking the removed language, reset to The Truth
                     if target.get_speaking_language() == proper_lang:
                         target.db.speaking_language = "The Truth"
+                        target.clear_language_profile()
                         target.msg(f"Your speaking language has been reset to The Truth.")
                     
                     # Notify both staff and target
@@ -523,18 +504,8 @@ class CmdLanguage(MuxCommand):
         ])
 
         # Merit points section
-        merits = target.db.stats.get('merits', {})
-        language_merit_points = 0
+        language_merit_points = target.get_language_profile().points
         native_language = target.db.native_language or "The Truth"  # Default to The Truth if not set
-        
-        # Calculate total available language points from Language merit (1-5 dots)
-        for category in merits:
-            category_merits = merits[category]
-            for merit_name, merit_data in category_merits.items():
-                if merit_name.lower() == 'language':
-                    # Language merit: each dot gives 1 language point
-                    dots = merit_data.get('perm', 0)
-                    language_merit_points += dots
 
         if language_merit_points > 0:
             # Calculate used languages, excluding The Truth and native language
@@ -574,17 +545,7 @@ class CmdLanguage(MuxCommand):
         native_language = target.db.native_language or "The Truth"
         
         # Calculate available points
-        merits = target.db.stats.get('merits', {})
-        language_merit_points = 0
-        
-        # Calculate total available language points from Language merit (1-5 dots)
-        for category in merits:
-            category_merits = merits[category]
-            for merit_name, merit_data in category_merits.items():
-                if merit_name.lower() == 'language':
-                    # Language merit: each dot gives 1 language point
-                    dots = merit_data.get('perm', 0)
-                    language_merit_points += dots
+        language_merit_points = target.get_language_profile().points
         
         # Calculate how many languages we can keep
         # Always keep The Truth and native language
@@ -613,7 +574,7 @@ class CmdLanguage(MuxCommand):
         
         if languages_removed:
             # Update the character's languages
-            target.db.languages = final_languages
+            target.set_languages(final_languages)
             target.msg(f"Removed {', '.join(languages_removed)} to stay within language point limits.")
             return True
         
@@ -131,6 +131,8 @@ class CmdPlace(MuxCommand):
             'creator': caller.id,
             'created_at': caller.location.db.places.get('_timestamp', 0)
         }
+        if hasattr(location, 'invalidate_appearance'):
+            location.invalidate_appearance()
 
         caller.msg(f"|gCreated place:|n {place_name}")
         if description:
@@ -363,6 +365,8 @@ class CmdPlace(MuxCommand):
 
         # Delete the place
         del location.db.places[place_name]
+        if hasattr(location, 'invalidate_appearance'):
+            location.invalidate_appearance()
         caller.msg(f"|gDeleted place:|n {place_name}")
 
         # Announce to room
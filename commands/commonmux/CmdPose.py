@@ -1,12 +1,40 @@
 from evennia import default_cmds
 from evennia.commands.default.muxcommand import MuxCommand
-import re
 from utils.text import process_special_characters
+from utils.speech import group_by_comprehension, fan_out, compile_pose, NOT_UNDERSTANDS
 
 class PoseBreakMixin:
     """
     A mixin to add pose breaks before commands.
     """
+    def get_audience(self, all_layers=False):
+        """
+        Get the puppeted characters who can hear the caller.
+
+        Uses the room's listener index when available and falls back
+        to scanning the location's contents otherwise.
+
+        Args:
+            all_layers (bool): If True, ignore reality layers and return
+                every puppeted character in the location.
+
+        Returns:
+            list: Characters in the caller's location
+        """
+        caller = self.caller
+        location = caller.location
+        if not location:
+            return []
+        if hasattr(location, 'get_listeners'):
+            return location.get_listeners(None if all_layers else caller)
+
+        from typeclasses.rooms import get_reality_layers
+        listeners = [obj for obj in location.contents if obj.has_account]
+        if all_layers:
+            return listeners
+        caller_layers = set(get_reality_layers(caller))
+        return [obj for obj in listeners if caller_layers.intersection(get_reality_layers(obj))]
+
     def send_pose_break(self, exclude=None):
         caller = self.caller
         
@@ -19,28 +47,7 @@ class PoseBreakMixin:
         pose_break = f"\n|y{'=' * 30}> |w{caller.name}|n |y<{'=' * 30}|n"
         
         # Filter receivers based on reality layers
-        filtered_receivers = []
-        for obj in caller.location.contents:
-            if not obj.has_account:
-                continue
-            
-            # Check reality layer tags
-            caller_in_umbra = caller.tags.get("in_umbra", category="state")
-            caller_in_material = caller.tags.get("in_material", category="state")
-            caller_in_dreaming = caller.tags.get("in_dreaming", category="state")
-            
-            obj_in_umbra = obj.tags.get("in_umbra", category="state")
-            obj_in_material = obj.tags.get("in_material", category="state")
-            obj_in_dreaming = obj.tags.get("in_dreaming", category="state")
-            
-            # Check if they share the same reality layer
-            # If neither has any tags, assume they're both in normal reality
-            if (caller_in_umbra and obj_in_umbra) or \
-               (caller_in_material and obj_in_material) or \
-               (caller_in_dreaming and obj_in_dreaming) or \
-               (not any([caller_in_umbra, caller_in_material, caller_in_dreaming]) and 
-                not any([obj_in_umbra, obj_in_material, obj_in_dreaming])):
-                filtered_receivers.append(obj)
+        filtered_receivers = self.get_audience()
         
         for receiver in filtered_receivers:
             if receiver != caller and (not exclude or receiver not in exclude):
@@ -133,66 +140,26 @@ class CmdPose(PoseBreakMixin, MuxCommand):
         speaking_language = caller.get_speaking_language()
 
         # Filter receivers based on reality layers
-        filtered_receivers = []
-        for obj in caller.location.contents:
-            if not obj.has_account:
-                continue
-            
-            # Check reality layer tags
-            caller_in_umbra = caller.tags.get("in_umbra", category="state")
-            caller_in_material = caller.tags.get("in_material", category="state")
-            caller_in_dreaming = caller.tags.get("in_dreaming", category="state")
-            
-            obj_in_umbra = obj.tags.get("in_umbra", category="state")
-            obj_in_material = obj.tags.get("in_material", category="state")
-            obj_in_dreaming = obj.tags.get("in_dreaming", category="state")
-            
-            # Check if they share the same reality layer
-            # If neither has any tags, assume they're both in normal reality
-            if (caller_in_umbra and obj_in_umbra) or \
-               (caller_in_material and obj_in_material) or \
-               (caller_in_dreaming and obj_in_dreaming) or \
-               (not any([caller_in_umbra, caller_in_material, caller_in_dreaming]) and 
-                not any([obj_in_umbra, obj_in_material, obj_in_dreaming])):
-                filtered_receivers.append(obj)
-
-        # Process the pose for each receiver
-        for receiver in filtered_receivers:
-            # If there's language-tagged speech in the pose, process it
-            if "~" in processed_args:
-                parts = []
-                current_pos = 0
-                for match in re.finditer(r'"~([^"]+)"', processed_args):
-                    # Add text before the speech
-                    parts.append(processed_args[current_pos:match.start()])
-                    
-                    # Process the speech
-                    speech = match.group(1)
-                    _, msg_understand, msg_not_understand, _ = caller.prepare_say(speech, language_only=True, skip_english=True)
-                    
-                    # Check for Universal Language merit
-                    has_universal = any(
-                        merit.lower().replace(' ', '') == 'universallinguist'
-                        for category in receiver.db.stats.get('merits', {}).values()
-                        for merit in category.keys()
-                    )
-                    
-                    if receiver == caller or has_universal or (speaking_language and speaking_language in receiver.get_languages()):
-                        parts.append(f'"{msg_understand}"')
-                    else:
-                        parts.append(f'"{msg_not_understand}"')
-                    
-                    current_pos = match.end()
-                
-                # Add any remaining text
-                parts.append(processed_args[current_pos:])
-                
-                # Construct final message
-                final_message = f"{poser_name} {''.join(parts)}"
-                receiver.msg(final_message)
-            else:
-                # No language-tagged speech, send normal pose
-                receiver.msg(f"{poser_name} {processed_args}")
+        filtered_receivers = self.get_audience()
+
+        # Compile the pose once, then render it once per comprehension group
+        template = compile_pose(processed_args)
+        if template.has_speech:
+            groups = group_by_comprehension(caller, filtered_receivers, speaking_language,
+                                            per_viewer_names=False)
+            fan_out(groups, lambda bucket, viewer: (
+                f"{poser_name} {template.render(bucket != NOT_UNDERSTANDS, speaking_language)}"))
+        else:
+            # No language-tagged speech, send normal pose
+            message = f"{poser_name} {processed_args}"
+            for receiver in filtered_receivers:
+                receiver.msg(message)
 
         # Record scene activity
-        caller.record_scene_activity()
+        if template.has_speech:
+            caller.record_scene_activity(
+                f"{poser_name} {template.render(True, speaking_language)}", kind="pose",
+                language=speaking_language,
+                hidden_message=f"{poser_name} {template.render(False, speaking_language)}")
+        else:
+            caller.record_scene_activity(f"{poser_name} {processed_args}", kind="pose")
@@ -1,6 +1,7 @@
 from evennia.commands.default.muxcommand import MuxCommand
 from commands.commonmux.CmdPose import PoseBreakMixin
 from utils.text import process_special_characters
+from utils.speech import group_by_comprehension, fan_out, SPEAKER, UNDERSTANDS
 
 class CmdSay(PoseBreakMixin, MuxCommand):
     """
@@ -54,58 +55,26 @@ class CmdSay(PoseBreakMixin, MuxCommand):
         # Send pose break before the message
         self.send_pose_break()
 
-        # Prepare the say messages
-        msg_self, msg_understand, msg_not_understand, language = caller.prepare_say(speech)
+        # Determine the language being spoken
+        language = caller.prepare_say(speech, language_only=True)[3]
 
         # Filter receivers based on reality layers
-        filtered_receivers = []
-        for obj in caller.location.contents:
-            if not obj.has_account:
-                continue
-            
-            # Check reality layer tags
-            caller_in_umbra = caller.tags.get("in_umbra", category="state")
-            caller_in_material = caller.tags.get("in_material", category="state")
-            caller_in_dreaming = caller.tags.get("in_dreaming", category="state")
-            
-            obj_in_umbra = obj.tags.get("in_umbra", category="state")
-            obj_in_material = obj.tags.get("in_material", category="state")
-            obj_in_dreaming = obj.tags.get("in_dreaming", category="state")
-            
-            # Check if they share the same reality layer
-            # If neither has any tags, assume they're both in normal reality
-            if (caller_in_umbra and obj_in_umbra) or \
-               (caller_in_material and obj_in_material) or \
-               (caller_in_dreaming and obj_in_dreaming) or \
-               (not any([caller_in_umbra, caller_in_material, caller_in_dreaming]) and 
-                not any([obj_in_umbra, obj_in_material, obj_in_dreaming])):
-                filtered_receivers.append(obj)
-
-        # Send messages to receivers
-        for receiver in filtered_receivers:
-            if receiver != caller:
-                # Check for Universal Language merit
-                has_universal = any(
-                    merit.lower().replace(' ', '') == 'universallanguage'
-                    for category in receiver.db.stats.get('merits', {}).values()
-                    for merit in category.keys()
-                )
-
-                # Get the languages the receiver knows
-                receiver_languages = receiver.get_languages()
-
-                # If they have Universal Language, know the language, or it's not a language-tagged message
-                if has_universal or not language or (language and language in receiver_languages):
-                    _, msg_understand, _, _ = caller.prepare_say(speech, viewer=receiver, skip_english=True)
-                    receiver.msg(msg_understand)
-                else:
-                    _, _, msg_not_understand, _ = caller.prepare_say(speech, viewer=receiver, skip_english=True)
-                    receiver.msg(msg_not_understand)
-            else:
-                # The speaker always understands their own speech
-                msg_self, _, _, _ = caller.prepare_say(speech, viewer=receiver, skip_english=True)
-                receiver.msg(msg_self)
+        filtered_receivers = self.get_audience()
+
+        # Render each comprehension group once and fan out
+        groups = group_by_comprehension(caller, filtered_receivers, language)
+
+        def render(bucket, viewer):
+            msg_self, msg_understand, msg_not_understand, _ = caller.prepare_say(
+                speech, viewer=viewer, skip_english=True)
+            if bucket == SPEAKER:
+                return msg_self
+            return msg_understand if bucket == UNDERSTANDS else msg_not_understand
+
+        fan_out(groups, render)
 
         # Record scene activity
-        caller.record_scene_activity()
+        _, msg_understand, msg_not_understand, _ = caller.prepare_say(speech, skip_english=True)
+        caller.record_scene_activity(msg_understand, kind="say", language=language,
+                                     hidden_message=msg_not_understand)
 
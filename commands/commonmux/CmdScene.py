@@ -0,0 +1,127 @@
+from evennia.commands.default.muxcommand import MuxCommand
+from world.utils.formatting import header, footer, divider
+from world.utils.time_utils import TIME_MANAGER
+from world.scenes.logger import SCENE_LOGGER
+
+# Log entries shown per page of +scene/log
+SCENE_LOG_PAGE_SIZE = 30
+
+
+class CmdScene(MuxCommand):
+    """
+    View logs of scenes played in a room.
+
+    Usage:
+      +scene/list                 - List recent scenes logged in this room
+      +scene/log                  - Show the current scene in this room
+      +scene/log <#>              - Show a logged scene
+      +scene/log <#>=<page>       - Show a page of a logged scene
+
+    Poses, says and emits are logged automatically. A scene ends after an
+    hour without activity in the room; the next line starts a new scene.
+    Table talk is private to the table and is not logged. Speech in a
+    language you don't know is shown as it was heard by those who don't.
+    You can read scenes you took part in. Staff can read any scene.
+    """
+
+    key = "+scene"
+    aliases = ["scene"]
+    locks = "cmd:all()"
+    help_category = "RP Commands"
+
+    def func(self):
+        """Execute the command."""
+        if "list" in self.switches:
+            self.list_scenes()
+        elif "log" in self.switches:
+            self.show_log()
+        else:
+            self.caller.msg("Usage: +scene/list or +scene/log [<#>[=<page>]]")
+
+    def is_staff(self):
+        return self.caller.check_permstring("Builder")
+
+    def can_read(self, scene):
+        """Check whether the caller may read a scene."""
+        return self.is_staff() or self.caller.key in scene.get_participants()
+
+    def list_scenes(self):
+        """List the most recent scenes in the caller's room."""
+        from world.scenes.models import SceneLog
+
+        location = self.caller.location
+        if not location:
+            self.caller.msg("You are not in a room.")
+            return
+
+        SCENE_LOGGER.flush(location.id)
+        scenes = SceneLog.objects.filter(room_id=location.id)[:20]
+        if not scenes:
+            self.caller.msg("No scenes have been logged here.")
+            return
+
+        formatter = TIME_MANAGER.get_formatter(self.caller)
+        lines = [header(f"Scenes in {location.key}", width=78)]
+        lines.append("|w  #      Started            Lines  Participants|n")
+        lines.append(divider(width=78))
+        for scene in scenes:
+            started = formatter.format(scene.started_at, "%Y-%m-%d %H:%M")
+            participants = ", ".join(scene.get_participants())
+            if len(participants) > 40:
+                participants = participants[:37] + "..."
+            lines.append(f"  {scene.id:<6} {started:<18} {scene.entry_count:>5}  {participants}")
+        lines.append(footer(width=78))
+        self.caller.msg("\n".join(lines))
+
+    def show_log(self):
+        """Show one page of a scene log."""
+        from world.scenes.models import SceneLog
+
+        page = 1
+        scene_arg = self.lhs.strip() if self.args else ""
+        if self.rhs:
+            try:
+                page = max(1, int(self.rhs.strip()))
+            except ValueError:
+                self.caller.msg("Page must be a number.")
+                return
+
+        if scene_arg:
+            try:
+                scene = SceneLog.objects.get(id=int(scene_arg.lstrip("#")))
+            except (ValueError, SceneLog.DoesNotExist):
+                self.caller.msg(f"No scene '{scene_arg}' found.")
+                return
+            SCENE_LOGGER.flush(scene.room_id)
+            scene.refresh_from_db()
+        else:
+            if not self.caller.location:
+                self.caller.msg("You are not in a room.")
+                return
+            scene = SCENE_LOGGER.get_current_scene(self.caller.location.id)
+            if not scene:
+                self.caller.msg("No scene has been logged here.")
+                return
+
+        if not self.can_read(scene):
+            self.caller.msg("You can only read scenes you took part in.")
+            return
+
+        entries = scene.get_entries()
+        total_pages = max(1, (len(entries) + SCENE_LOG_PAGE_SIZE - 1) // SCENE_LOG_PAGE_SIZE)
+        page = min(page, total_pages)
+        start = (page - 1) * SCENE_LOG_PAGE_SIZE
+
+        formatter = TIME_MANAGER.get_formatter(self.caller)
+        is_staff = self.is_staff()
+        lines = [header(f"Scene #{scene.id} - {scene.room_name}", width=78)]
+        for timestamp, speaker, kind, language, text, hidden_text in entries[start:start + SCENE_LOG_PAGE_SIZE]:
+            if language and not is_staff and not self.caller.understands(language):
+                text = hidden_text or f"{speaker} says something in {language}."
+            stamp = formatter.format(timestamp, "%H:%M")
+            lines.append(f"|x[{stamp}]|n {text}")
+        lines.append(divider(width=78))
+        lines.append(f"Page {page} of {total_pages}"
+                     + (f" - +scene/log {scene.id}={page + 1} for more" if page < total_pages else ""))
+        lines.append(footer(width=78))
+        self.caller.msg("\n".join(lines))
@@ -6,6 +6,7 @@ from evennia.utils import ansi
 from evennia.commands.command import Command
 from evennia.utils import search
 from world.utils.permission_utils import check_admin_permission, format_permission_error
+from world.utils.who_snapshot import WHO_SNAPSHOT
 
 class CmdStaff(MuxCommand):
     """
@@ -206,6 +207,7 @@ class CmdStaff(MuxCommand):
             if account.db._playable_characters:
                 char = account.db._playable_characters[0]
                 char.tags.add("staff", category="role")
+                WHO_SNAPSHOT.refresh(char)
             self.caller.msg(f"Successfully added {account.key} as staff.")
         
         self.list_staff()
@@ -231,6 +233,7 @@ class CmdStaff(MuxCommand):
             account.tags.remove("staff", category="role")
             if char:
                 char.tags.remove("staff", category="role")
+                WHO_SNAPSHOT.refresh(char)
             self.caller.msg(f"Removed {account.key} from staff.")
         self.list_staff()
 
@@ -306,11 +309,13 @@ class CmdStaff(MuxCommand):
             account.tags.add("dark_mode", category="staff_status")
             if char:
                 char.tags.add("dark_mode", category="staff_status")
+                WHO_SNAPSHOT.refresh(char)
             self.caller.msg("You are now in dark mode (hidden from +staff, who, and +where).")
         else:
             account.tags.remove("dark_mode", category="staff_status")
             if char:
                 char.tags.remove("dark_mode", category="staff_status")
+                WHO_SNAPSHOT.refresh(char)
             self.caller.msg("You are now visible on +staff, who, and +where.")
 
         self.list_staff()
@@ -1,6 +1,6 @@
 from evennia.commands.default.muxcommand import MuxCommand
 from commands.commonmux.CmdPose import PoseBreakMixin
-import re
+from utils.speech import group_by_comprehension, fan_out, compile_pose, SPEAKER, NOT_UNDERSTANDS
 
 class CmdTableTalk(PoseBreakMixin, MuxCommand):
     """
@@ -53,10 +53,7 @@ class CmdTableTalk(PoseBreakMixin, MuxCommand):
             return
 
         # Get everyone at the same place
-        receivers = []
-        for obj in caller.location.contents:
-            if hasattr(obj, 'has_account') and obj.has_account and obj.db.place == place_name:
-                receivers.append(obj)
+        receivers = [obj for obj in self.get_audience(all_layers=True) if obj.db.place == place_name]
 
         if not receivers:
             caller.msg("There's no one at this place to talk to.")
@@ -87,41 +84,22 @@ class CmdTableTalk(PoseBreakMixin, MuxCommand):
         if is_language_tagged:
             message = message[1:]  # Remove the ~ prefix
 
-        # Get the initial message parameters to determine the language
-        initial_msg_self, initial_msg_understand, initial_msg_not_understand, language = caller.prepare_say(message)
+        # Determine the language being spoken
+        language = caller.prepare_say(message, language_only=True)[3]
 
-        # Format with place name and send to receivers
-        for receiver in receivers:
-            if receiver != caller:
-                # Check for Universal Language merit
-                has_universal = any(
-                    merit.lower().replace(' ', '') == 'universallanguage'
-                    for category in receiver.db.stats.get('merits', {}).values()
-                    for merit in category.keys()
-                )
+        # Render each comprehension group once and fan out with the place name
+        groups = group_by_comprehension(caller, receivers, language)
 
-                # Get the languages the receiver knows
-                receiver_languages = receiver.get_languages()
+        def render(bucket, viewer):
+            if bucket == NOT_UNDERSTANDS:
+                # Format as "says something in [language]" when they don't understand
+                return f"At {place_name}, {caller.name} says something in {language}"
+            msg_self, msg_understand, _, _ = caller.prepare_say(message, viewer=viewer, skip_english=True)
+            return f"At {place_name}, {msg_self if bucket == SPEAKER else msg_understand}"
 
-                # If they have Universal Language, know the language, or it's not a language-tagged message
-                if has_universal or not language or (language and language in receiver_languages):
-                    # Receiver understands the language
-                    _, msg_understand, _, _ = caller.prepare_say(message, viewer=receiver, skip_english=True)
-                    receiver.msg(f"At {place_name}, {msg_understand}")
-                else:
-                    # Receiver doesn't understand - use the not_understand format which hides the actual text
-                    if language:
-                        # Format as "says something in [language]" when they don't understand
-                        receiver.msg(f"At {place_name}, {caller.name} says something in {language}")
-                    else:
-                        # Fallback for unknown language cases
-                        receiver.msg(f"At {place_name}, {caller.name} says something you don't understand")
-            else:
-                # The speaker always understands their own speech
-                msg_self, _, _, _ = caller.prepare_say(message, viewer=receiver, skip_english=True)
-                receiver.msg(f"At {place_name}, {msg_self}")
+        fan_out(groups, render)
 
-        # Record scene activity
+        # Table talk is private to the place, so it stays out of the room's scene log
         caller.record_scene_activity()
 
     def _do_pose(self, caller, message, place_name, receivers):
@@ -140,50 +118,19 @@ class CmdTableTalk(PoseBreakMixin, MuxCommand):
         speaking_language = caller.get_speaking_language()
         
         # Check for language-tagged speech in the pose
-        if "~" in message:
-            # For each receiver, process language separately
-            for receiver in receivers:
-                parts = []
-                current_pos = 0
-                
-                # Find language-tagged portions
-                for match in re.finditer(r'"~([^"]+)"', message):
-                    # Add text before the speech
-                    parts.append(message[current_pos:match.start()])
-                    
-                    # Get the speech content
-                    speech = match.group(1)
-                    
-                    # Check if the receiver understands the language
-                    has_universal = any(
-                        merit.lower().replace(' ', '') == 'universallanguage'
-                        for category in receiver.db.stats.get('merits', {}).values()
-                        for merit in category.keys()
-                    )
-                    
-                    knows_language = (speaking_language in receiver.get_languages()) if speaking_language else True
-                    
-                    if receiver == caller or has_universal or knows_language:
-                        # Receiver understands the language
-                        parts.append(f'"{speech}"')
-                    else:
-                        # Receiver doesn't understand - replace with unknown language indicator
-                        parts.append(f'"[foreign speech in {speaking_language}]"')
-                    
-                    current_pos = match.end()
-                
-                # Add any remaining text
-                parts.append(message[current_pos:])
-                
-                # Construct final message with place name
-                final_message = f"At {place_name}, {poser_name} {''.join(parts)}"
-                receiver.msg(final_message)
+        template = compile_pose(message)
+        if template.has_speech:
+            groups = group_by_comprehension(caller, receivers, speaking_language,
+                                            per_viewer_names=False)
+            fan_out(groups, lambda bucket, viewer: (
+                f"At {place_name}, {poser_name} "
+                f"{template.render(bucket != NOT_UNDERSTANDS, speaking_language)}"))
         else:
             # No language-tagged speech, send normal pose with place name to all receivers
             for receiver in receivers:
                 receiver.msg(f"At {place_name}, {poser_name} {message}")
 
-        # Record scene activity
+        # Table talk is private to the place, so it stays out of the room's scene log
         caller.record_scene_activity()
 
     def _do_emit(self, caller, message, place_name, receivers):
@@ -199,50 +146,19 @@ class CmdTableTalk(PoseBreakMixin, MuxCommand):
         speaking_language = caller.get_speaking_language()
         
         # Check for language-tagged text
-        if "~" in message:
-            # For each receiver, process language separately
-            for receiver in receivers:
-                parts = []
-                current_pos = 0
-                
-                # Find language-tagged portions
-                for match in re.finditer(r'"~([^"]+)"', message):
-                    # Add text before the speech
-                    parts.append(message[current_pos:match.start()])
-                    
-                    # Get the speech content
-                    speech = match.group(1)
-                    
-                    # Check if the receiver understands the language
-                    has_universal = any(
-                        merit.lower().replace(' ', '') == 'universallanguage'
-                        for category in receiver.db.stats.get('merits', {}).values()
-                        for merit in category.keys()
-                    )
-                    
-                    knows_language = (speaking_language in receiver.get_languages()) if speaking_language else True
-                    
-                    if receiver == caller or has_universal or knows_language:
-                        # Receiver understands the language
-                        parts.append(f'"{speech}"')
-                    else:
-                        # Receiver doesn't understand - replace with unknown language indicator
-                        parts.append(f'"[foreign speech in {speaking_language}]"')
-                    
-                    current_pos = match.end()
-                
-                # Add any remaining text
-                parts.append(message[current_pos:])
-                
-                # Construct final message with place name
-                final_message = f"At {place_name}, {''.join(parts)}"
-                receiver.msg(final_message)
+        template = compile_pose(message)
+        if template.has_speech:
+            groups = group_by_comprehension(caller, receivers, speaking_language,
+                                            per_viewer_names=False)
+            fan_out(groups, lambda bucket, viewer: (
+                f"At {place_name}, "
+                f"{template.render(bucket != NOT_UNDERSTANDS, speaking_language)}"))
         else:
             # No language-tagged content, send as is with place prefix to all receivers
             for receiver in receivers:
                 receiver.msg(f"At {place_name}, {message}")
 
-        # Record scene activity
+        # Table talk is private to the place, so it stays out of the room's scene log
         caller.record_scene_activity()
 
     def send_pose_break(self, exclude=None):
@@ -262,9 +178,8 @@ class CmdTableTalk(PoseBreakMixin, MuxCommand):
         pose_break = f"\n|y{'=' * 30}> |w{caller.name}|n |y<{'=' * 30}|n"
         
         # Filter receivers to only include those at the same place
-        for obj in caller.location.contents:
-            if (hasattr(obj, 'has_account') and obj.has_account and 
-                obj.db.place == place_name and
+        for obj in self.get_audience(all_layers=True):
+            if (obj.db.place == place_name and
                 obj != caller and
                 (not exclude or obj not in exclude)):
                 obj.msg(pose_break)
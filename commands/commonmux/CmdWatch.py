@@ -2,62 +2,114 @@
 Watch command - tracks login/logout of friends
 """
 from evennia.commands.default.muxcommand import MuxCommand
-from evennia.utils.utils import make_iter
+from evennia.utils import utils
+from evennia.utils.utils import make_iter, delay
 from utils.search_helpers import search_character
-from evennia.server.sessionhandler import SESSIONS
+from world.utils.session_activity import SESSION_ACTIVITY
+from world.utils.watch_index import WATCH_INDEX
 from evennia.server.signals import SIGNAL_OBJECT_POST_PUPPET, SIGNAL_OBJECT_POST_UNPUPPET
 from django.dispatch import receiver
 
-# Function to notify watchers when someone logs in or out
+# Seconds connect/disconnect events are collected before watchers are told.
+# After a reload many characters re-puppet at once; each watcher gets one
+# digest for the whole burst instead of one line per character.
+WATCH_COALESCE_SECONDS = 3
+
+
+def format_watch_digest(connected, disconnected):
+    """
+    Format one watcher's notification for a batch of events.
+
+    Args:
+        connected (list): Names of characters who connected
+        disconnected (list): Names of characters who disconnected
+
+    Returns:
+        str: The notification line
+    """
+    parts = []
+    for names, status in ((connected, "connected"), (disconnected, "disconnected")):
+        if len(names) == 1:
+            parts.append(f"{names[0]} has {status}.")
+        elif names:
+            parts.append(f"{', '.join(names[:-1])} and {names[-1]} have {status}.")
+    return "|g[Watch]|n " + " ".join(parts)
+
+
+class WatchNotifier:
+    """
+    Collects connect and disconnect events for a short window, then sends
+    each watcher a single digest in one pass over the events.
+    """
+
+    def __init__(self, index=WATCH_INDEX, window=WATCH_COALESCE_SECONDS):
+        self.index = index
+        self.window = window
+        self._pending = {}      # character id -> [character, first state, last state]
+        self._scheduled = False
+
+    def queue(self, character, is_connected):
+        """
+        Queue a connect or disconnect event.
+
+        Args:
+            character (Object): The character connecting or disconnecting
+            is_connected (bool): True if connecting, False if disconnecting
+        """
+        if not character:
+            return
+        event = self._pending.get(character.id)
+        if event is None:
+            self._pending[character.id] = [character, is_connected, is_connected]
+        else:
+            event[2] = is_connected
+        if not self._scheduled:
+            self._scheduled = True
+            delay(self.window, self.flush)
+
+    def flush(self):
+        """
+        Send the digests for every queued event.
+
+        A character who connected and disconnected again (or the reverse)
+        within the window is left out: nothing changed for their watchers.
+
+        Returns:
+            int: Number of watchers notified
+        """
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+
+        digests = {}    # watcher id -> (watcher, connected names, disconnected names)
+        for character, first, last in pending.values():
+            if first != last:
+                continue
+            for watcher in self.index.get_watchers(character):
+                digest = digests.get(watcher.id)
+                if digest is None:
+                    digest = (watcher, [], [])
+                    digests[watcher.id] = digest
+                digest[1 if last else 2].append(character.key)
+
+        for watcher, connected, disconnected in digests.values():
+            watcher.msg(format_watch_digest(connected, disconnected))
+        return len(digests)
+
+
+WATCH_NOTIFIER = WatchNotifier()
+
+
 def notify_watchers(character, is_connected):
     """
     Notify players when someone they're watching connects or disconnects.
+
+    Notifications are coalesced; see WatchNotifier.
     
     Args:
         character (Object): The character connecting or disconnecting
         is_connected (bool): True if connecting, False if disconnecting
     """
-    # Skip notification if the character is hidden or doesn't exist
-    if not character or character.attributes.get("watch_hidden", False):
-        return
-        
-    # Get all possible watchers (all accounts with puppets)
-    from evennia.accounts.models import AccountDB
-    for account in AccountDB.objects.filter(db_is_connected=True):
-        # Skip if no puppets
-        if not account.puppet:
-            continue
-            
-        puppet = account.puppet
-        
-        # Skip if the puppet is the character connecting/disconnecting
-        if puppet == character:
-            continue
-            
-        # Check if the character is on the puppet's watch list
-        if not puppet.attributes.has("watch_list") and not puppet.attributes.get("watch_all", False):
-            continue
-            
-        watch_list = puppet.attributes.get("watch_list", [])
-        watch_active = puppet.attributes.get("watch_active", True)
-        watch_all = puppet.attributes.get("watch_all", False)
-        watch_permitted = puppet.attributes.get("watch_permitted", [])
-        
-        # Skip if the watch system is turned off
-        if not watch_active:
-            continue
-            
-        # Check if the character is on the puppet's watch list or if watching all
-        is_watching = character.key in watch_list or watch_all
-        
-        # Check if the character has hidden themselves but permitted this watcher
-        if character.attributes.get("watch_hidden", False) and character.key not in watch_permitted:
-            continue
-            
-        # If the character is being watched, send a notification
-        if is_watching:
-            status = "connected" if is_connected else "disconnected"
-            puppet.msg(f"|g[Watch]|n {character.key} has {status}.")
+    WATCH_NOTIFIER.queue(character, is_connected)
 
 # Register signal handlers
 @receiver(SIGNAL_OBJECT_POST_PUPPET)
@@ -167,14 +219,11 @@ class CmdWatch(MuxCommand):
                 
             # Show connected people from watch list
             connected_watching = []
-            session_list = SESSIONS.get_sessions()
-            for session in session_list:
-                if not session.logged_in:
-                    continue
-                account = session.get_account()
-                puppet = session.get_puppet()
-                if puppet and any(puppet.key.lower() == watched.lower() for watched in watch_list):
-                    connected_watching.append(puppet.key)
+            watched_names = {watched.lower() for watched in watch_list}
+            for puppet in SESSION_ACTIVITY.get_online_puppets():
+                if puppet.key.lower() in watched_names:
+                    idle = utils.time_format(SESSION_ACTIVITY.get_idle_seconds(puppet), 1)
+                    connected_watching.append(f"{puppet.key} ({idle} idle)")
             
             if connected_watching:
                 self.msg(f"Currently connected people you're watching: {', '.join(connected_watching)}")
@@ -190,11 +239,13 @@ class CmdWatch(MuxCommand):
         # Turn watch on or off
         if "on" in self.switches:
             caller.attributes.add("watch_active", True)
+            WATCH_INDEX.refresh_watcher(caller)
             self.msg("Watch system activated. You will now receive notifications.")
             return
             
         if "off" in self.switches:
             caller.attributes.add("watch_active", False)
+            WATCH_INDEX.refresh_watcher(caller)
             self.msg("Watch system deactivated. You will no longer receive notifications.")
             return
             
@@ -205,11 +256,7 @@ class CmdWatch(MuxCommand):
                 return
                 
             # Get connected status for everyone on the list
-            session_list = SESSIONS.get_sessions()
-            connected_names = []
-            for session in session_list:
-                if session.logged_in and session.get_puppet():
-                    connected_names.append(session.get_puppet().key.lower())
+            connected_names = {puppet.key.lower() for puppet in SESSION_ACTIVITY.get_online_puppets()}
             
             status_list = []
             for name in watch_list:
@@ -236,11 +283,13 @@ class CmdWatch(MuxCommand):
         # Hide or unhide from others' watch lists
         if "hide" in self.switches:
             caller.attributes.add("watch_hidden", True)
+            WATCH_INDEX.refresh_visibility(caller)
             self.msg("You are now hidden from others' watch lists, except for those you specifically permit.")
             return
             
         if "unhide" in self.switches:
             caller.attributes.add("watch_hidden", False)
+            WATCH_INDEX.refresh_visibility(caller)
             self.msg("You are now visible to others' watch lists.")
             return
             
@@ -262,6 +311,7 @@ class CmdWatch(MuxCommand):
             # Add the target to the permitted list
             watch_permitted.append(target.key)
             caller.attributes.add("watch_permitted", watch_permitted)
+            WATCH_INDEX.refresh_visibility(caller)
             self.msg(f"{target.key} is now permitted to see you even while you're hidden.")
             return
             
@@ -295,6 +345,8 @@ class CmdWatch(MuxCommand):
             
             # Update their watch list
             target.attributes.add("watch_list", target_watch_list)
+            if SESSION_ACTIVITY.is_online(target):
+                WATCH_INDEX.refresh_watcher(target)
             
             # Now add me to their blocked-by list
             if not target.attributes.has("watch_blocked_by"):
@@ -389,6 +441,7 @@ class CmdWatch(MuxCommand):
             # Add the target to the watch list
             watch_list.append(target.key)
             caller.attributes.add("watch_list", watch_list)
+            WATCH_INDEX.refresh_watcher(caller)
             self.msg(f"{target.key} has been added to your watch list.")
             return
             
@@ -410,6 +463,7 @@ class CmdWatch(MuxCommand):
                 
             # Update the watch list
             caller.attributes.add("watch_list", watch_list)
+            WATCH_INDEX.refresh_watcher(caller)
             self.msg(f"{args} has been removed from your watch list.")
             return
             
@@ -424,14 +478,9 @@ class CmdWatch(MuxCommand):
                 return
                 
             # Get connected characters from the watch list
-            connected_characters = []
-            session_list = SESSIONS.get_sessions()
-            for session in session_list:
-                if not session.logged_in:
-                    continue
-                puppet = session.get_puppet()
-                if puppet and any(puppet.key.lower() == watched.lower() for watched in watch_list):
-                    connected_characters.append(puppet.key)
+            watched_names = {watched.lower() for watched in watch_list}
+            connected_characters = [puppet.key for puppet in SESSION_ACTIVITY.get_online_puppets()
+                                    if puppet.key.lower() in watched_names]
                     
             if not connected_characters:
                 self.msg("None of the people you're watching are currently connected.")
@@ -450,9 +499,11 @@ class CmdWatch(MuxCommand):
                 
             if args.lower() == "on":
                 caller.attributes.add("watch_all", True)
+                WATCH_INDEX.refresh_watcher(caller)
                 self.msg("You will now be notified of ALL login/logout activity.")
             else:
                 caller.attributes.add("watch_all", False)
+                WATCH_INDEX.refresh_watcher(caller)
                 self.msg("You will no longer be notified of ALL login/logout activity.")
             return
             
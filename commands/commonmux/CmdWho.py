@@ -8,19 +8,25 @@ import time
 from evennia import SESSION_HANDLER as evennia
 from evennia.utils import utils
 from world.utils.formatting import header, footer, divider
+from world.utils.session_activity import SESSION_ACTIVITY
+from world.utils.who_snapshot import WHO_SNAPSHOT
+from world.utils.census_utils import get_census, CENSUS_STAT_CATEGORIES
 from evennia.utils.utils import class_from_module
 from evennia.utils.ansi import strip_ansi
 from django.conf import settings
 
 COMMAND_DEFAULT_CLASS = class_from_module(settings.COMMAND_DEFAULT_CLASS)
 
+# Characters shown per page of who
+WHO_PAGE_SIZE = 50
+
 class CmdWho(COMMAND_DEFAULT_CLASS):
     """
     list who is currently online, showing character names
 
     Usage:
-      who
-      doing
+      who [<page>]
+      doing [<page>]
 
     Shows who is currently online using character names instead of account names.
     'doing' is an alias that limits info also for those with all permissions.
@@ -32,62 +38,13 @@ class CmdWho(COMMAND_DEFAULT_CLASS):
     account_caller = False  # important for Account commands
     help_category = "Game Info"
 
-    def format_name(self, puppet, account):
-        """Helper function to format character names consistently"""
-        if puppet:
-            # Get display name but strip any existing ANSI formatting
-            display_name = puppet.get_display_name(account)
-            clean_name = strip_ansi(display_name)
-            
-            # Add indicators using tags
-            name_suffix = ""
-            if puppet.check_permstring("builders"):
-                name_suffix += f"*{name_suffix}"
-            if puppet.tags.has("in_umbra", category="state"):
-                name_suffix = f"@{name_suffix}"
-            if puppet.db.lfrp:
-                name_suffix = f"${name_suffix}"
-            
-            # For debugging
-            # self.msg(f"Tags for {puppet.key}: {puppet.tags.all()}")
-            
-            # If no prefix, add a space to maintain alignment
-            name_suffix = name_suffix or " "
-            
-            # Add the dbref
-            name = f"{name_suffix}{clean_name}"
-            return utils.crop(name, width=17)
-        return "None".ljust(17)
-
-    def get_location_display(self, puppet, account):
-        """Helper function to format location display, respecting unfindable status"""
-        if not puppet or not puppet.location:
-            return "None"
-            
-        # Check if character is unfindable
-        if hasattr(puppet, 'db') and puppet.db.unfindable and not account.check_permstring("Builder"):
-            return "(Hidden)"
-            
-        # Staff can always see room names
-        if account.check_permstring("Builder"):
-            return puppet.location.key
-            
-        # Check if room is unfindable
-        if hasattr(puppet.location, 'db') and puppet.location.db.unfindable:
-            return "(Hidden)"
-            
-        return puppet.location.key
-
     def func(self):
         """
-        Get all connected accounts by polling session.
+        List online characters from the shared who snapshot.
         """
         account = self.account
-        session_list = evennia.get_sessions()
         is_staff = account.check_permstring("builders")  # Check if viewer is staff
 
-        session_list = sorted(session_list, key=lambda o: o.get_puppet().key if o.get_puppet() else o.account.key)
-
         if self.cmdstring == "doing":
             show_session_data = False
         else:
@@ -95,6 +52,15 @@ class CmdWho(COMMAND_DEFAULT_CLASS):
                 "Admins"
             )
 
+        # Only the viewer's own filter and paging run per call
+        rows = [row for row in WHO_SNAPSHOT.get_rows() if row.is_visible_to(self.caller, is_staff)]
+        page = 1
+        if self.args.strip().isdigit():
+            page = max(1, int(self.args.strip()))
+        total_pages = max(1, (len(rows) + WHO_PAGE_SIZE - 1) // WHO_PAGE_SIZE)
+        page = min(page, total_pages)
+        rows = rows[(page - 1) * WHO_PAGE_SIZE:page * WHO_PAGE_SIZE]
+
         naccounts = evennia.account_count()
         if show_session_data:
             # privileged info
@@ -102,31 +68,20 @@ class CmdWho(COMMAND_DEFAULT_CLASS):
             string += "|wName              On       Idle     Account     Room            Cmds  Host|n\n"
             string += "|r" + "-" * 78 + "|n\n"
             
-            for session in session_list:
-                if not session.logged_in:
+            for row in rows:
+                puppet = row.puppet
+                sessions = puppet.sessions.all()
+                if not sessions:
                     continue
-                delta_cmd = time.time() - session.cmd_last_visible
-                delta_conn = time.time() - session.conn_time
+                session = sessions[0]
                 session_account = session.get_account()
-                puppet = session.get_puppet()
-                
-                # Skip if in dark mode (unless it's the viewer or both are staff)
-                if puppet and puppet != self.caller:
-                    is_dark = (session_account.tags.get("dark_mode", category="staff_status") or 
-                             (puppet and puppet.tags.get("dark_mode", category="staff_status")))
-                    target_is_staff = (session_account.tags.get("staff", category="role") or 
-                                     (puppet and puppet.tags.get("staff", category="role")))
-                    if is_dark and not (is_staff and target_is_staff):
-                        continue
-                
-                location = self.get_location_display(puppet, account)
                 
                 string += " %-17s %-8s %-8s %-10s %-15s %-5s %s\n" % (
-                    self.format_name(puppet, account),
-                    utils.time_format(delta_conn, 0),
-                    utils.time_format(delta_cmd, 1),
+                    row.get_name(account, is_staff),
+                    utils.time_format(SESSION_ACTIVITY.get_connected_seconds(puppet) or 0, 0),
+                    utils.time_format(SESSION_ACTIVITY.get_idle_seconds(puppet) or 0, 1),
                     utils.crop(session_account.get_display_name(account), width=10),
-                    utils.crop(location, width=15),
+                    utils.crop(row.get_location(is_staff), width=15),
                     str(session.cmd_total).ljust(5),
                     isinstance(session.address, tuple) and session.address[0] or session.address
                 )
@@ -136,35 +91,19 @@ class CmdWho(COMMAND_DEFAULT_CLASS):
             string += "|wName              On       Idle     Room|n\n"
             string += "|r" + "-" * 78 + "|n\n"
             
-            for session in session_list:
-                if not session.logged_in:
-                    continue
-                delta_cmd = time.time() - session.cmd_last_visible
-                delta_conn = time.time() - session.conn_time
-                puppet = session.get_puppet()
-                session_account = session.get_account()
-                
-                # Skip if in dark mode (unless it's the viewer or both are staff)
-                if puppet and puppet != self.caller:
-                    is_dark = (session_account.tags.get("dark_mode", category="staff_status") or 
-                             (puppet and puppet.tags.get("dark_mode", category="staff_status")))
-                    target_is_staff = (session_account.tags.get("staff", category="role") or 
-                                     (puppet and puppet.tags.get("staff", category="role")))
-                    if is_dark and not (is_staff and target_is_staff):
-                        continue
-                
-                location = self.get_location_display(puppet, account)
-                
+            for row in rows:
                 string += " %-17s %-8s %-8s %s\n" % (
-                    self.format_name(puppet, account),
-                    utils.time_format(delta_conn, 0),
-                    utils.time_format(delta_cmd, 1),
-                    utils.crop(location, width=25)
+                    row.get_name(account, is_staff),
+                    utils.time_format(SESSION_ACTIVITY.get_connected_seconds(row.puppet) or 0, 0),
+                    utils.time_format(SESSION_ACTIVITY.get_idle_seconds(row.puppet) or 0, 1),
+                    utils.crop(row.get_location(is_staff), width=25)
                 )
 
         is_one = naccounts == 1
         string += "|r" + "-" * 78 + "|n\n"
         string += f"{naccounts} unique account{'s' if not is_one else ''} logged in.\n"
+        if total_pages > 1:
+            string += f"Page {page} of {total_pages}. Use 'who <page>' to see more.\n"
         string += "|r" + "-" * 78 + "|n\n"
         string += "|yLegend: * = Staff, $ = Looking for RP, @ = In Hisil|n\n"  # Fixed legend formatting
         string += "|r" + "-" * 78 + "|n\n"
@@ -255,6 +194,9 @@ class CmdCensus(COMMAND_DEFAULT_CLASS):
 
     def func(self):
         """Execute the census command."""
+        if not get_census().loaded:
+            self.msg("|yThe census is still being counted; numbers may be incomplete.|n")
+
         if not self.args:
             # Show overall population by template
             counts = self.get_template_counts()
@@ -283,8 +225,7 @@ class CmdCensus(COMMAND_DEFAULT_CLASS):
             return
         
         # Check if it's a stat category
-        stat_categories = ['attributes', 'skills', 'merits', 'advantages']
-        if args in stat_categories:
+        if args in CENSUS_STAT_CATEGORIES:
             counts = self.get_stat_category_counts(args)
             self.msg(self.format_counts(counts, f"{args.title()} Distribution"))
             return
@@ -301,161 +242,17 @@ class CmdCensus(COMMAND_DEFAULT_CLASS):
         self.msg("Available options: vampire, mage, changeling, werewolf, mortal, mortal+, hunter, demon, beast, deviant, promethean, groups")
         self.msg("Or stat categories: attributes, skills, merits, advantages")
 
-    def get_all_characters(self):
-        """Get all approved characters in the game."""
-        from typeclasses.characters import Character
-        from evennia.utils.search import search_object
-        
-        all_chars = search_object("", typeclass=Character)
-        # Filter to only approved characters with stats
-        approved_chars = []
-        for char in all_chars:
-            if (hasattr(char, 'db') and 
-                char.db.approved and 
-                char.db.stats):
-                approved_chars.append(char)
-        
-        return approved_chars
-
     def get_template_counts(self):
         """Get counts of characters by template."""
-        characters = self.get_all_characters()
-        counts = {}
-        
-        for char in characters:
-            template = char.db.stats.get("other", {}).get("template", "Unknown")
-            if template == "Unknown":
-                template = "Mortal"  # Default fallback
-            
-            counts[template] = counts.get(template, 0) + 1
-        
-        return counts
+        return get_census().get_counts("template")
 
     def get_template_subcounts(self, template):
         """Get subcounts for a specific template (clans, tribes, etc.)."""
-        characters = self.get_all_characters()
-        counts = {}
-        
-        # Template-specific field mappings - PRIMARY field comes first
-        template_fields = {
-            'Vampire': ['clan', 'covenant'],
-            'Mage': ['path', 'order', 'legacy'],
-            'Changeling': ['seeming', 'kith', 'court', 'entitlement'],
-            'Werewolf': ['tribe', 'auspice', 'lodge'],
-            'Hunter': ['compact', 'profession'],
-            'Mortal': ['profession', 'organization'],
-            'Mortal+': ['type', 'organization'],
-            'Demon': ['incarnation', 'agenda', 'catalyst'],
-            'Beast': ['family', 'hunger', 'horror'],
-            'Deviant': ['origin', 'clade', 'scar'],
-            'Promethean': ['lineage', 'refinement', 'creator'],
-            'Geist': ['archetype', 'threshold']
-        }
-        
-        fields_to_check = template_fields.get(template, ['clan', 'covenant', 'tribe', 'court', 'order'])
-        
-        for char in characters:
-            char_template = char.db.stats.get("other", {}).get("template", "Unknown")
-            if char_template != template:
-                continue
-                
-            bio = char.db.stats.get("bio", {})
-            
-            # Try to build a meaningful category string from available fields
-            # For most templates, we'll use the primary field (first in list)
-            primary_field = fields_to_check[0] if fields_to_check else None
-            
-            if primary_field:
-                value = bio.get(primary_field)
-                
-                # Check if value is valid
-                if value and value != "<not set>" and str(value).strip():
-                    # For some templates, combine multiple fields for better categorization
-                    if template == 'Changeling' and len(fields_to_check) >= 3:
-                        # For Changeling: Show "Seeming (Court)" format
-                        seeming = bio.get('seeming', '')
-                        court = bio.get('court', '')
-                        
-                        if seeming and seeming != "<not set>" and str(seeming).strip():
-                            if court and court != "<not set>" and str(court).strip():
-                                category_name = f"{seeming} ({court})"
-                            else:
-                                category_name = f"{seeming}"
-                        else:
-                            category_name = "Unspecified"
-                    elif template == 'Vampire' and len(fields_to_check) >= 2:
-                        # For Vampire: Show "Clan (Covenant)" format
-                        clan = bio.get('clan', '')
-                        covenant = bio.get('covenant', '')
-                        
-                        if clan and clan != "<not set>" and str(clan).strip():
-                            if covenant and covenant != "<not set>" and str(covenant).strip():
-                                category_name = f"{clan} ({covenant})"
-                            else:
-                                category_name = f"{clan}"
-                        else:
-                            category_name = "Unspecified"
-                    elif template == 'Werewolf' and len(fields_to_check) >= 2:
-                        # For Werewolf: Show "Tribe (Auspice)" format
-                        tribe = bio.get('tribe', '')
-                        auspice = bio.get('auspice', '')
-                        
-                        if tribe and tribe != "<not set>" and str(tribe).strip():
-                            if auspice and auspice != "<not set>" and str(auspice).strip():
-                                category_name = f"{tribe} ({auspice})"
-                            else:
-                                category_name = f"{tribe}"
-                        else:
-                            category_name = "Unspecified"
-                    elif template == 'Mage' and len(fields_to_check) >= 2:
-                        # For Mage: Show "Path (Order)" format
-                        path = bio.get('path', '')
-                        order = bio.get('order', '')
-                        
-                        if path and path != "<not set>" and str(path).strip():
-                            if order and order != "<not set>" and str(order).strip():
-                                category_name = f"{path} ({order})"
-                            else:
-                                category_name = f"{path}"
-                        else:
-                            category_name = "Unspecified"
-                    else:
-                        # Default: just use primary field with label
-                        category_name = f"{value}"
-                    
-                    counts[category_name] = counts.get(category_name, 0) + 1
-                else:
-                    counts["Unspecified"] = counts.get("Unspecified", 0) + 1
-            else:
-                # No fields defined for this template
-                counts["Unspecified"] = counts.get("Unspecified", 0) + 1
-        
-        return counts
+        return get_census().get_counts(f"template:{template}")
 
     def get_stat_category_counts(self, category):
         """Get counts for a specific stat category."""
-        characters = self.get_all_characters()
-        counts = {}
-        
-        for char in characters:
-            stats = char.db.stats.get(category, {})
-            
-            if category == "merits":
-                # For merits, count each merit name
-                for merit_name, merit_data in stats.items():
-                    if isinstance(merit_data, dict) and merit_data.get("dots", 0) > 0:
-                        display_name = f"{merit_name.replace('_', ' ').title()}"
-                        counts[display_name] = counts.get(display_name, 0) + 1
-            else:
-                # For other categories, count stat names and their values
-                for stat_name, value in stats.items():
-                    if value and value > 0:  # Only count stats with positive values
-                        display_name = f"{stat_name.replace('_', ' ').title()}"
-                        if display_name not in counts:
-                            counts[display_name] = 0
-                        counts[display_name] += 1
-        
-        return counts
+        return get_census().get_counts(category)
 
     def get_group_census(self):
         """Get census information about groups."""
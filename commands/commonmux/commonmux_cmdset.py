@@ -8,6 +8,7 @@ from evennia.commands.cmdset import CmdSet
 
 from commands.commonmux.CmdAlias import CmdAlias
 from commands.commonmux.CmdAlts import CmdAlts
+from commands.commonmux.CmdApprove import CmdApprove
 from commands.commonmux.CmdEmit import CmdEmit
 from commands.commonmux.CmdLanguage import CmdLanguage
 from commands.commonmux.CmdOOCChat import CmdOOCChat, CmdUnpuppet
@@ -16,6 +17,7 @@ from commands.commonmux.CmdPlace import CmdPlace
 #from commands.commonmux.CmdPool import CmdPool, CmdGain, CmdSpend
 from commands.commonmux.CmdPose import CmdPose
 from commands.commonmux.CmdSay import CmdSay
+from commands.commonmux.CmdScene import CmdScene
 from commands.commonmux.CmdShortDesc import CmdShortDesc
 from commands.commonmux.CmdStaff import CmdStaff
 from commands.commonmux.CmdTableTalk import CmdTableTalk
@@ -41,12 +43,14 @@ class CommonMuxCmdSet(CmdSet):
         # Character and roleplay commands
         self.add(CmdAlias())
         self.add(CmdAlts())
+        self.add(CmdApprove())
         self.add(CmdEmit())
         self.add(CmdFinger())
         self.add(CmdOOCChat())
         self.add(CmdPlace())
         self.add(CmdPose())
         self.add(CmdSay())
+        self.add(CmdScene())
         self.add(CmdShortDesc())
         self.add(CmdTableTalk())
         
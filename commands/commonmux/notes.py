@@ -1,9 +1,10 @@
 from evennia.commands.default.muxcommand import MuxCommand
 from evennia.utils import evtable
 from evennia import search_object
-from datetime import datetime
+import time
 from utils.text import process_special_characters
 from utils.search_helpers import search_character
+from world.utils.time_utils import TIME_MANAGER
 
 
 class CmdNote(MuxCommand):
@@ -133,8 +134,8 @@ class CmdNote(MuxCommand):
             "category": category,
             "text": text,
             "approved": False,
-            "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "modified": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "created": int(time.time()),
+            "modified": int(time.time())
         }
         
         self.caller.db.notes.append(new_note)
@@ -158,13 +159,14 @@ class CmdNote(MuxCommand):
             width=78
         )
         
+        formatter = TIME_MANAGER.get_formatter(self.caller)
         for note in notes:
             status = "|gApproved|n" if note["approved"] else "|yDraft|n"
             table.add_row(
                 note["title"],
                 note["category"],
                 status,
-                note["created"]
+                formatter.format(note["created"])
             )
         
         output = ["|wYour Notes|n", str(table)]
@@ -201,13 +203,14 @@ class CmdNote(MuxCommand):
         output.append(f"|wNote:|n {note['title']}")
         output.append(f"|wCategory:|n {note['category']}")
         output.append(f"|wCharacter:|n {character.name}")
-        output.append(f"|wCreated:|n {note['created']}")
-        output.append(f"|wLast Modified:|n {note['modified']}")
+        formatter = TIME_MANAGER.get_formatter(self.caller)
+        output.append(f"|wCreated:|n {formatter.format(note['created'])}")
+        output.append(f"|wLast Modified:|n {formatter.format(note['modified'])}")
         
         if note["approved"]:
             output.append(f"|wStatus:|n |gApproved|n")
             if "approved_by" in note:
-                output.append(f"|wApproved by:|n {note['approved_by']} on {note.get('approved_date', 'Unknown')}")
+                output.append(f"|wApproved by:|n {note['approved_by']} on {formatter.format(note.get('approved_date')) or 'Unknown'}")
         else:
             output.append(f"|wStatus:|n |yDraft|n")
         
@@ -250,13 +253,14 @@ class CmdNote(MuxCommand):
             width=78
         )
         
+        formatter = TIME_MANAGER.get_formatter(self.caller)
         for note in notes:
             status = "|gApproved|n" if note["approved"] else "|yDraft|n"
             table.add_row(
                 note["title"],
                 note["category"],
                 status,
-                note["created"]
+                formatter.format(note["created"])
             )
         
         output = [f"|w{character.name}'s Notes|n", str(table)]
@@ -373,8 +377,8 @@ class CmdNote(MuxCommand):
             "category": category,
             "text": text,
             "approved": False,
-            "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "modified": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "created": int(time.time()),
+            "modified": int(time.time()),
             "created_by_staff": self.caller.name
         }
         
@@ -423,7 +427,7 @@ class CmdNote(MuxCommand):
         
         # Update the note
         found_note["text"] = new_text
-        found_note["modified"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        found_note["modified"] = int(time.time())
         
         self.caller.msg(f"|gNote updated:|n '{title}'")
     
@@ -511,7 +515,7 @@ class CmdNote(MuxCommand):
         # Approve the note
         found_note["approved"] = True
         found_note["approved_by"] = self.caller.name
-        found_note["approved_date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        found_note["approved_date"] = int(time.time())
         
         self.caller.msg(f"|gApproved note:|n '{title}' for {character.name}")
         
@@ -621,7 +625,8 @@ class CmdNote(MuxCommand):
         if found_note["approved"]:
             output.append(f"|wStatus:|n |gApproved|n")
             if "approved_by" in found_note:
-                output.append(f"|wApproved by:|n {found_note['approved_by']} on {found_note.get('approved_date', 'Unknown')}")
+                approved_date = TIME_MANAGER.get_formatter(self.caller).format(found_note.get('approved_date'))
+                output.append(f"|wApproved by:|n {found_note['approved_by']} on {approved_date or 'Unknown'}")
         else:
             output.append(f"|wStatus:|n |yDraft|n")
         
@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import Mock, patch
+from world.utils.watch_index import WatchIndex
+from commands.commonmux.CmdWatch import WatchNotifier, format_watch_digest
+
+
+def make_character(char_id, key, **watch_attrs):
+    """
+    Create a stand-in puppet with watch attributes.
+    """
+    character = Mock()
+    character.id = char_id
+    character.key = key
+    character.attributes.get.side_effect = lambda name, default=None: watch_attrs.get(name, default)
+    return character
+
+
+class TestWatchNotifier(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up 100 online characters. The first ten watch everyone; the
+        rest each watch the two characters after them.
+        """
+        names = [f"Char{i}" for i in range(100)]
+        self.characters = []
+        for i, name in enumerate(names):
+            if i < 10:
+                attrs = {"watch_all": True}
+            else:
+                attrs = {"watch_list": [names[(i + 1) % 100], names[(i + 2) % 100]]}
+            self.characters.append(make_character(i + 1, name, **attrs))
+
+        self.index = WatchIndex()
+        with patch("world.utils.watch_index.SESSION_ACTIVITY") as activity:
+            activity.get_online_puppets.return_value = self.characters
+            self.index.get_watchers(self.characters[0])
+
+        self.notifier = WatchNotifier(index=self.index, window=3)
+
+    def queue_all(self, is_connected=True):
+        with patch("commands.commonmux.CmdWatch.delay") as delay:
+            for character in self.characters:
+                self.notifier.queue(character, is_connected)
+        return delay
+
+    def test_burst_sends_one_digest_per_watcher(self):
+        """
+        Test that 100 simultaneous puppets produce one message per watcher.
+        """
+        delay = self.queue_all()
+        delay.assert_called_once_with(3, self.notifier.flush)
+        for character in self.characters:
+            character.msg.assert_not_called()
+
+        with patch.object(self.index, "get_watchers", wraps=self.index.get_watchers) as get_watchers:
+            notified = self.notifier.flush()
+
+        self.assertEqual(get_watchers.call_count, 100)
+        self.assertEqual(notified, 100)
+        for character in self.characters:
+            self.assertEqual(character.msg.call_count, 1)
+
+        # Watch-all watchers hear about everyone but themselves in one line
+        digest = self.characters[0].msg.call_args[0][0]
+        self.assertIn("Char1, Char2", digest)
+        self.assertNotIn("Char0,", digest)
+        self.assertTrue(digest.endswith("have connected."))
+
+    def test_flush_clears_pending(self):
+        """
+        Test that a flush resets the window for the next burst.
+        """
+        self.queue_all()
+        self.notifier.flush()
+        self.assertEqual(self.notifier.flush(), 0)
+        delay = self.queue_all(is_connected=False)
+        delay.assert_called_once()
+
+    def test_reconnect_within_window_is_dropped(self):
+        """
+        Test that a disconnect and reconnect inside one window cancel out.
+        """
+        target = self.characters[50]
+        with patch("commands.commonmux.CmdWatch.delay"):
+            self.notifier.queue(target, False)
+            self.notifier.queue(target, True)
+        self.assertEqual(self.notifier.flush(), 0)
+
+    def test_hidden_character_only_seen_by_permitted(self):
+        """
+        Test that hidden characters are only announced to permitted watchers.
+        """
+        hidden = make_character(500, "Hidden", watch_hidden=True, watch_permitted=["Char3"])
+        with patch("commands.commonmux.CmdWatch.delay"):
+            self.notifier.queue(hidden, True)
+        self.notifier.flush()
+        self.characters[3].msg.assert_called_once_with("|g[Watch]|n Hidden has connected.")
+        self.characters[0].msg.assert_not_called()
+
+    def test_format_watch_digest(self):
+        """
+        Test digest wording for mixed batches.
+        """
+        self.assertEqual(format_watch_digest(["A", "B", "C"], ["D"]),
+                         "|g[Watch]|n A, B and C have connected. D has disconnected.")
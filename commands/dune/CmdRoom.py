@@ -181,6 +181,7 @@ class CmdRoom(MuxCommand):
             # If hierarchy is malformed, set it properly
             location = current_hierarchy[0] if current_hierarchy else "Unknown Location"
             room.db.location_hierarchy = [location, planet.key]
+        room.invalidate_appearance()
         
         self.caller.msg(f"Associated {room.key} with planet {planet.key}.")
         self.caller.msg(f"Updated location hierarchy to: {room.key} - {' - '.join(room.db.location_hierarchy)}")
@@ -224,6 +225,7 @@ class CmdRoom(MuxCommand):
             # If hierarchy is malformed, set it properly
             planet = current_hierarchy[1] if len(current_hierarchy) > 1 else "Unknown Planet"
             room.db.location_hierarchy = [location_name, planet]
+        room.invalidate_appearance()
         
         self.caller.msg(f"Set location for {room.key} to: {location_name}")
         self.caller.msg(f"Location hierarchy: {room.key} - {' - '.join(room.db.location_hierarchy)}")
@@ -267,6 +269,7 @@ class CmdRoom(MuxCommand):
         # Set the area information
         room.db.area_name = area_name
         room.db.area_code = area_code
+        room.invalidate_appearance()
         
         self.caller.msg(f"Set area for {room.key}:")
         self.caller.msg(f"  Area Name: {area_name}")
@@ -316,6 +319,7 @@ class CmdRoom(MuxCommand):
         
         # Set the location hierarchy [Location, Planet]
         room.db.location_hierarchy = hierarchy
+        room.invalidate_appearance()
         
         self.caller.msg(f"Set location hierarchy for {room.key}:")
         self.caller.msg(f"  {room.key} - {' - '.join(hierarchy)}")
@@ -351,6 +355,7 @@ class CmdRoom(MuxCommand):
         current_state = room.db.places_active or False
         new_state = not current_state
         room.db.places_active = new_state
+        room.invalidate_appearance()
         
         self.caller.msg(f"Places system for {room.key}: {'Active' if new_state else 'Inactive'}")
 
@@ -13,13 +13,33 @@ from world.utils.formatting import header, footer, divider, format_stat
 from textwrap import fill
 from django.utils import timezone
 from django.db.models import Max, F
+from datetime import datetime, timezone as dt_timezone
 import json
 import copy
+import re
 from evennia.help.models import HelpEntry
 from evennia.accounts.models import AccountDB
 from utils.search_helpers import search_character
 from evennia.comms.models import Msg
 from django.conf import settings
+from world.utils.time_utils import TIME_MANAGER
+from world.utils.job_notifications import JOB_NOTIFIER
+from world.utils.job_search import JOB_SEARCH
+from world.utils.job_utils import (
+    allocate_archive_id, reset_archive_ids, get_comment_page, get_archive_page
+)
+
+# How job and note times are shown, in the viewer's timezone
+JOB_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Relations shown on every job list row, fetched with the jobs themselves
+JOB_LIST_RELATED = ("queue", "requester", "assignee")
+
+# Most results +jobs/search shows
+JOB_SEARCH_LIMIT = 20
+
+# Filters +jobs/search takes as <name>=<value>
+JOB_SEARCH_FILTERS = ("queue", "status", "requester", "after", "before", "strategic", "house", "org")
 
 class CmdJobs(MuxCommand):
     """
@@ -30,6 +50,7 @@ class CmdJobs(MuxCommand):
       +myjobs                    - List jobs you created or are assigned to
       +jobs/mine                 - List jobs assigned to you (staff only)
       +jobs <#>                  - View details of a specific job
+      +jobs <#>/<page>           - View a job with an earlier page of comments
       +jobs/create <category>/<title>=<text> [= <template>] <args>
       +jobs/comment <#>=<text>   - Add a comment to a job
       +jobs/add <#>=<text>       - Alias for +jobs/comment
@@ -48,12 +69,19 @@ class CmdJobs(MuxCommand):
       +jobs/reassign <#>=<new assignee>
       +jobs/queue/view <queue name>
       +jobs/list_with_object <object_name>
-      +jobs/archive
+      +jobs/archive [queue=<queue>] [requester=<player>]
+                                 - Browse archived jobs, newest first
+      +jobs/archive/next         - Show the next page of archived jobs
       +jobs/archive <#>
       +jobs/complete <#>=<reason>
       +jobs/cancel <#>=<reason>
       +jobs/transfer <#>=<category>  - Move a job to a different category/queue
       +jobs/from <name>              - List all jobs associated with a player (staff only)
+      +jobs/search <terms> [<filter>=<value> ...]
+                                 - Search live and archived job text (staff only)
+                                   Filters: queue, status, requester, after, before
+                                   (YYYY-MM-DD), strategic (yes/no), house, org;
+                                   quote values with spaces: house="House Atreides"
       +jobs/clear_archive        - Clear all archived jobs and reset job numbers (Admin only)
       
       Architect-Level Commands (Staff only):
@@ -161,6 +189,8 @@ class CmdJobs(MuxCommand):
             self.transfer_job()
         elif "from" in self.switches:
             self.list_jobs_from_player()
+        elif "search" in self.switches:
+            self.search_jobs()
         elif "clear_archive" in self.switches:
             self.clear_archive()
         elif "strategic" in self.switches:
@@ -179,14 +209,16 @@ class CmdJobs(MuxCommand):
             self.caller.msg("Invalid switch. See help +jobs for usage.")
 
     def list_jobs(self):
+        account = self.caller.account
         if self.caller.check_permstring("Admin"):
-            jobs = Job.objects.filter(status__in=['open', 'claimed']).order_by('-created_at')
+            jobs = Job.objects.filter(status__in=['open', 'claimed'])
         else:
             jobs = Job.objects.filter(
-                models.Q(requester=self.caller.account) |
-                models.Q(participants=self.caller.account),
+                models.Q(requester=account) |
+                models.Q(participants=account),
                 status__in=['open', 'claimed']
-            ).distinct().order_by('-created_at')
+            ).distinct()
+        jobs = list(jobs.select_related(*JOB_LIST_RELATED).order_by('-created_at'))
 
         if not jobs:
             self.caller.msg("You have no open jobs.")
@@ -222,7 +254,7 @@ class CmdJobs(MuxCommand):
             originator = job.requester.username if job.requester else "-----"
             
             # Check if job has been viewed by this user
-            unread = job.is_updated_since_last_view(self.caller.account)
+            unread = job.is_updated_since_last_view(account)
             # Check if job is strategic
             is_strategic = hasattr(job.db, 'strategic') and job.db.strategic
             
@@ -256,7 +288,9 @@ class CmdJobs(MuxCommand):
 
     def view_job(self):
         try:
-            job_id = int(self.args)
+            job_ref, _, comment_page = self.args.partition("/")
+            job_id = int(job_ref)
+            comment_page = int(comment_page) if comment_page.strip() else None
             job = Job.objects.get(id=job_id, archive_id__isnull=True)
             
             if not self.caller.check_permstring("Admin") and job.requester != self.caller.account and job.assignee != self.caller.account and self.caller.account not in job.participants.all():
@@ -272,8 +306,9 @@ class CmdJobs(MuxCommand):
             output += f"|cRequester:|n {job.requester.username}\n"
             output += f"|cAssignee:|n {job.assignee.username if job.assignee else '-----'}\n"
             output += f"|cQueue:|n {job.queue.name}\n"
-            output += f"|cCreated At:|n {job.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            output += f"|cClosed At:|n {job.closed_at.strftime('%Y-%m-%d %H:%M:%S') if job.closed_at else '-----'}\n"
+            formatter = TIME_MANAGER.get_formatter(self.caller)
+            output += f"|cCreated At:|n {formatter.format(job.created_at, JOB_TIME_FORMAT)}\n"
+            output += f"|cClosed At:|n {formatter.format(job.closed_at, JOB_TIME_FORMAT) or '-----'}\n"
             
             # Display strategic information if applicable
             if hasattr(job.db, 'strategic') and job.db.strategic:
@@ -339,11 +374,15 @@ class CmdJobs(MuxCommand):
                 if i < len(paragraphs) - 1:
                     output += "\n"
             
-            if job.comments:
-                output += "|c" + "Comments".center(78, "-") + "|n\n"
-                for comment in job.comments:
+            comments = job.comments or []
+            if comments:
+                start, end, comment_page, pages = get_comment_page(len(comments), comment_page)
+                output += "|c" + f"Comments ({start + 1}-{end} of {len(comments)})".center(78, "-") + "|n\n"
+                for comment in comments[start:end]:
                     output += f"|c{comment['author']} [{comment['created_at']}]:|n\n"
                     output += comment['text'] + "\n\n"
+                if pages > 1:
+                    output += f"|xComment page {comment_page} of {pages}. Use +jobs {job.id}/<page> to see others.|n\n"
             
             output += footer(width=78, color="|r")
             self.caller.msg(output)
@@ -429,6 +468,8 @@ class CmdJobs(MuxCommand):
                 status='open'
             )
 
+            JOB_SEARCH.update_job(job)
+
             # Notify the creator
             self.caller.msg(f"|gJob '{title}' created with ID {job.id} in category {category}.|n")
             
@@ -445,6 +486,7 @@ class CmdJobs(MuxCommand):
                 job.assignee = queue.automatic_assignee
                 job.status = 'claimed'
                 job.save()
+                JOB_SEARCH.update_job(job)
                 self.caller.msg(f"|yJob automatically assigned to {queue.automatic_assignee}.|n")
                 
                 # Notify the assignee
@@ -532,6 +574,8 @@ class CmdJobs(MuxCommand):
                 status='open'
             )
 
+            JOB_SEARCH.update_job(job)
+
             # Notify the creator
             self.caller.msg(f"|gJob '{title}' created with ID {job.id} in category {category}.|n")
             
@@ -548,6 +592,7 @@ class CmdJobs(MuxCommand):
                 job.assignee = queue.automatic_assignee
                 job.status = 'claimed'
                 job.save()
+                JOB_SEARCH.update_job(job)
                 self.caller.msg(f"|yJob automatically assigned to {queue.automatic_assignee}.|n")
                 
                 # Notify the assignee
@@ -604,6 +649,7 @@ class CmdJobs(MuxCommand):
                 job.comments = []
             job.comments.append(new_comment)
             job.save()
+            JOB_SEARCH.update_job(job)
 
             self.caller.msg(f"Comment added to job #{job_id}.")
             self.post_to_jobs_channel(self.caller.name, job.id, "commented on")
@@ -711,6 +757,7 @@ class CmdJobs(MuxCommand):
                 job.comments = []
             job.comments.append(new_comment)
             job.save()
+            JOB_SEARCH.update_job(job)
             
             self.caller.msg(f"Player {player.username} successfully added to job #{job_id}.")
             self.post_to_jobs_channel(self.caller.name, job.id, f"added {player.username} to")
@@ -830,6 +877,7 @@ class CmdJobs(MuxCommand):
             try:
                 job.participants.remove(player)
                 job.save()
+                JOB_SEARCH.update_job(job)
                 self.caller.msg(f"Player {player_username} removed from job #{job_id}.")
                 self.post_to_jobs_channel(self.caller.name, job.id, f"removed {player_username} from")
             except Exception as e:
@@ -874,6 +922,7 @@ class CmdJobs(MuxCommand):
             job.assignee = staff
             job.status = 'claimed'
             job.save()
+            JOB_SEARCH.update_job(job)
 
             self.caller.msg(f"Job #{job_id} assigned to {staff.username}.")
             self.post_to_jobs_channel(self.caller.name, job.id, f"assigned to {staff.username}")
@@ -910,6 +959,7 @@ class CmdJobs(MuxCommand):
             job.assignee = self.caller.account
             job.status = 'claimed'
             job.save()
+            JOB_SEARCH.update_job(job)
 
             self.caller.msg(f"You have claimed job #{job_id}.")
             self.post_to_jobs_channel(self.caller.name, job.id, "claimed")
@@ -945,6 +995,7 @@ class CmdJobs(MuxCommand):
             job.assignee = None
             job.status = 'open'
             job.save()
+            JOB_SEARCH.update_job(job)
 
             self.caller.msg(f"You have unclaimed job #{job_id}.")
             self.post_to_jobs_channel(self.caller.name, job.id, "unclaimed")
@@ -1043,20 +1094,8 @@ class CmdJobs(MuxCommand):
 
             # Use transaction to ensure consistency
             with transaction.atomic():
-                # Get the maximum archive_id from both tables
-                max_archived = ArchivedJob.objects.aggregate(models.Max('archive_id'))['archive_id__max'] or 0
-                max_job = Job.objects.exclude(archive_id__isnull=True).aggregate(models.Max('archive_id'))['archive_id__max'] or 0
-                next_archive_id = max(max_archived, max_job) + 1
-                
-                logger.log_info(f"Max archive_id from ArchivedJob: {max_archived}")
-                logger.log_info(f"Max archive_id from Job: {max_job}")
-                logger.log_info(f"Calculated next_archive_id: {next_archive_id}")
-
-                # Verify the archive_id is truly unique
-                while (ArchivedJob.objects.filter(archive_id=next_archive_id).exists() or 
-                       Job.objects.filter(archive_id=next_archive_id).exists()):
-                    next_archive_id += 1
-                    logger.log_info(f"Archive ID {next_archive_id-1} was taken, trying {next_archive_id}")
+                # Get the next archive_id
+                next_archive_id = allocate_archive_id()
 
                 # Create comments text
                 comments_text = "\n\n".join([f"{comment['author']} [{comment['created_at']}]: {comment['text']}" 
@@ -1085,14 +1124,6 @@ class CmdJobs(MuxCommand):
                 )
                 logger.log_info(f"Successfully created archived job with archive_id: {archived_job.archive_id}")
 
-                # Double-check for conflicts one last time
-                conflicts = Job.objects.filter(archive_id=next_archive_id)
-                if conflicts.exists():
-                    logger.log_err(f"WARNING: Found {conflicts.count()} jobs with archive_id {next_archive_id}")
-                    for j in conflicts:
-                        logger.log_err(f"Conflicting job: #{j.id} - {j.title}")
-                    raise Exception(f"Archive ID {next_archive_id} is already in use")
-
                 # Now update and save the original job
                 job.status = 'closed'
                 job.approved = True
@@ -1111,6 +1142,7 @@ class CmdJobs(MuxCommand):
                 logger.log_info(f"Attempting to save job #{job.id} with archive_id: {job.archive_id}")
                 job.save()
                 logger.log_info(f"Successfully saved job #{job.id}")
+            JOB_SEARCH.update_job(job)
 
             # Notify the requester
             if job.requester and job.requester != self.caller.account:
@@ -1156,8 +1188,7 @@ class CmdJobs(MuxCommand):
             # Use transaction to ensure consistency
             with transaction.atomic():
                 # Get the next archive_id
-                max_archive_id = ArchivedJob.objects.aggregate(models.Max('archive_id'))['archive_id__max'] or 0
-                next_archive_id = max_archive_id + 1
+                next_archive_id = allocate_archive_id()
 
                 # Create comments text
                 comments_text = "\n\n".join([f"{comment['author']} [{comment['created_at']}]: {comment['text']}" 
@@ -1196,6 +1227,7 @@ class CmdJobs(MuxCommand):
                     })
 
                 job.save()
+            JOB_SEARCH.update_job(job)
 
             self.caller.msg(f"Job #{job_id} has been rejected and archived.")
             
@@ -1309,6 +1341,7 @@ class CmdJobs(MuxCommand):
 
             job.assignee = new_assignee
             job.save()
+            JOB_SEARCH.update_job(job)
             self.caller.msg(f"Job '{job.title}' reassigned to {new_assignee.username}.")
             
             # Notify the new assignee
@@ -1328,9 +1361,9 @@ class CmdJobs(MuxCommand):
         queue_name = self.args.strip()
         try:
             queue = Queue.objects.get(name__iexact=queue_name)
-            jobs = Job.objects.filter(queue=queue).order_by('status')
+            jobs = list(Job.objects.filter(queue=queue).select_related(*JOB_LIST_RELATED).order_by('status'))
 
-            if not jobs.exists():
+            if not jobs:
                 self.caller.msg(f"No jobs found in the queue '{queue_name}'.")
                 return
 
@@ -1357,9 +1390,10 @@ class CmdJobs(MuxCommand):
             return
 
         object_name = self.args.strip()
-        attachments = JobAttachment.objects.filter(object__db_key__iexact=object_name)
+        attachments = list(JobAttachment.objects.filter(object__db_key__iexact=object_name)
+                           .select_related(*(f"job__{field}" for field in JOB_LIST_RELATED)))
 
-        if not attachments.exists():
+        if not attachments:
             self.caller.msg(f"No jobs found with the object '{object_name}' attached.")
             return
 
@@ -1388,9 +1422,29 @@ class CmdJobs(MuxCommand):
             self.caller.msg("You don't have permission to view archived jobs.")
             return
 
-        if not self.args:
-            # List all archived jobs
-            archived_jobs = ArchivedJob.objects.all().order_by('-closed_at')
+        if not self.args.strip().isdigit():
+            # Browse archived jobs a page at a time, newest first
+            if "next" in self.switches:
+                browse = self.caller.ndb.job_archive_browse
+                if not browse or not browse['cursor']:
+                    self.caller.msg("There are no more archived jobs to show. Use +jobs/archive to start over.")
+                    return
+                filters = browse['filters']
+            else:
+                filters = dict(match.groups() for match in re.finditer(r"(\w+)\s*=\s*(\S+)", self.args))
+                browse = {'filters': filters, 'cursor': None}
+                unknown = set(filters) - {"queue", "requester"}
+                if unknown or (self.args.strip() and not filters):
+                    self.caller.msg("Usage: +jobs/archive [queue=<queue>] [requester=<player>]")
+                    return
+
+            archived_jobs = ArchivedJob.objects.select_related(*JOB_LIST_RELATED)
+            if filters.get("queue"):
+                archived_jobs = archived_jobs.filter(queue__name__iexact=filters["queue"])
+            if filters.get("requester"):
+                archived_jobs = archived_jobs.filter(requester__username__iexact=filters["requester"])
+            archived_jobs, browse['cursor'] = get_archive_page(archived_jobs, browse['cursor'])
+            self.caller.ndb.job_archive_browse = browse
             if not archived_jobs:
                 self.caller.msg("There are no archived jobs.")
                 return
@@ -1403,6 +1457,7 @@ class CmdJobs(MuxCommand):
             output += ANSIString("|r" + "-" * 78 + "|n") + "\n"
 
             # Add each job as a row
+            formatter = TIME_MANAGER.get_formatter(self.caller)
             for job in archived_jobs:
                 # Handle potentially deleted users
                 assignee_name = job.assignee.username if job.assignee else "-----"
@@ -1412,12 +1467,14 @@ class CmdJobs(MuxCommand):
                     f"{job.original_id:<6}"
                     f"{crop(job.queue.name, width=10):<11}"
                     f"{crop(job.title, width=25):<25}"
-                    f"{job.closed_at.strftime('%m/%d/%y'):<9}"
+                    f"{formatter.format(job.closed_at, '%m/%d/%y'):<9}"
                     f"{crop(assignee_name, width=17):<18}"
                     f"{requester_name}"
                 )
                 output += row + "\n"
 
+            if browse['cursor']:
+                output += "|xMore archived jobs: +jobs/archive/next|n\n"
             output += footer(width=78, color="|r")
             self.caller.msg(output)
 
@@ -1442,8 +1499,9 @@ class CmdJobs(MuxCommand):
                 output += f"|cRequester:|n {requester_name}\n"
                 output += f"|cAssignee:|n {assignee_name}\n"
                 output += f"|cQueue:|n {archived_job.queue.name}\n"
-                output += f"|cCreated At:|n {archived_job.created_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
-                output += f"|cClosed At:|n {archived_job.closed_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                formatter = TIME_MANAGER.get_formatter(self.caller)
+                output += f"|cCreated At:|n {formatter.format(archived_job.created_at, JOB_TIME_FORMAT)}\n"
+                output += f"|cClosed At:|n {formatter.format(archived_job.closed_at, JOB_TIME_FORMAT)}\n"
                 
                 output += "|c" + "Description".center(78, "-") + "|n\n"
                 output += archived_job.description + "\n\n"
@@ -1493,7 +1551,7 @@ class CmdJobs(MuxCommand):
             self.caller.msg("Created a new 'Jobs' channel for job notifications.")
 
         message = f"{player_name} {action} Job #{job_id}"
-        channel.msg(f"[Job System] {message}")
+        JOB_NOTIFIER.queue_channel_post(channel, f"[Job System] {message}")
 
     def send_mail_notification(self, job, message, to_account=None):
         """Send a mail notification to a specific account."""
@@ -1512,44 +1570,9 @@ class CmdJobs(MuxCommand):
         if recipient == self.caller.account and not force_send:
             return
             
-        try:
-            subject = f"Job #{job.id} Update"
-            mail_body = f"Job #{job.id}: {job.title}\n\n{message}"
-            
-            # Import at function level to avoid circular imports
-            from evennia.utils import create
-            from evennia.comms.models import Msg
-            
-            # Create the mail message
-            new_mail = create.create_message(
-                self.caller.account,  # sender
-                mail_body,            # message
-                receivers=recipient,  # receiver
-                header=subject        # subject
-            )
-            
-            if not new_mail:
-                logger.log_err(f"Failed to create message object for {recipient.username}")
-                return
-                
-            # Explicitly save to ensure changes are persisted
-            new_mail.save()
-            
-            # Tag it as new and job notification - this is crucial for mail to appear in mailbox
-            new_mail.tags.add("new", category="mail")
-            new_mail.tags.add("mail", category="mail")  # Ensure it's tagged as mail
-            new_mail.tags.add("job", category="mail")   # Tag as job notification
-            
-            # Only show success message if we actually sent the mail
-            if recipient.is_connected:
-                # Notify the connected player directly that they have mail
-                recipient.msg(f"|yYou have received new mail about job #{job.id}. Type '@mail' to view.|n")
-            
-            self.caller.msg(f"Notification sent to {recipient.username}.")
-                
-        except Exception as e:
-            logger.log_err(f"Failed to send job notification: {str(e)}")
-            self.caller.msg(f"Failed to send notification: {str(e)}")
+        # Mail is created and delivered after the command returns
+        JOB_NOTIFIER.queue_mail(job, self.caller.account, recipient, message)
+        self.caller.msg(f"Notification sent to {recipient.username}.")
 
     def send_mail_to_all_participants(self, job, message, exclude_account=None):
         """Send a mail notification to all participants in a job."""
@@ -1597,69 +1620,26 @@ class CmdJobs(MuxCommand):
             staff_participants.remove(self.caller.account)
             
         # First handle staff notifications (direct message, no mail)
+        action_by = self.caller.name if hasattr(self.caller, 'name') else self.caller.key
         for staff in staff_participants:
-            if staff.is_connected:
-                # Send a direct notification about the job update
-                action_by = self.caller.name if hasattr(self.caller, 'name') else self.caller.key
-                for session in staff.sessions.all():
-                    session.msg(f"|yJob #{job.id} update: {action_by} has made changes to this job.|n")
+            JOB_NOTIFIER.queue_staff_notice(job, staff, action_by)
             
         # If we don't have any non-staff recipients, return early
         if not participants:
             return
             
-        # Send mail to non-staff participants using the proper mail API
-        try:
-            subject = f"Job #{job.id} Update"
-            mail_body = f"Job #{job.id}: {job.title}\n\n{message}"
-            
-            from evennia.utils import create
-            
-            # Create and send mail to each participant (create_message only takes one receiver at a time)
-            participant_names = []
-            success_count = 0
-            
-            for participant in participants:
-                if not participant.username:
-                    logger.log_err(f"Participant has no username, skipping")
-                    continue
-                
-                try:
-                    # Create a mail message
-                    new_mail = create.create_message(
-                        self.caller.account,  # sender
-                        mail_body,            # message
-                        receivers=participant, # receiver
-                        header=subject        # subject
-                    )
-                    
-                    if not new_mail:
-                        logger.log_err(f"Failed to create message for {participant.username}")
-                        continue
-                        
-                    # Tag it as new and also as job notification
-                    new_mail.tags.add("new", category="mail")
-                    new_mail.tags.add("mail", category="mail")  # Ensure it's tagged as mail
-                    new_mail.tags.add("job", category="mail")   # Also tag as job notification
-                    
-                    participant_names.append(participant.username)
-                    success_count += 1
-                    
-                    # If participant is online, notify them directly
-                    if participant.is_connected:
-                        # Notify the connected player directly that they have mail
-                        for session in participant.sessions.all():
-                            session.msg(f"|yYou have received new mail about job #{job.id}. Type '@mail' to view.|n")
-                    
-                except Exception as e:
-                    logger.log_err(f"Error sending to {participant.username}: {str(e)}")
-            
-            if participant_names:
-                self.caller.msg(f"Notifications sent to: {', '.join(participant_names)}")
-            
-        except Exception as e:
-            logger.log_err(f"Failed to send job notifications: {str(e)}")
-            self.caller.msg(f"Failed to send notifications: {str(e)}")
+        # Queue mail to non-staff participants; it is created in bulk and
+        # delivered after the command returns
+        participant_names = []
+        for participant in participants:
+            if not participant.username:
+                logger.log_err(f"Participant has no username, skipping")
+                continue
+            JOB_NOTIFIER.queue_mail(job, self.caller.account, participant, message)
+            participant_names.append(participant.username)
+        
+        if participant_names:
+            self.caller.msg(f"Notifications sent to: {', '.join(participant_names)}")
 
     def complete_job(self):
         self._change_job_status("completed")
@@ -1690,8 +1670,7 @@ class CmdJobs(MuxCommand):
             # Use transaction to ensure consistency
             with transaction.atomic():
                 # Get the next archive_id
-                max_archive_id = ArchivedJob.objects.aggregate(models.Max('archive_id'))['archive_id__max'] or 0
-                next_archive_id = max_archive_id + 1
+                next_archive_id = allocate_archive_id()
 
                 # Create comments text
                 comments_text = "\n\n".join([f"{comment['author']} [{comment['created_at']}]: {comment['text']}" 
@@ -1728,6 +1707,7 @@ class CmdJobs(MuxCommand):
                 })
 
                 job.save()
+            JOB_SEARCH.update_job(job)
 
             self.caller.msg(f"Job #{job_id} has been {new_status} and archived.")
             
@@ -1755,20 +1735,22 @@ class CmdJobs(MuxCommand):
         output += format_stat("Note Title:", note.name, width=width) + "\n"
         output += format_stat("Visibility:", "Public" if note.is_public else "Private", width=width) + "\n"
         
+        formatter = TIME_MANAGER.get_formatter(self.caller)
+
         # Show approval status and details
         if note.is_approved:
             output += format_stat("Approved:", "Yes", width=width) + "\n"
             if note.approved_by:
                 output += format_stat("Approved By:", note.approved_by, width=width) + "\n"
             if note.approved_at:
-                output += format_stat("Approved At:", note.approved_at.strftime("%Y-%m-%d %H:%M:%S"), width=width) + "\n"
+                output += format_stat("Approved At:", formatter.format(note.approved_at, JOB_TIME_FORMAT), width=width) + "\n"
         else:
             output += format_stat("Approved:", "No", width=width) + "\n"
 
         # Show creation and update times for staff
         if self.caller.check_permstring("Builders"):
-            output += format_stat("Created:", note.created_at.strftime("%Y-%m-%d %H:%M:%S"), width=width) + "\n"
-            output += format_stat("Updated:", note.updated_at.strftime("%Y-%m-%d %H:%M:%S"), width=width) + "\n"
+            output += format_stat("Created:", formatter.format(note.created_at, JOB_TIME_FORMAT), width=width) + "\n"
+            output += format_stat("Updated:", formatter.format(note.updated_at, JOB_TIME_FORMAT), width=width) + "\n"
 
         output += divider(width=width, char="-", color="|r") + "\n"
         
@@ -1793,19 +1775,21 @@ class CmdJobs(MuxCommand):
 
     def list_my_jobs(self):
         """List jobs that are relevant to the caller."""
+        account = self.caller.account
         if self.caller.check_permstring("Admin"):
             # For staff, show jobs they created or are assigned to
             jobs = Job.objects.filter(
-                models.Q(requester=self.caller.account) |
-                models.Q(assignee=self.caller.account),
+                models.Q(requester=account) |
+                models.Q(assignee=account),
                 status__in=['open', 'claimed']
-            ).distinct().order_by('-created_at')
+            ).distinct()
         else:
             # For players, show only jobs they created
             jobs = Job.objects.filter(
-                requester=self.caller.account,
+                requester=account,
                 status__in=['open', 'claimed']
-            ).order_by('-created_at')
+            )
+        jobs = list(jobs.select_related(*JOB_LIST_RELATED).order_by('-created_at'))
 
         if not jobs:
             self.caller.msg("You have no open jobs.")
@@ -1824,7 +1808,7 @@ class CmdJobs(MuxCommand):
             originator = job.requester.username if job.requester else "-----"
             
             # Check if job has been viewed by this user
-            unread = job.is_updated_since_last_view(self.caller.account)
+            unread = job.is_updated_since_last_view(account)
             title_marker = "|r*|n " if unread else "  "
             
             row = (
@@ -1908,6 +1892,7 @@ class CmdJobs(MuxCommand):
                 self.caller.msg(f"Could not fully restore participants: {e}")
 
             new_job.save()
+            JOB_SEARCH.update_job(new_job)
 
             self.caller.msg(f"Job #{job_id} has been reopened as Job #{new_job.id}.")
             self.post_to_jobs_channel(self.caller.name, new_job.id, f"reopened (was Job #{job_id})")
@@ -1941,10 +1926,11 @@ class CmdJobs(MuxCommand):
             self.caller.msg("You don't have permission to use this command.")
             return
 
-        jobs = Job.objects.filter(
-            assignee=self.caller.account,
+        account = self.caller.account
+        jobs = list(Job.objects.filter(
+            assignee=account,
             status__in=['open', 'claimed']
-        ).order_by('-created_at')
+        ).select_related(*JOB_LIST_RELATED).order_by('-created_at'))
 
         if not jobs:
             self.caller.msg("You have no jobs assigned to you.")
@@ -1962,7 +1948,7 @@ class CmdJobs(MuxCommand):
             originator = job.requester.username if job.requester else "-----"
             
             # Check if job has been viewed by this user
-            unread = job.is_updated_since_last_view(self.caller.account)
+            unread = job.is_updated_since_last_view(account)
             title_marker = "|r*|n " if unread else "  "
             
             row = (
@@ -2090,6 +2076,9 @@ class CmdJobs(MuxCommand):
                 # Delete all jobs without archive_id
                 Job.objects.filter(archive_id__isnull=True).delete()
 
+                # Start archive numbering over with the archive
+                reset_archive_ids()
+
                 # Reset sequences based on database engine
                 with connection.cursor() as cursor:
                     db_engine = connection.settings_dict['ENGINE']
@@ -2143,6 +2132,9 @@ class CmdJobs(MuxCommand):
                     logger.log_info(f"Job #{new_id} should have participants: {', '.join(job_info['participant_usernames'])}")
                     logger.log_info(f"Job #{new_id} actually has participants: {', '.join(new_participant_usernames)}")
 
+            # Every job number changed; the job_search script rebuilds the index
+            JOB_SEARCH.reset()
+
             # After transaction, handle SQLite VACUUM separately
             if 'sqlite' in connection.settings_dict['ENGINE']:
                 with connection.cursor() as cursor:
@@ -2211,6 +2203,7 @@ class CmdJobs(MuxCommand):
             
             # Save the job with its new queue
             job.save()
+            JOB_SEARCH.update_job(job)
             
             self.caller.msg(f"Job #{job_id} transferred from {old_category} to {new_category}.")
             self.post_to_jobs_channel(self.caller.name, job.id, f"transferred from {old_category} to {new_category}")
@@ -2225,6 +2218,7 @@ class CmdJobs(MuxCommand):
                 job.assignee = new_queue.automatic_assignee
                 job.status = 'claimed'
                 job.save()
+                JOB_SEARCH.update_job(job)
                 
                 assignee_username = new_queue.automatic_assignee.username
                 self.caller.msg(f"Job automatically reassigned to {assignee_username}.")
@@ -2247,6 +2241,60 @@ class CmdJobs(MuxCommand):
             logger.log_err(f"Job transfer error for {self.caller.name}, job {job_id}: {str(e)}")
             self.caller.msg(f"|rAn error occurred while transferring the job. The issue has been logged. Please contact staff.|n")
 
+    def search_jobs(self):
+        """Search job titles, descriptions and comments (staff only)."""
+        if not self.caller.check_permstring("Admin"):
+            self.caller.msg("You don't have permission to search jobs.")
+            return
+
+        filters = {}
+        for match in re.finditer(r'(\w+)=("[^"]*"|\S+)', self.args):
+            filters[match.group(1).lower()] = match.group(2).strip('"')
+        terms = re.sub(r'(\w+)=("[^"]*"|\S+)', " ", self.args).strip()
+        unknown = set(filters) - set(JOB_SEARCH_FILTERS)
+        if unknown or not (terms or filters):
+            self.caller.msg("Usage: +jobs/search <terms> [<filter>=<value> ...]")
+            self.caller.msg(f"Filters: {', '.join(JOB_SEARCH_FILTERS)}")
+            return
+
+        try:
+            for field in ("after", "before"):
+                if field in filters:
+                    filters[field] = int(datetime.strptime(filters[field], "%Y-%m-%d")
+                                         .replace(tzinfo=dt_timezone.utc).timestamp())
+        except ValueError:
+            self.caller.msg("Dates must be given as YYYY-MM-DD.")
+            return
+        if "strategic" in filters:
+            filters["strategic"] = filters["strategic"].lower() in ("yes", "y", "true", "1")
+
+        results, total = JOB_SEARCH.search(terms, filters, limit=JOB_SEARCH_LIMIT)
+        if not JOB_SEARCH.ready:
+            self.caller.msg("|yThe job search index is still being built; results may be incomplete.|n")
+        if not results:
+            self.caller.msg("No jobs match that search.")
+            return
+
+        formatter = TIME_MANAGER.get_formatter(self.caller)
+        output = header(f"Job Search ({total} match{'es' if total != 1 else ''})", width=78, color="|r") + "\n"
+        output += "|cJob #  Queue      Job Title                 Created   Status    Requester|n\n"
+        output += ANSIString("|r" + "-" * 78 + "|n") + "\n"
+        for doc in results:
+            status = f"{doc.status}{'*' if doc.archived else ''}"
+            output += (
+                f"{doc.job_id:<6}"
+                f"{crop(doc.queue, width=10):<11}"
+                f"{crop(doc.title, width=25):<26}"
+                f"{formatter.format(doc.created_at, '%m/%d/%y'):<10}"
+                f"{crop(status, width=9):<10}"
+                f"{doc.requester}\n"
+            )
+        if total > len(results):
+            output += f"|xShowing the best {len(results)} matches. Add terms or filters to narrow the search.|n\n"
+        output += footer(width=78, color="|r")
+        output += "\n|xLegend: * = Archived (+jobs/archive <#>)|n\n"
+        self.caller.msg(output)
+
     def list_jobs_from_player(self):
         """List all jobs associated with a player (staff only)."""
         if not self.caller.check_permstring("Admin"):
@@ -2277,22 +2325,24 @@ class CmdJobs(MuxCommand):
             player_username = player.username
 
             # Find active jobs where player is requester, participant, or assignee
-            active_jobs = Job.objects.filter(
+            active_jobs = list(Job.objects.filter(
                 models.Q(requester=player) |
                 models.Q(participants=player) |
                 models.Q(assignee=player),
                 archive_id__isnull=True
-            ).distinct().order_by('-created_at')
+            ).distinct().select_related(*JOB_LIST_RELATED).prefetch_related('participants').order_by('-created_at'))
             
-            # Find archived jobs where player was requester or assignee
+            # Find archived jobs where player was requester or assignee;
+            # only the most recently closed page is listed
             archived_jobs = ArchivedJob.objects.filter(
                 models.Q(requester=player) |
                 models.Q(assignee=player)
-            ).distinct().order_by('-closed_at')
+            ).select_related(*JOB_LIST_RELATED)
+            archived_count = archived_jobs.count()
+            archived_jobs, _ = get_archive_page(archived_jobs)
             
             # Count of each type
-            active_count = active_jobs.count()
-            archived_count = archived_jobs.count()
+            active_count = len(active_jobs)
             total_count = active_count + archived_count
 
             if total_count == 0:
@@ -2373,6 +2423,10 @@ class CmdJobs(MuxCommand):
                     row = f"{job_id}{queue}{title}{role_display}{status}{archived}"
                     output += row + "\n"
 
+                if archived_count > len(archived_jobs):
+                    output += (f"|xShowing the {len(archived_jobs)} most recently closed of {archived_count} "
+                               f"archived jobs. Use +jobs/archive requester={player_username} for more.|n\n")
+
             output += footer(width=78, color="|r")
             self.caller.msg(output)
             
@@ -2489,6 +2543,7 @@ class CmdJobs(MuxCommand):
                     'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
                 })
                 job.save()
+                JOB_SEARCH.update_job(job)
                 
                 self.caller.msg(f"|gJob #{job_id} marked as STRATEGIC.|n")
                 self.post_to_jobs_channel(self.caller.name, job.id, "marked as strategic")
@@ -2503,6 +2558,7 @@ class CmdJobs(MuxCommand):
                     'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
                 })
                 job.save()
+                JOB_SEARCH.update_job(job)
                 
                 self.caller.msg(f"|yJob #{job_id} no longer marked as strategic.|n")
                 self.post_to_jobs_channel(self.caller.name, job.id, "removed strategic status")
@@ -2561,6 +2617,7 @@ class CmdJobs(MuxCommand):
                 'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
             })
             job.save()
+            JOB_SEARCH.update_job(job)
             
             self.caller.msg(f"|gJob #{job_id} linked to {conflict_type.upper()} conflict.|n")
             self.post_to_jobs_channel(self.caller.name, job.id, f"linked to {conflict_type} conflict")
@@ -2643,6 +2700,7 @@ class CmdJobs(MuxCommand):
                 'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
             })
             job.save()
+            JOB_SEARCH.update_job(job)
             
             self.caller.msg(f"|gTracked influence change: {sign}{amount} with {target}|n")
             self.post_to_jobs_channel(self.caller.name, job.id, f"tracked influence change ({sign}{amount} {target})")
@@ -2791,6 +2849,7 @@ class CmdJobs(MuxCommand):
                     'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
                 })
                 job.save()
+                JOB_SEARCH.update_job(job)
                 
                 self.caller.msg(f"|gHouse {house_name} added to job #{job_id} strategic tracking.|n")
                 self.post_to_jobs_channel(self.caller.name, job.id, f"added House {house_name} to tracking")
@@ -2856,6 +2915,7 @@ class CmdJobs(MuxCommand):
                     'created_at': timezone.now().strftime('%Y-%m-%d %H:%M:%S')
                 })
                 job.save()
+                JOB_SEARCH.update_job(job)
                 
                 self.caller.msg(f"|gOrganization {org_name} added to job #{job_id} strategic tracking.|n")
                 self.post_to_jobs_channel(self.caller.name, job.id, f"added Organization {org_name} to tracking")
@@ -2915,71 +2975,26 @@ class CmdJobs(MuxCommand):
                 staff_participants.remove(account)
             
         # Handle staff notifications (direct message, no mail)
+        action_by = self.caller.name if hasattr(self.caller, 'name') else self.caller.key
         for staff in staff_participants:
-            if staff.is_connected:
-                # Send a direct notification about the job update
-                action_by = self.caller.name if hasattr(self.caller, 'name') else self.caller.key
-                for session in staff.sessions.all():
-                    session.msg(f"|yA change has been made by {action_by} on Job #{job.id}.|n")
+            JOB_NOTIFIER.queue_staff_notice(job, staff, action_by)
             
         # If we don't have any non-staff recipients, return early
         if not participants:
             return
             
-        # Send mail to non-staff participants using the proper mail API
-        try:
-            subject = f"Job #{job.id} Update"
-            mail_body = f"Job #{job.id}: {job.title}\n\n{message}"
-            
-            from evennia.utils import create
-            
-            # Create and send mail to each participant
-            participant_names = []
-            success_count = 0
-            
-            for participant in participants:
-                if not participant.username:
-                    logger.log_err(f"Participant has no username, skipping")
-                    continue
-                    
-                try:
-                    # Create a mail message
-                    new_mail = create.create_message(
-                        self.caller.account,  # sender
-                        mail_body,            # message
-                        receivers=participant, # receiver
-                        header=subject        # subject
-                    )
-                    
-                    if not new_mail:
-                        logger.log_err(f"Failed to create message for {participant.username}")
-                        continue
-                        
-                    # Tag it properly with mail and job tags
-                    new_mail.tags.add("new", category="mail")
-                    new_mail.tags.add("mail", category="mail")  # Ensure mail tag is present
-                    new_mail.tags.add("job", category="mail")   # Tag as job notification
-                    
-                    participant_names.append(participant.username)
-                    success_count += 1
-                    
-                    # If participant is online, notify them directly
-                    if participant.is_connected:
-                        # Notify the connected player directly that they have mail
-                        for session in participant.sessions.all():
-                            session.msg(f"|yYou have received new mail about job #{job.id}. Type '@mail' to view.|n")
-                    
-                except Exception as e:
-                    logger.log_err(f"Error sending to {participant.username}: {str(e)}")
-            
-            if participant_names:
-                self.caller.msg(f"Notifications sent to: {', '.join(participant_names)}")
-            else:
-                logger.log_err(f"Failed to send any notifications")
-            
-        except Exception as e:
-            logger.log_err(f"Failed to send job notifications: {str(e)}")
-            self.caller.msg(f"|rFailed to send notifications. The issue has been logged.|n")
+        # Queue mail to non-staff participants; it is created in bulk and
+        # delivered after the command returns
+        participant_names = []
+        for participant in participants:
+            if not participant.username:
+                logger.log_err(f"Participant has no username, skipping")
+                continue
+            JOB_NOTIFIER.queue_mail(job, self.caller.account, participant, message)
+            participant_names.append(participant.username)
+        
+        if participant_names:
+            self.caller.msg(f"Notifications sent to: {', '.join(participant_names)}")
 
 class JobSystemCmdSet(CmdSet):
     """
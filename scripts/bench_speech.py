@@ -0,0 +1,96 @@
+"""
+Speech Rendering Micro-Benchmark
+
+Measures the per-receiver cost of fanning out a language-tagged pose as
+the pose grows. With compiled pose templates the cost per receiver should
+stay flat: the pose is tokenized once and each comprehension group renders
+it once, so receivers only pay for a cached lookup and a msg() call.
+
+Usage:
+    @py from scripts.bench_speech import run_benchmark; run_benchmark()
+"""
+
+import time
+
+from utils.speech import compile_pose, group_by_comprehension, fan_out, NOT_UNDERSTANDS
+
+
+class _BenchListener:
+    """Minimal stand-in for a puppeted character."""
+
+    def __init__(self, key, languages):
+        self.key = key
+        self.languages = set(languages)
+        self.received = 0
+
+    def understands(self, language):
+        return not language or language in self.languages
+
+    def get_display_name(self, looker=None):
+        return self.key
+
+    def msg(self, text):
+        self.received += 1
+
+
+def _make_pose(segments):
+    """Build a pose with the given number of literal/speech segment pairs."""
+    return " ".join(
+        f'gestures toward the window, "~Segment {i} of the conversation."'
+        for i in range(segments)
+    )
+
+
+def bench_pose(segments, receivers=30, rounds=200):
+    """
+    Time compiling a pose and fanning it out to a room.
+
+    Args:
+        segments (int): Number of "~speech" segments in the pose
+        receivers (int): Number of characters in the room
+        rounds (int): Number of poses to send
+
+    Returns:
+        tuple: (microseconds to compile and render each variant once,
+            microseconds per receiver to deliver)
+    """
+    speaker = _BenchListener("Speaker", ["Galach", "Chakobsa"])
+    room = [speaker] + [
+        _BenchListener(f"Listener{i}", ["Galach"] if i % 3 else ["Chakobsa"])
+        for i in range(receivers - 1)
+    ]
+    pose = _make_pose(segments)
+
+    compile_time = 0.0
+    fan_out_time = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        template = compile_pose(pose)
+        for understood in (True, False):
+            template.render(understood, 'Chakobsa')
+        compile_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        groups = group_by_comprehension(speaker, room, "Chakobsa", per_viewer_names=False)
+        fan_out(groups, lambda bucket, viewer: (
+            f"Speaker {template.render(bucket != NOT_UNDERSTANDS, 'Chakobsa')}"))
+        fan_out_time += time.perf_counter() - start
+
+    return compile_time / rounds * 1e6, fan_out_time / (rounds * receivers) * 1e6
+
+
+def run_benchmark():
+    """Print compile and per-receiver cost for increasingly long poses."""
+    print("\n" + "=" * 70)
+    print("BENCHMARK: Pose fan-out, 30 receivers")
+    print("=" * 70)
+    for segments in (1, 4, 16, 64):
+        pose_length = len(_make_pose(segments))
+        compile_cost, receiver_cost = bench_pose(segments)
+        print(f"  {segments:>3} segments ({pose_length:>5} chars): "
+              f"compile+render {compile_cost:8.2f} us/pose, fan-out {receiver_cost:5.2f} us/receiver")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -38,7 +38,12 @@ def at_server_stop():
     This is called just before the server is shut down, regardless
     of it is for a reload, reset or shutdown.
     """
-    pass
+    # Write out buffered scene logs and queued job notifications so
+    # nothing is lost
+    from world.scenes.logger import SCENE_LOGGER
+    from world.utils.job_notifications import JOB_NOTIFIER
+    SCENE_LOGGER.flush()
+    JOB_NOTIFIER.flush()
 
 
 def at_server_reload_start():
@@ -23,6 +23,8 @@ settings file:
 
 from evennia.server.serversession import ServerSession as BaseServerSession
 
+from world.utils.session_activity import SESSION_ACTIVITY
+
 
 class ServerSession(BaseServerSession):
     """
@@ -34,4 +36,11 @@ class ServerSession(BaseServerSession):
     through their session(s).
     """
 
-    pass
+    def update_session_counters(self, idle=False):
+        """
+        Called by the command pipeline for every command entered. Visible
+        (non-idle) commands also update the session activity index.
+        """
+        super().update_session_counters(idle=idle)
+        if not idle and self.puppet:
+            SESSION_ACTIVITY.touch(self.puppet, self.cmd_last_visible)
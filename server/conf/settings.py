@@ -104,6 +104,60 @@ CREATION_THROTTLE_LIMIT = None  # Disable limit (default: 2)
 # We've set CLIENT_DEFAULT_HEIGHT to 45 to ensure reasonable pagination when enabled.
 # We've also made command docstrings more compact to reduce excessive pagination.
 
+######################################################################
+# Game systems
+######################################################################
+
+# Session class that feeds the session activity index used for idle times
+SERVER_SESSION_CLASS = "server.conf.serversession.ServerSession"
+
+# Django apps with game data tables
+INSTALLED_APPS += ["world.scenes", "world.bbs"]
+
+# Scene logs are buffered in memory and flushed by scene_logger; census
+# counters are reconciled in batches and saved by census; bbs_archiver
+# moves posts past their board's retention into the board archive;
+# job_search builds the +jobs/search index after a restart; who_snapshot
+# and bbs_subscribers rebuild the +who rows and BBS subscriber index
+GLOBAL_SCRIPTS = {
+    "scene_logger": {
+        "typeclass": "typeclasses.scenes.SceneLogScript",
+        "repeats": 0,
+        "interval": 60,
+        "persistent": True,
+    },
+    "census": {
+        "typeclass": "typeclasses.census.CensusScript",
+        "repeats": 0,
+        "interval": 60,
+        "persistent": True,
+    },
+    "bbs_archiver": {
+        "typeclass": "typeclasses.bbs_archive.BBSArchiveScript",
+        "repeats": 0,
+        "interval": 300,
+        "persistent": True,
+    },
+    "job_search": {
+        "typeclass": "typeclasses.job_search.JobSearchScript",
+        "repeats": 0,
+        "interval": 5,
+        "persistent": True,
+    },
+    "who_snapshot": {
+        "typeclass": "typeclasses.who_snapshot.WhoSnapshotScript",
+        "repeats": 0,
+        "interval": 60,
+        "persistent": True,
+    },
+    "bbs_subscribers": {
+        "typeclass": "typeclasses.bbs_subscribers.BBSSubscribersScript",
+        "repeats": 0,
+        "interval": 300,
+        "persistent": True,
+    },
+}
+
 ######################################################################
 # Settings given in secret_settings.py override those in this file.
 ######################################################################
@@ -0,0 +1,34 @@
+"""
+BBS Archive Script
+
+Global script that applies board retention. Each tick moves at most one
+batch of expired posts into their boards' archives, so a board that has
+built up years of posts is worked down over several ticks instead of in
+one long transaction. Registered in settings.GLOBAL_SCRIPTS as
+"bbs_archiver".
+"""
+
+from evennia.utils import logger
+
+from world.bbs.storage import BBS_STORAGE, BBS_ARCHIVE_BATCH_SIZE
+
+from .scripts import Script
+
+
+class BBSArchiveScript(Script):
+    """
+    Moves posts past their board's retention into the archive in batches.
+    """
+
+    def at_script_creation(self):
+        """Set up the archive timer."""
+        self.key = "bbs_archiver"
+        self.desc = "Moves expired BBS posts into board archives"
+        self.interval = 5 * 60
+        self.persistent = True
+
+    def at_repeat(self, **kwargs):
+        """Archive one batch of expired posts."""
+        archived = BBS_STORAGE.archive_expired(BBS_ARCHIVE_BATCH_SIZE)
+        if archived:
+            logger.log_info(f"bbs_archiver: archived {archived} expired posts.")
@@ -0,0 +1,33 @@
+"""
+BBS Subscribers Script
+
+Global script that rebuilds the BBS subscriber index when the server
+starts or reloads and then on a timer, so access changes made outside the
+tracked hooks are picked up without a poster's +bbs/post paying for the
+rebuild. Registered in settings.GLOBAL_SCRIPTS as "bbs_subscribers".
+"""
+
+from world.bbs.subscribers import BBS_SUBSCRIBERS, BBS_SUBSCRIBERS_REBUILD_INTERVAL
+
+from .scripts import Script
+
+
+class BBSSubscribersScript(Script):
+    """
+    Rebuilds the BBS subscriber index periodically.
+    """
+
+    def at_script_creation(self):
+        """Set up the rebuild timer."""
+        self.key = "bbs_subscribers"
+        self.desc = "Rebuilds the BBS subscriber index"
+        self.interval = BBS_SUBSCRIBERS_REBUILD_INTERVAL
+        self.persistent = True
+
+    def at_start(self, **kwargs):
+        """Build the index as soon as the server is up."""
+        BBS_SUBSCRIBERS.rebuild()
+
+    def at_repeat(self, **kwargs):
+        """Rebuild the whole index."""
+        BBS_SUBSCRIBERS.rebuild()
@@ -0,0 +1,38 @@
+"""
+Census Script
+
+Global script that keeps the +census counters honest. Each tick re-reads
+one batch of characters; once a full pass finishes it waits an hour before
+starting the next. It also saves the counters so they survive restarts.
+Registered in settings.GLOBAL_SCRIPTS as "census".
+"""
+
+import time
+
+from world.utils.census_utils import CENSUS, CENSUS_RECONCILE_INTERVAL
+
+from .scripts import Script
+
+
+class CensusScript(Script):
+    """
+    Reconciles and saves the census counters in batches.
+    """
+
+    def at_script_creation(self):
+        """Set up the reconciliation timer."""
+        self.key = "census"
+        self.desc = "Reconciles and saves +census counters"
+        self.interval = 60
+        self.persistent = True
+        self.db.next_pass = 0
+
+    def at_repeat(self, **kwargs):
+        """Reconcile one batch of characters and save any changes."""
+        if not CENSUS.loaded and self.db.entries is not None:
+            CENSUS.load(self.db.entries)
+        if time.time() >= (self.db.next_pass or 0):
+            if CENSUS.reconcile_batch():
+                self.db.next_pass = time.time() + CENSUS_RECONCILE_INTERVAL
+        if CENSUS.dirty:
+            self.db.entries = CENSUS.export()
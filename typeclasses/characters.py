@@ -9,10 +9,15 @@ creation commands.
 This implementation uses the Modiphus 2d20 system for Dune.
 """
 
+from collections import namedtuple
+
 from evennia.objects.objects import DefaultCharacter
 from .objects import ObjectParent
 from typeclasses.titles import get_title, get_architect_access_for_title
 
+# Cached language capabilities, see Character.get_language_profile()
+LanguageProfile = namedtuple("LanguageProfile", ["languages", "universal", "speaking", "points"])
+
 # Architect mode role restrictions
 # Full architect access - can use all architect capabilities
 FULL_ARCHITECT_ROLES = [
@@ -133,6 +138,26 @@ class Character(ObjectParent, DefaultCharacter):
         """
         return 10
             
+    def set_approved(self, approved=True):
+        """
+        Approve or unapprove the character and update the census.
+
+        Args:
+            approved (bool): New approval state
+        """
+        self.db.approved = approved
+        self.update_census()
+
+    def update_census(self):
+        """
+        Recount this character in the +census counters.
+
+        Call after changing approval or census stats directly; changes
+        made without it are picked up by the next reconciliation pass.
+        """
+        from world.utils.census_utils import CENSUS
+        CENSUS.update(self)
+
     def get_skill(self, skill_name):
         """
         Get a skill value by name.
@@ -160,6 +185,7 @@ class Character(ObjectParent, DefaultCharacter):
         # Update max stress if discipline changes
         if skill_name.lower() == "discipline":
             self.db.max_stress = self.calculate_max_stress()
+        self.update_census()
             
     def add_focus(self, focus):
         """
@@ -1045,6 +1071,10 @@ class Character(ObjectParent, DefaultCharacter):
     def get_languages(self):
         """
         Get the list of languages this character knows.
+
+        This reads the stored attribute and returns a list that callers may
+        edit and save back. Speech paths should use get_language_profile()
+        or understands() instead.
         
         Returns:
             list: List of language names the character knows
@@ -1053,7 +1083,59 @@ class Character(ObjectParent, DefaultCharacter):
             # Default to The Truth if no languages set
             return ["The Truth"]
         return self.db.languages if isinstance(self.db.languages, list) else [self.db.languages]
-    
+
+    def get_language_profile(self):
+        """
+        Get the cached language capability profile.
+
+        The profile is built lazily from db.languages, db.speaking_language
+        and the merits in db.stats, and kept in ndb until it is cleared with
+        clear_language_profile(). set_languages() and set_speaking_language()
+        clear it; anything that edits those attributes or the merits
+        directly must clear it too.
+
+        Returns:
+            LanguageProfile: (languages, universal, speaking, points), where
+                points is the total from the Language merit
+        """
+        profile = self.ndb.language_profile
+        if profile is None:
+            universal = False
+            points = 0
+            merits = (self.db.stats or {}).get('merits', {})
+            for category in merits.values():
+                for merit_name, merit_data in category.items():
+                    normalized = merit_name.lower().replace(' ', '')
+                    if normalized in ('universallanguage', 'universallinguist'):
+                        universal = True
+                    elif normalized == 'language':
+                        # Language merit: each dot gives 1 language point
+                        points += merit_data.get('perm', 0)
+            profile = LanguageProfile(
+                languages=frozenset(self.get_languages()),
+                universal=universal,
+                speaking=getattr(self.db, 'speaking_language', None),
+                points=points,
+            )
+            self.ndb.language_profile = profile
+        return profile
+
+    def clear_language_profile(self):
+        """
+        Drop the cached language profile so it is rebuilt on next use.
+        """
+        self.ndb.language_profile = None
+
+    def set_languages(self, languages):
+        """
+        Replace the languages this character knows.
+
+        Args:
+            languages (list): Language names
+        """
+        self.db.languages = list(languages)
+        self.clear_language_profile()
+
     def get_speaking_language(self):
         """
         Get the character's currently set speaking language.
@@ -1061,7 +1143,52 @@ class Character(ObjectParent, DefaultCharacter):
         Returns:
             str or None: The current speaking language, or None if not set
         """
-        return getattr(self.db, 'speaking_language', None)
+        return self.get_language_profile().speaking
+
+    def set_speaking_language(self, language):
+        """
+        Set the language this character speaks in.
+
+        Args:
+            language (str or None): A known language, or None to clear
+
+        Raises:
+            ValueError: If the character doesn't know the language
+        """
+        if language:
+            profile = self.get_language_profile()
+            match = next((known for known in profile.languages
+                          if known.lower() == language.lower()), None)
+            if not match and not profile.universal:
+                raise ValueError(f"You don't know {language}. Use +language to see your known languages.")
+            language = match or language
+        self.db.speaking_language = language
+        self.clear_language_profile()
+
+    def has_universal_language(self):
+        """
+        Check for the Universal Language/Universal Linguist merit.
+
+        Returns:
+            bool: True if the character understands every language
+        """
+        return self.get_language_profile().universal
+
+    def understands(self, language):
+        """
+        Check whether this character understands speech in a language.
+
+        Args:
+            language (str or None): The language spoken. None means
+                untagged speech, which everyone understands.
+
+        Returns:
+            bool: True if the character understands the speech
+        """
+        if not language:
+            return True
+        profile = self.get_language_profile()
+        return profile.universal or language in profile.languages
     
     def prepare_say(self, speech, viewer=None, skip_english=False, language_only=False):
         """
@@ -1133,13 +1260,109 @@ class Character(ObjectParent, DefaultCharacter):
         
         return (msg_self, msg_understand, msg_not_understand, language)
     
-    def record_scene_activity(self):
+    def record_scene_activity(self, message=None, kind="pose", language=None, hidden_message=None):
         """
         Record scene activity for tracking purposes.
-        
-        This can be used to track when characters are active in scenes
-        for logging, statistics, or other purposes.
+
+        Lines are appended to the room's in-memory scene buffer and written
+        to the scene log in batches, so this never touches the database on
+        the pose path.
+
+        Args:
+            message (str, optional): The text as seen by those who
+                understand it. Without a message nothing is logged.
+            kind (str): "say", "pose" or "emit"
+            language (str, optional): Language of any tagged speech
+            hidden_message (str, optional): The text as seen by those who
+                don't understand the language
+        """
+        if not message or not self.location:
+            return
+        from world.scenes.logger import SCENE_LOGGER
+        SCENE_LOGGER.record(self.location, self, kind, message, language, hidden_message)
+
+    def at_post_puppet(self, **kwargs):
+        """
+        Called just after puppeting has completed.
+
+        Adds the character to its room's listener index, the session
+        activity index, the watch index, the who snapshot and the BBS
+        subscriber index.
+        """
+        from world.bbs.subscribers import BBS_SUBSCRIBERS
+        from world.utils.session_activity import SESSION_ACTIVITY
+        from world.utils.watch_index import WATCH_INDEX
+        from world.utils.who_snapshot import WHO_SNAPSHOT
+
+        super().at_post_puppet(**kwargs)
+        SESSION_ACTIVITY.sync(self)
+        WATCH_INDEX.refresh_watcher(self)
+        WHO_SNAPSHOT.refresh(self)
+        BBS_SUBSCRIBERS.refresh_puppet(self)
+        if self.location and hasattr(self.location, "update_listener"):
+            self.location.update_listener(self)
+
+    def at_post_unpuppet(self, account=None, session=None, **kwargs):
         """
-        # Basic implementation - can be extended later
-        # For now, this is a no-op to prevent errors
-        pass
\ No newline at end of file
+        Called just after the character is unpuppeted.
+
+        Removes the character from its room's listener index before the
+        default hook moves it off the grid.
+        """
+        from world.bbs.subscribers import BBS_SUBSCRIBERS
+        from world.utils.session_activity import SESSION_ACTIVITY
+        from world.utils.watch_index import WATCH_INDEX
+        from world.utils.who_snapshot import WHO_SNAPSHOT
+
+        location = self.location
+        super().at_post_unpuppet(account=account, session=session, **kwargs)
+        SESSION_ACTIVITY.sync(self)
+        if not SESSION_ACTIVITY.is_online(self):
+            WATCH_INDEX.remove_watcher(self)
+            BBS_SUBSCRIBERS.remove_puppet(self)
+        WHO_SNAPSHOT.refresh(self)
+        if location and hasattr(location, "update_listener"):
+            location.update_listener(self)
+
+    def at_post_move(self, source_location, move_type="move", **kwargs):
+        """
+        Called after the character has moved; updates its +who row.
+        """
+        from world.utils.who_snapshot import WHO_SNAPSHOT
+
+        super().at_post_move(source_location, move_type=move_type, **kwargs)
+        if self.has_account:
+            WHO_SNAPSHOT.refresh(self)
+
+    def at_object_delete(self):
+        """
+        Called just before the character is deleted.
+        """
+        from world.utils.census_utils import CENSUS
+
+        if self.location and hasattr(self.location, "remove_listener"):
+            self.location.remove_listener(self)
+        CENSUS.remove(self)
+        return super().at_object_delete()
+
+    def set_reality_layer(self, layer, active=True):
+        """
+        Enter or leave a reality layer (umbra, material, dreaming).
+
+        State tags should be changed through this method so the room's
+        listener index stays in sync. If a tag is changed directly, call
+        `location.update_listener(character)` afterwards.
+
+        Args:
+            layer (str): Layer tag, e.g. "in_umbra"
+            active (bool): True to enter the layer, False to leave it
+        """
+        if active:
+            self.tags.add(layer, category="state")
+        else:
+            self.tags.remove(layer, category="state")
+        if self.location and hasattr(self.location, "update_listener"):
+            self.location.update_listener(self)
+        if layer == "in_umbra" and self.has_account:
+            from world.utils.who_snapshot import WHO_SNAPSHOT
+            WHO_SNAPSHOT.refresh(self)
@@ -7,10 +7,73 @@ for allowing Characters to traverse the exit to its destination.
 
 """
 
+from collections import namedtuple
+
 from evennia.objects.objects import DefaultExit
+from evennia.typeclasses.tags import AliasHandler
+from evennia.utils.utils import lazy_property
 
 from .objects import ObjectParent
 
+# Exit names and aliases that count as compass directions, with the code
+# shown in the room's Directions section
+CARDINAL_DIRECTIONS = {
+    'north': 'N', 'south': 'S', 'east': 'E', 'west': 'W',
+    'northeast': 'NE', 'northwest': 'NW', 'southeast': 'SE', 'southwest': 'SW',
+    'up': 'U', 'down': 'D', 'n': 'N', 's': 'S', 'e': 'E', 'w': 'W',
+    'ne': 'NE', 'nw': 'NW', 'se': 'SE', 'sw': 'SW', 'u': 'U', 'd': 'D'
+}
+
+# How an exit is shown in a room: cardinal code (None for other exits),
+# label for the Exits section and primary alias (None if it has none)
+ExitInfo = namedtuple("ExitInfo", ["cardinal", "label", "alias"])
+
+
+def classify_exit(key, aliases):
+    """
+    Work out how an exit is displayed from its key and aliases.
+
+    An alias matching a compass direction wins over the key, so an exit
+    called "Palace Gate" with alias "n" is shown as a northern direction.
+
+    Args:
+        key (str): The exit's key
+        aliases (list): The exit's aliases, primary alias first
+
+    Returns:
+        ExitInfo: The exit's display classification
+    """
+    cardinal = None
+    for alias in aliases:
+        cardinal = CARDINAL_DIRECTIONS.get(alias.lower())
+        if cardinal:
+            break
+    if not cardinal:
+        cardinal = CARDINAL_DIRECTIONS.get(key.lower())
+
+    primary = aliases[0] if aliases else None
+    label = f"{key} <{primary}>" if primary else key
+    return ExitInfo(cardinal, label, primary)
+
+
+class ExitAliasHandler(AliasHandler):
+    """
+    Alias handler that tells its exit when the aliases change, so the
+    exit's display classification can be recomputed.
+    """
+
+    def add(self, *args, **kwargs):
+        super().add(*args, **kwargs)
+        self.obj.at_aliases_changed()
+
+    def remove(self, *args, **kwargs):
+        super().remove(*args, **kwargs)
+        self.obj.at_aliases_changed()
+
+    def clear(self, *args, **kwargs):
+        super().clear(*args, **kwargs)
+        self.obj.at_aliases_changed()
+
 
 class Exit(ObjectParent, DefaultExit):
     """
@@ -23,4 +86,52 @@ class Exit(ObjectParent, DefaultExit):
 
     """
 
-    pass
+    @lazy_property
+    def aliases(self):
+        return ExitAliasHandler(self)
+
+    def get_exit_info(self):
+        """
+        Get this exit's display classification, computing it on first use.
+
+        Returns:
+            ExitInfo: Cardinal code, display label and primary alias
+        """
+        info = self.ndb.exit_info
+        if info is None:
+            info = classify_exit(self.key, self.aliases.all())
+            self.ndb.exit_info = info
+        return info
+
+    def at_object_creation(self):
+        """
+        Called once, when the exit is first created.
+        """
+        super().at_object_creation()
+        self._invalidate_room_exits()
+
+    def at_object_delete(self):
+        """
+        Called just before the exit is deleted.
+        """
+        self._invalidate_room_exits()
+        return super().at_object_delete()
+
+    def at_rename(self, oldname, newname):
+        """
+        Called after the exit's key has changed.
+        """
+        super().at_rename(oldname, newname)
+        self.at_aliases_changed()
+
+    def at_aliases_changed(self):
+        """
+        Called when the exit's aliases change; reclassifies the exit.
+        """
+        self.ndb.exit_info = None
+        self._invalidate_room_exits()
+
+    def _invalidate_room_exits(self):
+        """Drop the room's exit table and cached display for this exit change."""
+        if self.location and hasattr(self.location, 'invalidate_exit_table'):
+            self.location.invalidate_exit_table()
@@ -0,0 +1,36 @@
+"""
+Job Search Script
+
+Global script that builds the +jobs/search index. The index lives in
+memory, so after every start or reload it is rebuilt one batch of jobs
+per tick instead of all at once; once built, the job commands keep it
+current and each tick does nothing. Registered in settings.GLOBAL_SCRIPTS
+as "job_search".
+"""
+
+from evennia.utils import logger
+
+from world.utils.job_search import JOB_SEARCH, JOB_SEARCH_BATCH_SIZE
+
+from .scripts import Script
+
+
+class JobSearchScript(Script):
+    """
+    Indexes jobs for +jobs/search in batches until the index is ready.
+    """
+
+    def at_script_creation(self):
+        """Set up the build timer."""
+        self.key = "job_search"
+        self.desc = "Builds the +jobs/search index"
+        self.interval = 5
+        self.persistent = True
+
+    def at_repeat(self, **kwargs):
+        """Index the next batch of jobs."""
+        if JOB_SEARCH.ready:
+            return
+        JOB_SEARCH.build_batch(JOB_SEARCH_BATCH_SIZE)
+        if JOB_SEARCH.ready:
+            logger.log_info("job_search: job search index built.")
@@ -12,6 +12,64 @@ from evennia.server.models import ServerConfig
 import time
 
 from .objects import ObjectParent
+from .exits import classify_exit
+from world.utils.session_activity import SESSION_ACTIVITY
+
+# Reality layer state tags. Characters sharing a layer can hear each other;
+# characters with no layer tag at all share the normal layer (None).
+REALITY_LAYERS = ("in_umbra", "in_material", "in_dreaming")
+
+# Width of the formatted room display
+ROOM_DISPLAY_WIDTH = 80
+
+# Seconds the ROOM_THEME_COLORS server setting is cached before re-reading it
+THEME_CACHE_SECONDS = 60
+
+# Seconds a cached appearance fragment is trusted before being rebuilt, as a
+# backstop for edits made outside the room's own setters (e.g. @name on a
+# neighbouring room changes our direction labels)
+APPEARANCE_CACHE_SECONDS = 300
+
+_theme_cache = {"colors": None, "expires": 0}
+
+
+def get_theme_colors():
+    """
+    Get the room theme colors, re-reading server config at most once a minute.
+
+    Returns:
+        tuple: (header_color, text_color, divider_color)
+    """
+    now = time.time()
+    if _theme_cache["colors"] is None or now >= _theme_cache["expires"]:
+        colors = ('y', 'y', 'y')
+        theme_colors = ServerConfig.objects.conf("ROOM_THEME_COLORS")
+        if theme_colors:
+            parts = theme_colors.split(",")
+            if len(parts) >= 3:
+                colors = (parts[0], parts[1], parts[2])
+        _theme_cache["colors"] = colors
+        _theme_cache["expires"] = now + THEME_CACHE_SECONDS
+    return _theme_cache["colors"]
+
+
+def clear_theme_cache():
+    """Force the next look to re-read ROOM_THEME_COLORS."""
+    _theme_cache["colors"] = None
+
+
+def get_reality_layers(obj):
+    """
+    Get the reality layers an object is currently in.
+
+    Args:
+        obj (Object): The object to check
+
+    Returns:
+        tuple: Layer tag names, or (None,) for normal reality
+    """
+    layers = tuple(layer for layer in REALITY_LAYERS if obj.tags.has(layer, category="state"))
+    return layers or (None,)
 
 
 class Room(ObjectParent, DefaultRoom):
@@ -54,7 +112,119 @@ class Room(ObjectParent, DefaultRoom):
         # Extended tasks - scene-based tasks requiring multiple skill tests
         # Format: {task_name: {"requirement": int, "points": int, "max_attempts": int, "attempts": int, "contributing": [characters]}}
         self.db.extended_tasks = {}
-        
+
+    # ------------------------------------------------------------------
+    # Listener index
+    #
+    # Puppeted characters in the room grouped by reality layer, so that
+    # say/pose/emit can find their audience without walking contents and
+    # querying state tags for every object. Kept in ndb and rebuilt lazily
+    # after a reload.
+    # ------------------------------------------------------------------
+
+    def _get_listener_index(self):
+        """
+        Get the listener index, building it from contents if needed.
+
+        Returns:
+            dict: {layer: {obj.id: obj}} for every puppeted character
+        """
+        index = self.ndb.listeners
+        if index is None:
+            index = {}
+            self.ndb.listeners = index
+            self.ndb.listener_layers = {}
+            for obj in self.contents:
+                if obj.has_account:
+                    self.add_listener(obj)
+        return index
+
+    def add_listener(self, obj):
+        """
+        Add a puppeted character to the listener index.
+
+        Args:
+            obj (Object): The character to add
+        """
+        index = self._get_listener_index()
+        if obj.id in self.ndb.listener_layers:
+            self.remove_listener(obj)
+        layers = get_reality_layers(obj)
+        self.ndb.listener_layers[obj.id] = layers
+        for layer in layers:
+            index.setdefault(layer, {})[obj.id] = obj
+
+    def remove_listener(self, obj):
+        """
+        Remove a character from the listener index.
+
+        Args:
+            obj (Object): The character to remove
+        """
+        if self.ndb.listeners is None:
+            return
+        layers = self.ndb.listener_layers.pop(obj.id, ())
+        for layer in layers:
+            self.ndb.listeners.get(layer, {}).pop(obj.id, None)
+
+    def update_listener(self, obj):
+        """
+        Re-index a character after its reality layer or puppet state changed.
+
+        Args:
+            obj (Object): The character to update
+        """
+        if obj.location == self and obj.has_account:
+            self.add_listener(obj)
+        else:
+            self.remove_listener(obj)
+
+    def get_listeners(self, speaker=None):
+        """
+        Get the puppeted characters who can hear a speaker.
+
+        Args:
+            speaker (Object, optional): The speaker. If not given, every
+                puppeted character in the room is returned regardless of
+                reality layer.
+
+        Returns:
+            list: Characters sharing a reality layer with the speaker
+        """
+        index = self._get_listener_index()
+        if speaker is None:
+            listeners = {}
+            for bucket in index.values():
+                listeners.update(bucket)
+            return list(listeners.values())
+
+        layers = self.ndb.listener_layers.get(speaker.id) or get_reality_layers(speaker)
+        if len(layers) == 1:
+            return list(index.get(layers[0], {}).values())
+        listeners = {}
+        for layer in layers:
+            listeners.update(index.get(layer, {}))
+        return list(listeners.values())
+
+    def at_object_receive(self, moved_obj, source_location, **kwargs):
+        """
+        Called after an object has been moved into this room.
+        """
+        super().at_object_receive(moved_obj, source_location, **kwargs)
+        if moved_obj.has_account:
+            self.add_listener(moved_obj)
+        elif moved_obj.destination:
+            self.invalidate_exit_table()
+
+    def at_object_leave(self, moved_obj, target_location, **kwargs):
+        """
+        Called just before an object leaves this room.
+        """
+        super().at_object_leave(moved_obj, target_location, **kwargs)
+        self.remove_listener(moved_obj)
+        if moved_obj.destination:
+            self.invalidate_exit_table()
+
     def return_appearance(self, looker, **kwargs):
         """
         This formats a description. It is the hook a 'look' command
@@ -68,21 +238,24 @@ class Room(ObjectParent, DefaultRoom):
         if not looker:
             return ""
             
-        # Build the formatted room display
+        # Build the formatted room display. Everything except the character
+        # list is served from the fragment cache.
         appearance_parts = []
         
         # Header
-        header = self.get_display_header(looker)
+        header = self._get_cached_fragment("header", looker, self.get_display_header,
+                                           stamp=self.key)
         if header:
             appearance_parts.append(header)
             
         # Description
-        desc = self.get_display_desc(looker)
+        desc = self._get_cached_fragment("desc", looker, self.get_display_desc,
+                                         stamp=self.db.desc)
         if desc:
             appearance_parts.append(desc)
             
         # Places section
-        places = self.get_display_places(looker)
+        places = self._get_cached_fragment("places", looker, self.get_display_places)
         if places:
             appearance_parts.append(places)
             
@@ -92,31 +265,94 @@ class Room(ObjectParent, DefaultRoom):
             appearance_parts.append(characters)
             
         # Directions section
-        directions = self.get_display_directions(looker)
+        directions = self._get_cached_fragment("directions", looker, self.get_display_directions)
         if directions:
             appearance_parts.append(directions)
             
         # Exits section
-        exits = self.get_display_exits(looker)
+        exits = self._get_cached_fragment("exits", looker, self.get_display_exits)
         if exits:
             appearance_parts.append(exits)
             
         # Footer
-        footer = self.get_display_footer(looker)
+        footer = self._get_cached_fragment("footer", looker, self.get_display_footer)
         if footer:
             appearance_parts.append(footer)
             
         return "\n".join(appearance_parts)
 
+    def _get_cached_fragment(self, name, looker, build, stamp=None):
+        """
+        Get one section of the room display, building it on a cache miss.
+
+        Fragments are cached per theme, display width and whether the looker
+        sees builder-only details (dbrefs in names). Fragments built with a
+        stamp are rebuilt whenever the stamp changes, which catches edits
+        made by the generic @desc and @name commands.
+
+        Args:
+            name (str): Fragment name
+            looker (Object): Object doing the looking
+            build (callable): Called as build(looker) on a cache miss
+            stamp (hashable, optional): Cheap fingerprint of the fragment's inputs
+
+        Returns:
+            str: The rendered fragment
+        """
+        now = time.time()
+        cache = self.ndb.appearance_cache
+        if cache is None or now >= cache["expires"]:
+            cache = {"expires": now + APPEARANCE_CACHE_SECONDS, "fragments": {}}
+            self.ndb.appearance_cache = cache
+            self.ndb.exit_table = None
+
+        is_builder = self.locks.check_lockstring(looker, "perm(Builder)")
+        key = (name, get_theme_colors(), ROOM_DISPLAY_WIDTH, is_builder)
+        entry = cache["fragments"].get(key)
+        if entry is None or entry[0] != stamp:
+            entry = (stamp, build(looker))
+            cache["fragments"][key] = entry
+        return entry[1]
+
+    def invalidate_appearance(self):
+        """
+        Drop all cached display fragments for this room.
+
+        Call this after changing anything the room display shows other
+        than the characters present: area info, hierarchy, places or exits.
+        """
+        self.ndb.appearance_cache = None
+
+    def get_exit_table(self):
+        """
+        Get this room's exits with their display classification.
+
+        The table is built once from the exits' precomputed classifications
+        and kept until an exit is added, removed, renamed or re-aliased.
+
+        Returns:
+            list: (exit, ExitInfo) tuples in the order of self.exits
+        """
+        table = self.ndb.exit_table
+        if table is None:
+            table = []
+            for exit_obj in self.exits:
+                if hasattr(exit_obj, 'get_exit_info'):
+                    info = exit_obj.get_exit_info()
+                else:
+                    info = classify_exit(exit_obj.key, exit_obj.aliases.all())
+                table.append((exit_obj, info))
+            self.ndb.exit_table = table
+        return table
+
+    def invalidate_exit_table(self):
+        """Drop the exit table and the display fragments built from it."""
+        self.ndb.exit_table = None
+        self.invalidate_appearance()
+
     def get_theme_colors(self):
         """Get theme colors from server config or defaults."""
-        theme_colors = ServerConfig.objects.conf("ROOM_THEME_COLORS")
-        if theme_colors:
-            colors = theme_colors.split(",")
-            if len(colors) >= 3:
-                return colors[0], colors[1], colors[2]
-        # Default colors (amber/orange for Dune desert theme)
-        return 'y', 'y', 'y'
+        return get_theme_colors()
     
     def get_display_header(self, looker, **kwargs):
         """
@@ -145,7 +381,7 @@ class Room(ObjectParent, DefaultRoom):
         
         # Create the header with proper centering and theme colors
         header_content = f" {location_string} "
-        total_width = 80
+        total_width = ROOM_DISPLAY_WIDTH
         equals_per_side = (total_width - len(header_content) - 4) // 2  # -4 for the arrows
         
         header = f"|{header_color}" + "=" * equals_per_side + ">" + f"|{text_color}" + header_content + f"|{header_color}" + "<" + "=" * equals_per_side + "|n"
@@ -202,8 +438,8 @@ class Room(ObjectParent, DefaultRoom):
         Format: Name.......................IdleTime
                   -Shortdesc (if present)
         """
-        # Get all characters in the room (including the looker)
-        characters = [obj for obj in self.contents if obj.has_account]
+        # Get all online characters in the room (including the looker)
+        characters = [obj for obj in self.contents if SESSION_ACTIVITY.is_online(obj)]
         
         if not characters:
             return ""
@@ -244,23 +480,13 @@ class Room(ObjectParent, DefaultRoom):
         Returns:
             str: Formatted idle time (e.g., "5m", "2h", "0s")
         """
-        # Get the character's session
-        sessions = character.sessions.all()
-        if not sessions:
+        idle_seconds = SESSION_ACTIVITY.get_idle_seconds(character)
+        if idle_seconds is None:
             return "?"
-            
-        # Get the most recent activity time
-        last_activity = None
-        for session in sessions:
-            if hasattr(session, 'cmd_last') and session.cmd_last:
-                if not last_activity or session.cmd_last > last_activity:
-                    last_activity = session.cmd_last
-                    
-        if not last_activity:
+        if not idle_seconds:
             return "0s"
             
-        # Calculate idle time
-        idle_seconds = int(time.time() - last_activity)
+        idle_seconds = int(idle_seconds)
         
         if idle_seconds < 60:
             return f"{idle_seconds}s"
@@ -275,43 +501,16 @@ class Room(ObjectParent, DefaultRoom):
         
         Cardinal directions: north, south, east, west, northeast, northwest, southeast, southwest, up, down
         """
-        cardinal_directions = {
-            'north': 'N', 'south': 'S', 'east': 'E', 'west': 'W',
-            'northeast': 'NE', 'northwest': 'NW', 'southeast': 'SE', 'southwest': 'SW',
-            'up': 'U', 'down': 'D', 'n': 'N', 's': 'S', 'e': 'E', 'w': 'W',
-            'ne': 'NE', 'nw': 'NW', 'se': 'SE', 'sw': 'SW', 'u': 'U', 'd': 'D'
-        }
-        
         directions = []
         
-        # Get all exits and filter for cardinal directions
-        for exit_obj in self.exits:
-            exit_name = exit_obj.key.lower()
-            exit_aliases = [alias.lower() for alias in exit_obj.aliases.all()]
-            
-            # Check if this exit is a cardinal direction
-            is_cardinal = False
-            matched_abbrev = None
-            
-            # First check if any of the exit's aliases match a cardinal direction
-            for alias in exit_aliases:
-                if alias in cardinal_directions:
-                    is_cardinal = True
-                    matched_abbrev = cardinal_directions[alias]
-                    break
-            
-            # If no alias matched, check if the exit name exactly matches a cardinal direction
-            if not is_cardinal and exit_name in cardinal_directions:
-                is_cardinal = True
-                matched_abbrev = cardinal_directions[exit_name]
-            
-            if is_cardinal:
+        for exit_obj, info in self.get_exit_table():
+            if info.cardinal:
                 # Get the destination name
                 dest_name = "Unknown"
                 if exit_obj.destination:
                     dest_name = exit_obj.destination.get_display_name(looker)
                 
-                directions.append(f"{dest_name} <{matched_abbrev}>")
+                directions.append(f"{dest_name} <{info.cardinal}>")
                     
         if not directions:
             return ""
@@ -337,39 +536,7 @@ class Room(ObjectParent, DefaultRoom):
         """
         Get exits that are NOT cardinal directions.
         """
-        cardinal_directions = {
-            'north', 'south', 'east', 'west', 'northeast', 'northwest', 
-            'southeast', 'southwest', 'up', 'down', 'n', 's', 'e', 'w',
-            'ne', 'nw', 'se', 'sw', 'u', 'd'
-        }
-        
-        other_exits = []
-        
-        # Get all exits and filter for non-cardinal directions
-        for exit_obj in self.exits:
-            exit_name = exit_obj.key.lower()
-            exit_aliases = [alias.lower() for alias in exit_obj.aliases.all()]
-            
-            # Check if this exit is NOT a cardinal direction
-            is_cardinal = False
-            
-            # First check if any of the exit's aliases match a cardinal direction
-            for alias in exit_aliases:
-                if alias in cardinal_directions:
-                    is_cardinal = True
-                    break
-            
-            # If no alias matched, check if the exit name exactly matches a cardinal direction
-            if not is_cardinal and exit_name in cardinal_directions:
-                is_cardinal = True
-                    
-            if not is_cardinal:
-                # Get the exit display (usually just the key, but could include aliases)
-                exit_display = exit_obj.key
-                if exit_obj.aliases.all():
-                    # Show primary alias in brackets
-                    exit_display += f" <{exit_obj.aliases.all()[0]}>"
-                other_exits.append(exit_display)
+        other_exits = [info.label for exit_obj, info in self.get_exit_table() if not info.cardinal]
                 
         if not other_exits:
             return ""
@@ -404,7 +571,7 @@ class Room(ObjectParent, DefaultRoom):
         area_code = self.db.area_code or "XX00"
         
         footer_content = f" IC Area - {area_code} "
-        total_width = 80
+        total_width = ROOM_DISPLAY_WIDTH
         equals_per_side = (total_width - len(footer_content) - 4) // 2  # -4 for the arrows
         
         footer = f"|{header_color}" + "=" * equals_per_side + ">" + f"|{text_color}" + footer_content + f"|{header_color}" + "<" + "=" * equals_per_side + "|n"
@@ -424,6 +591,7 @@ class Room(ObjectParent, DefaultRoom):
         self.db.area_code = area_code
         if location_hierarchy:
             self.db.location_hierarchy = list(location_hierarchy)
+        self.invalidate_appearance()
 
     def set_places_active(self, active=True):
         """
@@ -433,6 +601,7 @@ class Room(ObjectParent, DefaultRoom):
             active (bool): Whether places should be shown
         """
         self.db.places_active = active
+        self.invalidate_appearance()
 
     def add_place(self, place_name, place_desc, place_number=None):
         """
@@ -458,5 +627,6 @@ class Room(ObjectParent, DefaultRoom):
             'name': place_name,
             'desc': processed_desc
         }
+        self.invalidate_appearance()
         
         return place_number
@@ -0,0 +1,29 @@
+"""
+Scene Log Script
+
+Global script that periodically writes buffered scene activity to the
+database and compacts scenes that have ended. Registered in
+settings.GLOBAL_SCRIPTS as "scene_logger".
+"""
+
+from world.scenes.logger import SCENE_LOGGER, SCENE_LOG_FLUSH_INTERVAL
+
+from .scripts import Script
+
+
+class SceneLogScript(Script):
+    """
+    Flushes the scene logger's room buffers on a timer.
+    """
+
+    def at_script_creation(self):
+        """Set up the flush timer."""
+        self.key = "scene_logger"
+        self.desc = "Writes buffered scene logs to the database"
+        self.interval = SCENE_LOG_FLUSH_INTERVAL
+        self.persistent = True
+
+    def at_repeat(self, **kwargs):
+        """Flush every room with buffered activity and compact ended scenes."""
+        SCENE_LOGGER.flush()
+        SCENE_LOGGER.compact_ended()
@@ -0,0 +1,33 @@
+"""
+Who Snapshot Script
+
+Global script that rebuilds the +who snapshot when the server starts or
+reloads and then on a timer, so flags changed outside the tracked hooks
+show up without +who ever walking every session. Registered in
+settings.GLOBAL_SCRIPTS as "who_snapshot".
+"""
+
+from world.utils.who_snapshot import WHO_SNAPSHOT, WHO_SNAPSHOT_REBUILD_INTERVAL
+
+from .scripts import Script
+
+
+class WhoSnapshotScript(Script):
+    """
+    Rebuilds the +who snapshot periodically.
+    """
+
+    def at_script_creation(self):
+        """Set up the rebuild timer."""
+        self.key = "who_snapshot"
+        self.desc = "Rebuilds the +who snapshot"
+        self.interval = WHO_SNAPSHOT_REBUILD_INTERVAL
+        self.persistent = True
+
+    def at_start(self, **kwargs):
+        """Build the snapshot as soon as the server is up."""
+        WHO_SNAPSHOT.rebuild()
+
+    def at_repeat(self, **kwargs):
+        """Rebuild every row."""
+        WHO_SNAPSHOT.rebuild()
@@ -0,0 +1,146 @@
+"""
+Speech Rendering Utilities
+
+Shared rendering stage for say, pose, emit and table talk. Receivers are
+sorted into comprehension groups first, each group's message is rendered
+once, and the result is fanned out to every member of the group. Poses
+and emits with "~speech" segments are compiled once into a PoseTemplate
+that each group instantiates without re-parsing the text.
+"""
+
+import re
+
+# Comprehension buckets
+SPEAKER = "speaker"
+UNDERSTANDS = "understands"
+NOT_UNDERSTANDS = "not_understands"
+
+LANGUAGE_TAG_RE = re.compile(r'"~([^"]+)"')
+FOREIGN_SPEECH = "[foreign speech in {language}]"
+
+
+def group_by_comprehension(speaker, receivers, language, per_viewer_names=True):
+    """
+    Sort receivers into comprehension groups.
+
+    Args:
+        speaker (Character): The character speaking
+        receivers (list): Characters receiving the message
+        language (str or None): Language spoken, None for untagged speech
+        per_viewer_names (bool): If True, receivers who see the speaker under
+            a different display name (recog, masks) get their own group.
+
+    Returns:
+        dict: {(bucket, display_name): [receivers]} in first-seen order
+    """
+    groups = {}
+    for receiver in receivers:
+        if receiver == speaker:
+            key = (SPEAKER, None)
+        else:
+            bucket = UNDERSTANDS if receiver.understands(language) else NOT_UNDERSTANDS
+            name = speaker.get_display_name(receiver) if per_viewer_names else None
+            key = (bucket, name)
+        groups.setdefault(key, []).append(receiver)
+    return groups
+
+
+def fan_out(groups, render):
+    """
+    Render each group's message once and send it to every member.
+
+    Args:
+        groups (dict): Output of group_by_comprehension
+        render (callable): render(bucket, viewer) -> str, called once per
+            group with the group's first member as representative viewer
+
+    Returns:
+        int: Number of messages rendered
+    """
+    for (bucket, _), members in groups.items():
+        message = render(bucket, members[0])
+        for receiver in members:
+            receiver.msg(message)
+    return len(groups)
+
+
+class PoseTemplate:
+    """
+    A pose tokenized once into literal and foreign-speech segments.
+
+    Rendering a template is plain string joining with no regex work, and
+    each (understood, language) variant is built at most once, so the cost
+    per receiver does not grow with the length of the pose.
+    """
+
+    __slots__ = ("segments", "has_speech", "_variants")
+
+    def __init__(self, segments):
+        """
+        Args:
+            segments (list): (text, is_speech) tuples in pose order
+        """
+        self.segments = tuple(segments)
+        self.has_speech = any(is_speech for _, is_speech in self.segments)
+        self._variants = {}
+
+    @classmethod
+    def from_speech(cls, speech):
+        """
+        Build a template where the whole text is foreign speech.
+
+        Args:
+            speech (str): The speech text, without quotes or ~
+
+        Returns:
+            PoseTemplate: Template with a single unquoted speech segment
+        """
+        return cls([(speech.lstrip(), True)])
+
+    def render(self, understood, language=None, quote=True):
+        """
+        Instantiate the template for one comprehension group.
+
+        Args:
+            understood (bool): Whether the group understands the language
+            language (str, optional): Language of the speech segments
+            quote (bool): Whether speech segments are wrapped in quotes
+
+        Returns:
+            str: The rendered text
+        """
+        key = (understood, language, quote)
+        rendered = self._variants.get(key)
+        if rendered is None:
+            parts = []
+            for text, is_speech in self.segments:
+                if not is_speech:
+                    parts.append(text)
+                    continue
+                if not understood and language:
+                    text = FOREIGN_SPEECH.format(language=language)
+                parts.append(f'"{text}"' if quote else text)
+            rendered = ''.join(parts)
+            self._variants[key] = rendered
+        return rendered
+
+
+def compile_pose(text):
+    """
+    Tokenize pose or emit text with "~speech" segments into a template.
+
+    Args:
+        text (str): Pose or emit text
+
+    Returns:
+        PoseTemplate: The compiled template
+    """
+    segments = []
+    current_pos = 0
+    if "~" in text:
+        for match in LANGUAGE_TAG_RE.finditer(text):
+            segments.append((text[current_pos:match.start()], False))
+            segments.append((match.group(1).lstrip(), True))
+            current_pos = match.end()
+    segments.append((text[current_pos:], False))
+    return PoseTemplate(segments)
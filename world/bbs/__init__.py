@@ -0,0 +1,8 @@
+"""
+Bulletin Boards
+
+Django app holding the +bbs boards. Each board, post and read marker is its
+own row, so reading or posting touches only the rows involved instead of
+re-saving every board at once. world.bbs.storage.BBS_STORAGE is the
+controller the +bbs commands talk to.
+"""
@@ -0,0 +1,64 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Board",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("description", models.TextField(blank=True)),
+                ("public", models.BooleanField(default=True)),
+                ("locked", models.BooleanField(default=False)),
+                ("read_only", models.BooleanField(default=False)),
+                ("group_names", models.JSONField(blank=True, default=list)),
+                ("access_list", models.JSONField(blank=True, default=dict)),
+            ],
+            options={
+                "ordering": ["id"],
+            },
+        ),
+        migrations.CreateModel(
+            name="Post",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("number", models.PositiveIntegerField()),
+                ("title", models.CharField(max_length=255)),
+                ("content", models.TextField()),
+                ("author", models.CharField(max_length=255)),
+                ("created_at", models.DateTimeField()),
+                ("edited_at", models.DateTimeField(blank=True, null=True)),
+                ("pinned", models.BooleanField(default=False)),
+                ("board", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="posts", to="bbs.board")),
+            ],
+            options={
+                "ordering": ["board", "number"],
+                "indexes": [
+                    models.Index(fields=["board", "number"], name="bbspost_board_number"),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="PostRead",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("reader", models.CharField(max_length=255)),
+                ("post", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="reads", to="bbs.post")),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["reader", "post"], name="bbsread_reader_post"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(fields=["post", "reader"], name="bbsread_post_reader"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,50 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def forwards(apps, schema_editor):
+    """Fold per-post read rows into one watermark row per reader and board."""
+    PostRead = apps.get_model("bbs", "PostRead")
+    ReadMark = apps.get_model("bbs", "ReadMark")
+
+    read = {}
+    for board_id, reader, number in PostRead.objects.values_list("post__board_id", "reader", "post__number"):
+        read.setdefault((board_id, reader), set()).add(number)
+
+    marks = []
+    for (board_id, reader), numbers in read.items():
+        watermark = 0
+        while watermark + 1 in numbers:
+            watermark += 1
+        exceptions = sorted(number for number in numbers if number > watermark)
+        marks.append(ReadMark(board_id=board_id, reader=reader, watermark=watermark, exceptions=exceptions))
+    ReadMark.objects.bulk_create(marks)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bbs", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReadMark",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("reader", models.CharField(max_length=255)),
+                ("watermark", models.PositiveIntegerField(default=0)),
+                ("exceptions", models.JSONField(blank=True, default=list)),
+                ("board", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="read_marks", to="bbs.board")),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(fields=["reader", "board"], name="bbsreadmark_reader_board"),
+                ],
+            },
+        ),
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+        migrations.DeleteModel(
+            name="PostRead",
+        ),
+    ]
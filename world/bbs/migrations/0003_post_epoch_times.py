@@ -0,0 +1,37 @@
+from django.db import migrations, models
+
+
+def forwards(apps, schema_editor):
+    """Copy post datetimes into epoch-second columns."""
+    Post = apps.get_model("bbs", "Post")
+    posts = list(Post.objects.all())
+    for post in posts:
+        post.created_ts = int(post.created_at.timestamp())
+        post.edited_ts = int(post.edited_at.timestamp()) if post.edited_at else None
+    Post.objects.bulk_update(posts, ["created_ts", "edited_ts"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bbs", "0002_readmark"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="created_ts",
+            field=models.BigIntegerField(default=0),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="edited_ts",
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+        migrations.RemoveField(model_name="post", name="created_at"),
+        migrations.RemoveField(model_name="post", name="edited_at"),
+        migrations.RenameField(model_name="post", old_name="created_ts", new_name="created_at"),
+        migrations.RenameField(model_name="post", old_name="edited_ts", new_name="edited_at"),
+    ]
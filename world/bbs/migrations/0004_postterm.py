@@ -0,0 +1,50 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def forwards(apps, schema_editor):
+    """Index the posts that already exist."""
+    from world.bbs.search import get_post_terms
+
+    Post = apps.get_model("bbs", "Post")
+    PostTerm = apps.get_model("bbs", "PostTerm")
+
+    last_id = 0
+    while True:
+        posts = list(Post.objects.filter(id__gt=last_id).order_by("id")[:500])
+        if not posts:
+            break
+        PostTerm.objects.bulk_create([
+            PostTerm(token=token, post_id=post.id, board_id=post.board_id, positions=positions,
+                     in_title=in_title)
+            for post in posts
+            for token, (positions, in_title) in get_post_terms(post.title, post.content).items()
+        ], batch_size=1000)
+        last_id = posts[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bbs", "0003_post_epoch_times"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PostTerm",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("token", models.CharField(max_length=64)),
+                ("board_id", models.IntegerField()),
+                ("positions", models.JSONField(default=list)),
+                ("in_title", models.BooleanField(default=False)),
+                ("post", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="terms", to="bbs.post")),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(fields=["token", "post"], name="bbsterm_token_post"),
+                ],
+            },
+        ),
+        migrations.RunPython(forwards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bbs", "0005_post_pinned_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="board",
+            name="retention_posts",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="board",
+            name="retention_days",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="ArchivedPost",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("number", models.PositiveIntegerField()),
+                ("title", models.CharField(max_length=255)),
+                ("author", models.CharField(max_length=255)),
+                ("created_at", models.BigIntegerField()),
+                ("archived_at", models.BigIntegerField()),
+                ("data", models.BinaryField(default=b"")),
+                ("board", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="archived_posts", to="bbs.board")),
+            ],
+            options={
+                "ordering": ["board", "number"],
+                "indexes": [
+                    models.Index(fields=["board", "number"], name="bbsarchive_board_number"),
+                ],
+            },
+        ),
+    ]
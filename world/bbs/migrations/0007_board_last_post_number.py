@@ -0,0 +1,30 @@
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def set_last_post_numbers(apps, schema_editor):
+    """Start each counter past every live post and every read watermark."""
+    Board = apps.get_model("bbs", "Board")
+    ReadMark = apps.get_model("bbs", "ReadMark")
+    watermarks = dict(ReadMark.objects.values("board_id").annotate(last=Max("watermark"))
+                      .values_list("board_id", "last"))
+    for board in Board.objects.annotate(last=Max("posts__number")):
+        last = max(board.last or 0, watermarks.get(board.pk) or 0)
+        if last:
+            Board.objects.filter(pk=board.pk).update(last_post_number=last)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bbs", "0006_archivedpost"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="board",
+            name="last_post_number",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(set_last_post_numbers, migrations.RunPython.noop),
+    ]
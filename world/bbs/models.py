@@ -0,0 +1,169 @@
+"""
+Bulletin board models.
+"""
+
+import json
+import zlib
+
+from django.db import models
+
+
+class Board(models.Model):
+    """
+    One bulletin board.
+
+    The id is the board number shown on +bbs. Individual access grants are
+    stored as {character key: "full_access" | "read_only"}. Unpinned posts
+    past retention_posts, or older than retention_days, are moved to the
+    board's archive by the bbs_archiver script; None means no limit.
+    last_post_number is the highest number ever given to a post on the
+    board, so numbers freed by archiving are never handed out again.
+    """
+
+    name = models.CharField(max_length=255, unique=True)
+    description = models.TextField(blank=True)
+    public = models.BooleanField(default=True)
+    locked = models.BooleanField(default=False)
+    read_only = models.BooleanField(default=False)
+    group_names = models.JSONField(default=list, blank=True)
+    access_list = models.JSONField(default=dict, blank=True)
+    retention_posts = models.PositiveIntegerField(null=True, blank=True)
+    retention_days = models.PositiveIntegerField(null=True, blank=True)
+    last_post_number = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["id"]
+
+    def __str__(self):
+        return f"Board #{self.id}: {self.name}"
+
+
+class Post(models.Model):
+    """
+    One post on a board.
+
+    Number is the post's 1-based position on its board, as used in
+    +bbs <board>/<number>; deleting a post renumbers the ones after it.
+    Archiving does not, so numbers can have gaps where posts were
+    archived.
+    Times are UTC epoch seconds, formatted per reader when shown.
+    """
+
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name="posts")
+    number = models.PositiveIntegerField()
+    title = models.CharField(max_length=255)
+    content = models.TextField()
+    author = models.CharField(max_length=255)
+    created_at = models.BigIntegerField()
+    edited_at = models.BigIntegerField(null=True, blank=True)
+    pinned = models.BooleanField(default=False)
+
+    class Meta:
+        ordering = ["board", "number"]
+        indexes = [
+            models.Index(fields=["board", "number"], name="bbspost_board_number"),
+            models.Index(fields=["board", "pinned", "number"], name="bbspost_board_pinned"),
+        ]
+
+    def __str__(self):
+        return f"Post {self.board_id}/{self.number}: {self.title}"
+
+
+class ArchivedPost(models.Model):
+    """
+    A post moved off its board by retention.
+
+    Number is the post's 1-based position in the board's archive, oldest
+    first. The fields shown in archive listings are kept as columns; the
+    post body is stored as zlib-compressed JSON {"content", "edited_at"}.
+    """
+
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name="archived_posts")
+    number = models.PositiveIntegerField()
+    title = models.CharField(max_length=255)
+    author = models.CharField(max_length=255)
+    created_at = models.BigIntegerField()
+    archived_at = models.BigIntegerField()
+    data = models.BinaryField(default=b"")
+
+    class Meta:
+        ordering = ["board", "number"]
+        indexes = [
+            models.Index(fields=["board", "number"], name="bbsarchive_board_number"),
+        ]
+
+    def __str__(self):
+        return f"Archived post {self.board_id}/{self.number}: {self.title}"
+
+    def get_body(self):
+        """
+        Decompress the stored body.
+
+        Returns:
+            dict: 'content' and 'edited_at'
+        """
+        if not self.data:
+            return {"content": "", "edited_at": None}
+        return json.loads(zlib.decompress(bytes(self.data)).decode("utf-8"))
+
+    def set_body(self, content, edited_at):
+        """Compress a post body into this record. Does not save."""
+        self.data = zlib.compress(json.dumps({"content": content, "edited_at": edited_at}).encode("utf-8"))
+
+
+class ReadMark(models.Model):
+    """
+    What one character has read on one board.
+
+    Every post numbered up to the watermark is read. Posts past it that
+    were read out of order are kept in exceptions until the watermark
+    catches up, so the set stays small.
+    """
+
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name="read_marks")
+    reader = models.CharField(max_length=255)
+    watermark = models.PositiveIntegerField(default=0)
+    exceptions = models.JSONField(default=list, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["reader", "board"], name="bbsreadmark_reader_board"),
+        ]
+
+    def get_read(self):
+        """
+        Returns:
+            tuple: (watermark, set of post numbers read past it)
+        """
+        return self.watermark, set(self.exceptions or [])
+
+    def set_read(self, watermark, exceptions):
+        """
+        Store a new watermark and exception set, advancing the watermark
+        over any exceptions that now follow it directly. Does not save.
+        """
+        exceptions = {number for number in exceptions if number > watermark}
+        while watermark + 1 in exceptions:
+            watermark += 1
+            exceptions.discard(watermark)
+        self.watermark = watermark
+        self.exceptions = sorted(exceptions)
+
+
+class PostTerm(models.Model):
+    """
+    One entry in the post search index: a token and where it appears in
+    one post. Positions count words from the start of the title, with
+    the content following it.
+    """
+
+    token = models.CharField(max_length=64)
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name="terms")
+    board_id = models.IntegerField()
+    positions = models.JSONField(default=list)
+    in_title = models.BooleanField(default=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["token", "post"], name="bbsterm_token_post"),
+        ]
@@ -0,0 +1,138 @@
+"""
+Inverted index for +bbs/search.
+
+Each post's title and content are split into lowercase word tokens, and
+one PostTerm row per (token, post) records the word positions. The rows
+are rewritten when a post is created or edited and go away with the post
+when it is deleted, so a search only reads the rows for its own terms and
+never scans post bodies.
+
+Results need every search term. They are ranked by how often and how
+rarely each term appears (tf-idf), with a bonus for terms found next to
+each other in the order they were typed and for matches in the title.
+Access filtering is left to the caller (BBSStorage.search_posts).
+"""
+
+import math
+import re
+
+from world.bbs.models import Post, PostTerm
+
+# Longest token kept; longer words are cut to this length
+SEARCH_TOKEN_LENGTH = 64
+
+# Words too common to be worth indexing
+SEARCH_STOPWORDS = frozenset((
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
+    "it", "of", "on", "or", "that", "the", "this", "to", "was", "with",
+))
+
+# Score bonus for each pair of consecutive search terms found in order, at
+# most one (stop)word apart
+SEARCH_PHRASE_BONUS = 2.0
+
+# Score multiplier for terms that appear in the title
+SEARCH_TITLE_BONUS = 1.5
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z0-9]+)*")
+
+
+def tokenize(text):
+    """
+    Split text into index tokens.
+
+    Args:
+        text (str): Text to split
+
+    Returns:
+        list: Lowercase tokens, stopwords included so positions line up
+    """
+    return [token[:SEARCH_TOKEN_LENGTH] for token in _TOKEN_RE.findall((text or "").lower())]
+
+
+def get_query_tokens(terms):
+    """Get the distinct indexed tokens in a search string, in order."""
+    tokens = []
+    for token in tokenize(terms):
+        if token not in SEARCH_STOPWORDS and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+def get_post_terms(title, content):
+    """
+    Get the index entries for one post.
+
+    Returns:
+        dict: Token -> (list of word positions counting the title first,
+            whether the token is in the title)
+    """
+    title_tokens = tokenize(title)
+    terms = {}
+    for position, token in enumerate(title_tokens + tokenize(content)):
+        if token not in SEARCH_STOPWORDS:
+            terms.setdefault(token, ([], position < len(title_tokens)))[0].append(position)
+    return terms
+
+
+def index_post(post):
+    """
+    Write a post's index entries, replacing any it already had.
+
+    Args:
+        post (Post): The created or edited post
+    """
+    PostTerm.objects.filter(post=post).delete()
+    PostTerm.objects.bulk_create([
+        PostTerm(token=token, post=post, board_id=post.board_id, positions=positions, in_title=in_title)
+        for token, (positions, in_title) in get_post_terms(post.title, post.content).items()
+    ])
+
+
+def search_posts(terms, board_ids):
+    """
+    Rank the posts that contain every search term.
+
+    Args:
+        terms (str): The search string
+        board_ids (iterable): Boards to search
+
+    Returns:
+        list: (score, post id) pairs, best first
+    """
+    tokens = get_query_tokens(terms)
+    board_ids = list(board_ids)
+    if not tokens or not board_ids:
+        return []
+
+    rows = PostTerm.objects.filter(token__in=tokens, board_id__in=board_ids).values_list(
+        "post_id", "token", "positions", "in_title")
+    matches = {}        # post id -> {token: positions}
+    in_title = set()    # post ids with a term in the title
+    frequency = {}      # token -> number of posts containing it
+    for post_id, token, positions, title_hit in rows:
+        matches.setdefault(post_id, {})[token] = positions
+        frequency[token] = frequency.get(token, 0) + 1
+        if title_hit:
+            in_title.add(post_id)
+    if len(frequency) < len(tokens):
+        return []
+
+    total = Post.objects.filter(board_id__in=board_ids).count()
+    idf = {token: math.log(1 + total / count) for token, count in frequency.items()}
+
+    results = []
+    for post_id, found in matches.items():
+        if len(found) < len(tokens):
+            continue
+        score = sum(len(found[token]) * idf[token] for token in tokens)
+        for first, second in zip(tokens, tokens[1:]):
+            following = {position + gap for position in found[first] for gap in (1, 2)}
+            if following.intersection(found[second]):
+                score += SEARCH_PHRASE_BONUS
+        if post_id in in_title:
+            score *= SEARCH_TITLE_BONUS
+        results.append((score, post_id))
+
+    results.sort(key=lambda result: (-result[0], -result[1]))
+    return results
@@ -0,0 +1,851 @@
+"""
+Row-based bulletin board storage.
+
+BBSStorage is the controller behind +bbs. It keeps the method names and
+return values the BBS commands were written against (board and post dicts,
+0-based post indexes, message strings for admin actions), but reads and
+writes Board, Post and ReadMark rows instead of one pickled dict holding
+every board, post and read marker.
+
+migrate_legacy_boards() copies the boards from the old BBSController
+object's db.boards attribute into the tables once.
+"""
+
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+
+from django.db import connection, transaction
+from django.db.models import Count, F, Max, Q
+
+from evennia.utils import logger
+
+from world.bbs.models import ArchivedPost, Board, Post, ReadMark
+from world.bbs import search
+from world.bbs.subscribers import BBS_SUBSCRIBERS
+
+# Format the legacy board dicts stored post times in (UTC)
+LEGACY_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Posts per page of a board listing
+BBS_PAGE_SIZE = 20
+
+# Most posts the bbs_archiver script moves to archives per tick
+BBS_ARCHIVE_BATCH_SIZE = 200
+
+
+def _parse_legacy_time(value):
+    """Convert a legacy post time to epoch seconds."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return int((value if value.tzinfo else value.replace(tzinfo=timezone.utc)).timestamp())
+    try:
+        return int(datetime.strptime(value, LEGACY_TIME_FORMAT).replace(tzinfo=timezone.utc).timestamp())
+    except (TypeError, ValueError):
+        return None
+
+
+def _unread_posts(board, watermark, exceptions):
+    """
+    Get a board's posts not covered by a read watermark. Post numbers can
+    have gaps where posts were archived, so this goes by the stored
+    numbers rather than counting up to the number of posts.
+    """
+    return (Post.objects.filter(board=board, number__gt=watermark)
+            .exclude(number__in=exceptions).order_by("number"))
+
+
+def _get_character(key):
+    """Find the character with a given key, if any."""
+    from evennia import search_object
+
+    matches = search_object(key, exact=True, typeclass="typeclasses.characters.Character")
+    return matches[0] if matches else None
+
+
+def _is_staff(character):
+    return bool(character and character.check_permstring("Builder"))
+
+
+class BBSStorage:
+    """
+    Bulletin board controller backed by the world.bbs tables.
+    """
+
+    key = "BBSController"
+
+    # Lookups
+
+    def _get_board_row(self, board_ref):
+        """
+        Find a board by number or name.
+
+        Args:
+            board_ref (int or str): Board id, or case-insensitive name
+
+        Returns:
+            Board or None
+        """
+        if isinstance(board_ref, Board):
+            return board_ref
+        if isinstance(board_ref, int) or str(board_ref).strip().isdigit():
+            return Board.objects.filter(id=int(board_ref)).first()
+        return Board.objects.filter(name__iexact=str(board_ref).strip()).first()
+
+    def _get_post_row(self, board_ref, post_index):
+        board = self._get_board_row(board_ref)
+        if not board:
+            return None
+        return Post.objects.filter(board=board, number=post_index + 1).first()
+
+    def _board_dict(self, board):
+        return {
+            'id': board.id,
+            'name': board.name,
+            'description': board.description,
+            'public': board.public,
+            'locked': board.locked,
+            'read_only': board.read_only,
+            'group_names': list(board.group_names or []),
+            'access_list': dict(board.access_list or {}),
+            'retention_posts': board.retention_posts,
+            'retention_days': board.retention_days,
+        }
+
+    def _post_dict(self, post):
+        return {
+            'number': post.number,
+            'title': post.title,
+            'content': post.content,
+            'author': post.author,
+            'created_at': post.created_at,
+            'edited_at': post.edited_at,
+            'pinned': post.pinned,
+        }
+
+    def get_board(self, board_ref, posts=True):
+        """
+        Get a board with all of its posts.
+
+        Args:
+            board_ref (int or str): Board id or name
+            posts (bool): If False, include only 'post_count' instead of
+                loading the posts
+
+        Returns:
+            dict or None: Board fields plus 'posts', a list of post dicts
+                in post-number order
+        """
+        board = self._get_board_row(board_ref)
+        if not board:
+            return None
+        data = self._board_dict(board)
+        if posts:
+            data['posts'] = [self._post_dict(post) for post in Post.objects.filter(board=board)]
+        else:
+            data['post_count'] = board.posts.count()
+        return data
+
+    def get_boards(self):
+        """
+        Get every board without its posts, in board-number order.
+
+        Returns:
+            list: Board dicts with 'post_count' and 'last_post' (the newest
+                post's epoch time, or None) instead of 'posts'
+        """
+        boards = Board.objects.annotate(post_count=Count("posts"), last_post=Max("posts__created_at"))
+        result = []
+        for board in boards:
+            data = self._board_dict(board)
+            data['post_count'] = board.post_count
+            data['last_post'] = board.last_post
+            result.append(data)
+        return result
+
+    def get_posts(self, board_ref):
+        """Get a board's posts as a list of post dicts."""
+        board = self._get_board_row(board_ref)
+        if not board:
+            return []
+        return [self._post_dict(post) for post in Post.objects.filter(board=board)]
+
+    def get_post_page(self, board_ref, character_key, page=1, page_size=BBS_PAGE_SIZE):
+        """
+        Get one page of a board's listing: pinned posts first, then the
+        rest in post-number order. Only the page's posts are loaded.
+
+        Args:
+            board_ref (int or str): Board id or name
+            character_key (str): Reader, for unread markers
+            page (int): 1-based page; out-of-range pages are clamped
+            page_size (int): Posts per page
+
+        Returns:
+            dict or None: Board fields plus 'posts' (the page's post dicts,
+                each with 'unread'), 'post_count', 'unread_count', 'page'
+                and 'pages'
+        """
+        board = self._get_board_row(board_ref)
+        if not board:
+            return None
+        posts = Post.objects.filter(board=board)
+        post_count = posts.count()
+        pages = max(1, -(-post_count // page_size))
+        page = min(max(page, 1), pages)
+        start = (page - 1) * page_size
+
+        rows = list(posts.filter(pinned=True).order_by("number")[start:start + page_size])
+        if len(rows) < page_size:
+            unpinned_start = max(0, start - posts.filter(pinned=True).count())
+            rows += list(posts.filter(pinned=False).order_by("number")
+                         [unpinned_start:unpinned_start + page_size - len(rows)])
+
+        watermark, exceptions = self._get_read(board, character_key)
+        data = self._board_dict(board)
+        data['posts'] = []
+        for post in rows:
+            entry = self._post_dict(post)
+            entry['unread'] = post.number > watermark and post.number not in exceptions
+            data['posts'].append(entry)
+        data.update(post_count=post_count, unread_count=_unread_posts(board, watermark, exceptions).count(),
+                    page=page, pages=pages)
+        return data
+
+    def get_post(self, board_ref, post_index):
+        """
+        Get one post.
+
+        Args:
+            board_ref (int or str): Board id or name
+            post_index (int): 0-based post index
+
+        Returns:
+            dict or None: The post
+        """
+        post = self._get_post_row(board_ref, post_index)
+        return self._post_dict(post) if post else None
+
+    # Boards
+
+    def create_board(self, name, description, public=True, group_names=None):
+        """
+        Create a board.
+
+        Args:
+            name (str): Board name
+            description (str): Board description
+            public (bool): Whether everyone can read it
+            group_names (list, optional): Groups the board is restricted to
+
+        Returns:
+            dict: The new board
+        """
+        board = Board.objects.create(name=name, description=description, public=public,
+                                     group_names=list(group_names or []))
+        BBS_SUBSCRIBERS.refresh_board(board)
+        return self.get_board(board)
+
+    def save_board(self, board_ref, board_data):
+        """
+        Write edited board settings back.
+
+        Args:
+            board_ref (int or str): Board id or name
+            board_data (dict): Board dict as returned by get_board
+        """
+        board = self._get_board_row(board_ref)
+        if not board:
+            return
+        for field in ('name', 'description', 'public', 'locked', 'read_only', 'group_names', 'access_list'):
+            if field in board_data:
+                setattr(board, field, board_data[field])
+        board.save()
+        BBS_SUBSCRIBERS.refresh_board(board)
+
+    def edit_board(self, board_ref, field, value):
+        """Set a single board setting."""
+        self.save_board(board_ref, {field: value})
+
+    def lock_board(self, board_ref):
+        """Stop new posts on a board."""
+        board = self._get_board_row(board_ref)
+        if not board:
+            return f"No board found with the name or number '{board_ref}'."
+        board.locked = True
+        board.save(update_fields=["locked"])
+        return f"Board '{board.name}' has been locked. No new posts can be made."
+
+    def set_read_only(self, board_ref, read_only):
+        """Set whether only staff can post on a board."""
+        board = self._get_board_row(board_ref)
+        if not board:
+            return f"No board found with the name or number '{board_ref}'."
+        board.read_only = read_only
+        board.save(update_fields=["read_only"])
+        return f"Board '{board.name}' is {'now' if read_only else 'no longer'} read-only."
+
+    def delete_board(self, board_ref):
+        """Delete a board with all of its posts and read markers."""
+        board = self._get_board_row(board_ref)
+        if not board:
+            return f"No board found with the name or number '{board_ref}'."
+        name = board.name
+        BBS_SUBSCRIBERS.remove_board(board.id)
+        board.delete()
+        return f"Board '{name}' and all its posts have been deleted."
+
+    def reset(self):
+        """Delete every board."""
+        Board.objects.all().delete()
+        BBS_SUBSCRIBERS.reset()
+
+    # Access
+
+    def grant_access(self, board_ref, character_key, access_level="full_access"):
+        """
+        Give a character individual access to a board.
+
+        Args:
+            board_ref (int or str): Board id or name
+            character_key (str): Character name
+            access_level (str): "full_access" or "read_only"
+        """
+        board = self._get_board_row(board_ref)
+        if not board:
+            return
+        board.access_list = dict(board.access_list or {}, **{character_key: access_level})
+        board.save(update_fields=["access_list"])
+        BBS_SUBSCRIBERS.refresh_board(board)
+
+    def revoke_access(self, board_ref, character_key):
+        """Remove a character's individual access to a board."""
+        board = self._get_board_row(board_ref)
+        if not board or character_key not in (board.access_list or {}):
+            return
+        access_list = dict(board.access_list)
+        del access_list[character_key]
+        board.access_list = access_list
+        board.save(update_fields=["access_list"])
+        BBS_SUBSCRIBERS.refresh_board(board)
+
+    def get_board_groups(self, board_ref):
+        """Get the groups a board is restricted to."""
+        board = self._get_board_row(board_ref)
+        return list(board.group_names or []) if board else []
+
+    def add_group_to_board(self, board_ref, group_name):
+        """Restrict a board to an additional group."""
+        from typeclasses.groups import get_group_by_name
+
+        board = self._get_board_row(board_ref)
+        if not board:
+            return f"No board found with the name or number '{board_ref}'."
+        if not get_group_by_name(group_name):
+            return f"Error: Group '{group_name}' does not exist."
+        group_names = list(board.group_names or [])
+        if group_name in group_names:
+            return f"Board '{board.name}' is already restricted to group '{group_name}'."
+        group_names.append(group_name)
+        board.group_names = group_names
+        board.save(update_fields=["group_names"])
+        BBS_SUBSCRIBERS.refresh_board(board)
+        return f"Added group '{group_name}' to board '{board.name}'."
+
+    def remove_group_from_board(self, board_ref, group_name):
+        """Lift a board's restriction to one group."""
+        board = self._get_board_row(board_ref)
+        if not board:
+            return f"No board found with the name or number '{board_ref}'."
+        group_names = list(board.group_names or [])
+        if group_name not in group_names:
+            return f"Board '{board.name}' is not restricted to group '{group_name}'."
+        group_names.remove(group_name)
+        board.group_names = group_names
+        board.save(update_fields=["group_names"])
+        BBS_SUBSCRIBERS.refresh_board(board)
+        return f"Removed group '{group_name}' from board '{board.name}'."
+
+    def _check_access(self, board, character_key, character=None):
+        """
+        Returns:
+            tuple: (can read, character or None)
+        """
+        access_list = board.access_list or {}
+        if character is None:
+            character = _get_character(character_key)
+        if _is_staff(character) or character_key in access_list:
+            return True, character
+        if board.group_names:
+            if not character:
+                return False, character
+            from typeclasses.groups import get_group_by_name
+
+            for group_name in board.group_names:
+                group = get_group_by_name(group_name)
+                if group and group.is_member(character):
+                    return True, character
+            return False, character
+        return board.public, character
+
+    def can_read(self, board, character):
+        """
+        Check whether a known character can read a board row, without
+        looking the character up by name.
+
+        Args:
+            board (Board): The board row
+            character (Character): The character
+
+        Returns:
+            bool: True if the character can read the board
+        """
+        return self._check_access(board, character.key, character)[0]
+
+    def has_access(self, board_ref, character_key):
+        """
+        Check whether a character can read a board.
+
+        Args:
+            board_ref (int or str): Board id or name
+            character_key (str): Character name
+
+        Returns:
+            bool: True if the character can read the board
+        """
+        board = self._get_board_row(board_ref)
+        if not board:
+            return False
+        return self._check_access(board, character_key)[0]
+
+    def has_write_access(self, board_ref, character_key):
+        """
+        Check whether a character can post on a board. Read-only boards and
+        read-only grants leave posting to staff.
+        """
+        board = self._get_board_row(board_ref)
+        if not board:
+            return False
+        can_read, character = self._check_access(board, character_key)
+        if not can_read:
+            return False
+        if _is_staff(character):
+            return True
+        return not board.read_only and (board.access_list or {}).get(character_key) != "read_only"
+
+    # Posts
+
+    def create_post(self, board_ref, title, content, author):
+        """
+        Add a post to the end of a board.
+
+        Returns:
+            int or None: The new post's number
+        """
+        board = self._get_board_row(board_ref)
+        if not board:
+            return None
+        with transaction.atomic():
+            # The counter only moves forward, so a number freed by archiving
+            # is never reused under a reader's watermark
+            board = Board.objects.select_for_update().get(pk=board.pk)
+            board.last_post_number += 1
+            board.save(update_fields=["last_post_number"])
+            post = Post.objects.create(board=board, number=board.last_post_number, title=title,
+                                       content=content, author=author, created_at=int(time.time()))
+            search.index_post(post)
+        return post.number
+
+    def edit_post(self, board_ref, post_index, content):
+        """Replace a post's content."""
+        post = self._get_post_row(board_ref, post_index)
+        if not post:
+            return
+        post.content = content
+        post.edited_at = int(time.time())
+        with transaction.atomic():
+            post.save(update_fields=["content", "edited_at"])
+            search.index_post(post)
+
+    def delete_post(self, board_ref, post_index):
+        """Delete a post and renumber the posts after it."""
+        board = self._get_board_row(board_ref)
+        if not board:
+            return
+        with transaction.atomic():
+            self._remove_posts(board, [post_index + 1])
+
+    def _remove_posts(self, board, numbers):
+        """
+        Delete posts from a board, renumber the ones left and shift read
+        marks with them. Call inside a transaction.
+
+        Args:
+            board (Board): The board
+            numbers (list): Sorted 1-based numbers of the posts to remove
+        """
+        numbers = list(Post.objects.filter(board=board, number__in=numbers).order_by("number")
+                       .values_list("number", flat=True))
+        if not numbers:
+            return
+        Post.objects.filter(board=board, number__in=numbers).delete()
+        Board.objects.filter(pk=board.pk).update(last_post_number=F("last_post_number") - len(numbers))
+        # Posts between two removed numbers move down by the count removed before them
+        bounds = numbers[1:] + [None]
+        for shift, (start, end) in enumerate(zip(numbers, bounds), 1):
+            following = Post.objects.filter(board=board, number__gt=start)
+            if end is not None:
+                following = following.filter(number__lt=end)
+            following.update(number=F("number") - shift)
+
+        removed = set(numbers)
+        marks = list(ReadMark.objects.filter(board=board))
+        for mark in marks:
+            watermark, exceptions = mark.get_read()
+            mark.set_read(watermark - bisect_right(numbers, watermark),
+                          {read - bisect_left(numbers, read) for read in exceptions if read not in removed})
+        ReadMark.objects.bulk_update(marks, ["watermark", "exceptions"])
+
+    # Retention and archives
+
+    def set_retention(self, board_ref, max_posts=None, max_days=None):
+        """
+        Set how much of a board stays live before posts are archived.
+
+        Args:
+            board_ref (int or str): Board id or name
+            max_posts (int, optional): Most unpinned posts to keep
+            max_days (int, optional): Oldest unpinned post to keep, in days
+
+        Returns:
+            str: Result message
+        """
+        board = self._get_board_row(board_ref)
+        if not board:
+            return f"No board found with the name or number '{board_ref}'."
+        board.retention_posts = max_posts or None
+        board.retention_days = max_days or None
+        board.save(update_fields=["retention_posts", "retention_days"])
+        return f"Board '{board.name}' now keeps {self.describe_retention(self._board_dict(board))}."
+
+    def describe_retention(self, board):
+        """Describe a board dict's retention settings for staff."""
+        limits = []
+        if board['retention_posts']:
+            limits.append(f"the newest {board['retention_posts']} posts")
+        if board['retention_days']:
+            limits.append(f"posts from the last {board['retention_days']} days")
+        return " and ".join(limits) if limits else "every post"
+
+    def _get_expired_numbers(self, board, limit):
+        """Get the oldest unpinned post numbers past a board's retention."""
+        unpinned = Post.objects.filter(board=board, pinned=False).order_by("number")
+        expired = Q(pk__in=[])
+        if board.retention_days:
+            expired |= Q(created_at__lt=int(time.time()) - board.retention_days * 24 * 60 * 60)
+        if board.retention_posts:
+            excess = unpinned.count() - board.retention_posts
+            if excess > 0:
+                expired |= Q(number__lte=unpinned.values_list("number", flat=True)[excess - 1])
+        return list(unpinned.filter(expired).values_list("number", flat=True)[:limit])
+
+    def archive_expired(self, batch_size=BBS_ARCHIVE_BATCH_SIZE):
+        """
+        Move posts past their board's retention into the board's archive.
+
+        Args:
+            batch_size (int): Most posts to move in this call
+
+        Returns:
+            int: Posts archived
+        """
+        archived = 0
+        boards = Board.objects.filter(Q(retention_posts__isnull=False) | Q(retention_days__isnull=False))
+        for board in boards:
+            if archived >= batch_size:
+                break
+            with transaction.atomic():
+                numbers = self._get_expired_numbers(board, batch_size - archived)
+                if not numbers:
+                    continue
+                next_number = (ArchivedPost.objects.filter(board=board)
+                               .aggregate(last=Max("number"))["last"] or 0) + 1
+                now = int(time.time())
+                rows = []
+                for offset, post in enumerate(Post.objects.filter(board=board, number__in=numbers)
+                                              .order_by("number")):
+                    row = ArchivedPost(board=board, number=next_number + offset, title=post.title,
+                                       author=post.author, created_at=post.created_at, archived_at=now)
+                    row.set_body(post.content, post.edited_at)
+                    rows.append(row)
+                ArchivedPost.objects.bulk_create(rows)
+                # Live posts keep their numbers so references to them stay
+                # valid; the listing just skips the archived ones
+                Post.objects.filter(board=board, number__in=numbers).delete()
+            archived += len(numbers)
+        return archived
+
+    def get_archive_page(self, board_ref, page=1, page_size=BBS_PAGE_SIZE):
+        """
+        Get one page of a board's archive, oldest first.
+
+        Returns:
+            dict or None: Board fields plus 'posts' (archived post dicts
+                without content), 'post_count', 'page' and 'pages'
+        """
+        board = self._get_board_row(board_ref)
+        if not board:
+            return None
+        archived = ArchivedPost.objects.filter(board=board)
+        post_count = archived.count()
+        pages = max(1, -(-post_count // page_size))
+        page = min(max(page, 1), pages)
+        start = (page - 1) * page_size
+        data = self._board_dict(board)
+        data['posts'] = [
+            {'number': number, 'title': title, 'author': author, 'created_at': created_at,
+             'archived_at': archived_at}
+            for number, title, author, created_at, archived_at in archived.order_by("number")
+            .values_list("number", "title", "author", "created_at", "archived_at")[start:start + page_size]
+        ]
+        data.update(post_count=post_count, page=page, pages=pages)
+        return data
+
+    def get_archived_post(self, board_ref, number):
+        """
+        Get one archived post.
+
+        Args:
+            board_ref (int or str): Board id or name
+            number (int): 1-based archive number
+
+        Returns:
+            dict or None: The post, including 'content' and 'edited_at'
+        """
+        board = self._get_board_row(board_ref)
+        post = ArchivedPost.objects.filter(board=board, number=number).first() if board else None
+        if not post:
+            return None
+        data = {'number': post.number, 'title': post.title, 'author': post.author,
+                'created_at': post.created_at, 'archived_at': post.archived_at}
+        data.update(post.get_body())
+        return data
+
+    def pin_post(self, board_ref, post_index):
+        """Pin a post to the top of its board."""
+        return self._set_pinned(board_ref, post_index, True)
+
+    def unpin_post(self, board_ref, post_index):
+        """Return a pinned post to its normal place."""
+        return self._set_pinned(board_ref, post_index, False)
+
+    def _set_pinned(self, board_ref, post_index, pinned):
+        board = self._get_board_row(board_ref)
+        if not board:
+            return f"No board found with the name or number '{board_ref}'."
+        if not Post.objects.filter(board=board, number=post_index + 1).update(pinned=pinned):
+            return f"Invalid post number. Board '{board.name}' has {board.posts.count()} posts."
+        action = "pinned to the top" if pinned else "unpinned"
+        return f"Post {post_index + 1} in board '{board.name}' has been {action}."
+
+    def search_posts(self, terms, character_key, board_ref=None, limit=20, bypass_access=False):
+        """
+        Search post titles and content.
+
+        Args:
+            terms (str): Words to search for; posts must contain all of them
+            character_key (str): Searching character, for access checks
+            board_ref (int or str, optional): Only search this board
+            limit (int): Most results to return
+            bypass_access (bool): Search boards the character can't read
+                (staff)
+
+        Returns:
+            tuple: (list of post dicts with 'board_id' and 'board_name',
+                best first; total number of matches)
+        """
+        if board_ref is not None:
+            board = self._get_board_row(board_ref)
+            boards = [board] if board else []
+        else:
+            boards = list(Board.objects.all())
+        character = None if bypass_access else _get_character(character_key)
+        names = {board.id: board.name for board in boards
+                 if bypass_access or self._check_access(board, character_key, character)[0]}
+
+        ranked = search.search_posts(terms, names)
+        post_ids = [post_id for _, post_id in ranked[:limit]]
+        posts = Post.objects.in_bulk(post_ids)
+        results = []
+        for post_id in post_ids:
+            data = self._post_dict(posts[post_id])
+            data['board_id'] = posts[post_id].board_id
+            data['board_name'] = names[posts[post_id].board_id]
+            results.append(data)
+        return results, len(ranked)
+
+    # Read state
+
+    def _get_read(self, board, character_key):
+        mark = ReadMark.objects.filter(board=board, reader=character_key).first()
+        return mark.get_read() if mark else (0, set())
+
+    def get_unread_posts(self, board_ref, character_key):
+        """
+        Get the posts a character has not read.
+
+        Returns:
+            list: 1-based post numbers
+        """
+        board = self._get_board_row(board_ref)
+        if not board:
+            return []
+        return list(_unread_posts(board, *self._get_read(board, character_key))
+                    .values_list("number", flat=True))
+
+    def get_unread_map(self, character_key, boards=None):
+        """
+        Get the unread posts on every board with one read-mark lookup.
+
+        Args:
+            character_key (str): Character name
+            boards (list, optional): Board dicts from get_boards, to avoid
+                fetching them again
+
+        Returns:
+            dict: Board id -> list of unread 1-based post numbers
+        """
+        if boards is None:
+            boards = self.get_boards()
+        marks = {board_id: (watermark, set(exceptions or []))
+                 for board_id, watermark, exceptions in ReadMark.objects.filter(reader=character_key)
+                 .values_list("board_id", "watermark", "exceptions")}
+        unread = {board['id']: [] for board in boards}
+        if not unread:
+            return unread
+
+        # One query for the posts past each board's watermark
+        past_watermarks = Q(pk__in=[])
+        for board_id in unread:
+            past_watermarks |= Q(board_id=board_id, number__gt=marks.get(board_id, (0, set()))[0])
+        for board_id, number in (Post.objects.filter(past_watermarks).order_by("board_id", "number")
+                                 .values_list("board_id", "number")):
+            if number not in marks.get(board_id, (0, set()))[1]:
+                unread[board_id].append(number)
+        return unread
+
+    def is_post_unread(self, board_ref, post_index, character_key):
+        """Check whether a character has not read a post."""
+        board = self._get_board_row(board_ref)
+        if not board or not Post.objects.filter(board=board, number=post_index + 1).exists():
+            return False
+        watermark, exceptions = self._get_read(board, character_key)
+        return post_index + 1 > watermark and post_index + 1 not in exceptions
+
+    def mark_post_read(self, board_ref, post_index, character_key):
+        """Mark a post as read by a character."""
+        board = self._get_board_row(board_ref)
+        if not board:
+            return
+        number = post_index + 1
+        with transaction.atomic():
+            mark, _ = ReadMark.objects.select_for_update().get_or_create(board=board, reader=character_key)
+            watermark, exceptions = mark.get_read()
+            if number <= watermark or number in exceptions:
+                return
+            exceptions.add(number)
+            # Move the watermark up to the first unread post, stepping over
+            # numbers left free by archived posts
+            first_unread = _unread_posts(board, watermark, exceptions).values_list("number", flat=True).first()
+            if first_unread is None:
+                watermark = max(exceptions)
+            else:
+                watermark = first_unread - 1
+            mark.set_read(watermark, exceptions)
+            mark.save(update_fields=["watermark", "exceptions"])
+
+    def mark_all_read(self, board_ref, character_key):
+        """Mark every post on a board as read by a character."""
+        board = self._get_board_row(board_ref)
+        if not board:
+            return
+        last = board.posts.aggregate(last=Max("number"))["last"] or 0
+        ReadMark.objects.update_or_create(board=board, reader=character_key,
+                                          defaults={"watermark": last, "exceptions": []})
+
+
+BBS_STORAGE = BBSStorage()
+
+
+def migrate_legacy_boards():
+    """
+    Copy the boards from the old BBSController object into the BBS tables.
+
+    Boards keep their numbers; posts keep their order and read markers.
+    Boards whose name already exists in the tables are skipped, so running
+    it twice does not duplicate anything.
+
+    Returns:
+        tuple: (boards, posts) copied
+    """
+    from evennia.objects.models import ObjectDB
+
+    legacy = ObjectDB.objects.filter(db_key="BBSController").first()
+    boards = legacy.attributes.get("boards") if legacy else None
+    if not boards:
+        return 0, 0
+
+    existing = {name.lower() for name in Board.objects.values_list("name", flat=True)}
+    taken_ids = set(Board.objects.values_list("id", flat=True))
+    board_count = post_count = 0
+    with transaction.atomic():
+        for board_id, data in sorted(boards.items(), key=lambda item: item[0]):
+            if data['name'].lower() in existing:
+                continue
+            board = Board(name=data['name'], description=data.get('description', ''),
+                          public=data.get('public', True), locked=data.get('locked', False),
+                          read_only=data.get('read_only', False),
+                          group_names=list(data.get('group_names') or []),
+                          access_list=dict(data.get('access_list') or {}),
+                          last_post_number=len(data.get('posts', [])))
+            if board_id not in taken_ids:
+                board.id = board_id
+            board.save()
+            board_count += 1
+
+            posts = []
+            for number, post in enumerate(data.get('posts', []), start=1):
+                posts.append(Post(board=board, number=number, title=post.get('title', ''),
+                                  content=post.get('content', ''), author=post.get('author', ''),
+                                  created_at=_parse_legacy_time(post.get('created_at')) or int(time.time()),
+                                  edited_at=_parse_legacy_time(post.get('edited_at')),
+                                  pinned=post.get('pinned', False)))
+            posts = Post.objects.bulk_create(posts)
+            post_count += len(posts)
+            if not connection.features.can_return_rows_from_bulk_insert:
+                # No pks back from the bulk insert on this backend
+                posts = Post.objects.filter(board=board).order_by("number")
+            for post in posts:
+                search.index_post(post)
+
+            read = {}
+            for number, post in enumerate(data.get('posts', []), start=1):
+                for reader in post.get('read_by', []):
+                    read.setdefault(reader, set()).add(number)
+            marks = []
+            for reader, numbers in read.items():
+                mark = ReadMark(board=board, reader=reader)
+                mark.set_read(0, numbers)
+                marks.append(mark)
+            ReadMark.objects.bulk_create(marks)
+
+        # Explicit ids leave the id sequence behind on some databases
+        from django.core.management.color import no_style
+
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [Board]):
+                cursor.execute(sql)
+
+    logger.log_info(f"BBS: migrated {board_count} boards and {post_count} posts.")
+    return board_count, post_count
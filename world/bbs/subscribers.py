@@ -0,0 +1,114 @@
+"""
+Board subscriber index for BBS notifications.
+
+Maps each board to the online characters who can read it and have not
+unsubscribed from it, so announcing a new post walks only the characters
+who will hear it. Access is checked once per board and character when a
+character comes online or a board's access changes, rather than for every
+session on every post. Kept in sync by puppet/unpuppet, the BBS storage's
+access methods and +bbs/subscribe and /unsubscribe. The bbs_subscribers
+script rebuilds the whole index when it starts and then every
+BBS_SUBSCRIBERS_REBUILD_INTERVAL seconds, to pick up access changes made
+outside those hooks (group membership, permissions); posting never does.
+"""
+
+from world.utils.session_activity import SESSION_ACTIVITY
+
+# Seconds between full rebuilds by the bbs_subscribers script
+BBS_SUBSCRIBERS_REBUILD_INTERVAL = 5 * 60
+
+
+class BoardSubscribers:
+    """
+    Board id -> {character id: character} for online, eligible readers.
+    """
+
+    def __init__(self):
+        self._by_board = {}
+
+    def rebuild(self):
+        """Re-check every board for every online character."""
+        from world.bbs.models import Board
+
+        self._by_board = {}
+        boards = list(Board.objects.all())
+        for puppet in SESSION_ACTIVITY.get_online_puppets():
+            self._index_puppet(puppet, boards)
+
+    def _index_puppet(self, puppet, boards):
+        from world.bbs.storage import BBS_STORAGE
+
+        unsubscribed = puppet.attributes.get("unsubscribed_bbs_boards", []) or []
+        for board in boards:
+            if board.id not in unsubscribed and BBS_STORAGE.can_read(board, puppet):
+                self._by_board.setdefault(board.id, {})[puppet.id] = puppet
+
+    def refresh_puppet(self, puppet):
+        """
+        Re-check every board for one character, e.g. when it comes online.
+
+        Args:
+            puppet (Character): The character to index
+        """
+        from world.bbs.models import Board
+
+        self.remove_puppet(puppet)
+        if SESSION_ACTIVITY.is_online(puppet):
+            self._index_puppet(puppet, list(Board.objects.all()))
+
+    def remove_puppet(self, puppet):
+        """Drop a character that went offline from every board."""
+        for subscribers in self._by_board.values():
+            subscribers.pop(puppet.id, None)
+
+    def refresh_subscription(self, puppet, board_id):
+        """
+        Re-check one board for one character after it subscribes or
+        unsubscribes.
+
+        Args:
+            puppet (Character): The character
+            board_id (int): The board's id
+        """
+        from world.bbs.models import Board
+
+        self._by_board.get(board_id, {}).pop(puppet.id, None)
+        board = Board.objects.filter(id=board_id).first()
+        if board and SESSION_ACTIVITY.is_online(puppet):
+            self._index_puppet(puppet, [board])
+
+    def refresh_board(self, board):
+        """
+        Re-check every online character for one board after its access
+        settings change.
+
+        Args:
+            board (Board): The board row
+        """
+        self._by_board.pop(board.id, None)
+        for puppet in SESSION_ACTIVITY.get_online_puppets():
+            self._index_puppet(puppet, [board])
+
+    def remove_board(self, board_id):
+        """Forget a deleted board."""
+        self._by_board.pop(board_id, None)
+
+    def reset(self):
+        """Forget every board, e.g. after the BBS is wiped."""
+        self._by_board = {}
+
+    def get_subscribers(self, board_id):
+        """
+        Get the online characters to notify about a board.
+
+        Args:
+            board_id (int): The board's id
+
+        Returns:
+            list: Characters who can read the board and have not
+                unsubscribed from it
+        """
+        return list(self._by_board.get(board_id, {}).values())
+
+
+BBS_SUBSCRIBERS = BoardSubscribers()
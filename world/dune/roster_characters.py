@@ -135,8 +135,8 @@ She typically wears elaborate robes befitting her station as Regent."""
     char.db.determination = 3
     
     # Languages
-    char.db.languages = ["The Truth", "Fremen Chakobsa", "Galach", "Bene Gesserit Battle Language"]
     char.db.speaking_language = "Galach"
+    char.set_languages(["The Truth", "Fremen Chakobsa", "Galach", "Bene Gesserit Battle Language"])
     
     # Relationships
     char.db.relationships = """Sister of Paul Muad'Dib (missing). Aunt to Leto II and Ghanima. 
@@ -234,8 +234,8 @@ Fremen. When he gazes into the distance, it's as if he's looking through time it
     char.db.determination = 3
     
     # Languages
-    char.db.languages = ["Fremen Chakobsa", "Galach", "The Truth"]
     char.db.speaking_language = "Chakobsa"
+    char.set_languages(["Fremen Chakobsa", "Galach", "The Truth"])
     
     # Relationships
     char.db.relationships = """Son of Paul Muad'Dib (missing) and Chani (deceased). Twin brother of 
@@ -331,8 +331,8 @@ in stillsuit or formal robes. Her gaze carries ancient wisdom."""
     char.db.determination = 3
     
     # Languages
-    char.db.languages = ["Fremen Chakobsa", "Galach", "The Truth", "Bene Gesserit Battle Language"]
     char.db.speaking_language = "Chakobsa"
+    char.set_languages(["Fremen Chakobsa", "Galach", "The Truth", "Bene Gesserit Battle Language"])
     
     # Relationships
     char.db.relationships = """Daughter of Paul Muad'Dib (missing) and Chani (deceased). Twin sister 
@@ -432,8 +432,8 @@ of existential unease."""
     char.db.determination = 3
     
     # Languages
-    char.db.languages = ["Galach", "Chakobsa", "The Truth"]
     char.db.speaking_language = "Galach"
+    char.set_languages(["Galach", "Chakobsa", "The Truth"])
     
     # Relationships
     char.db.relationships = """Husband of Alia Atreides (Regent). Legendary retainer of House 
@@ -534,8 +534,8 @@ deep sadness."""
     char.db.determination = 3
     
     # Languages
-    char.db.languages = ["Galach", "The Truth", "Bene Gesserit Battle Language", "Ancient Imperial Tongues"]
     char.db.speaking_language = "Galach"
+    char.set_languages(["Galach", "The Truth", "Bene Gesserit Battle Language", "Ancient Imperial Tongues"])
     
     # Relationships
     char.db.relationships = """Widow of Paul Atreides (missing). Daughter of deposed Emperor 
@@ -636,8 +636,8 @@ ducal concubine. Her green Atreides eyes miss nothing, and her presence commands
     char.db.determination = 3
     
     # Languages
-    char.db.languages = ["Galach", "The Truth", "Bene Gesserit Battle Language", "Chakobsa", "Ancient Tongues"]
     char.db.speaking_language = "Galach"
+    char.set_languages(["Galach", "The Truth", "Bene Gesserit Battle Language", "Chakobsa", "Ancient Tongues"])
     
     # Relationships
     char.db.relationships = """Mother of Paul Atreides (missing) and Alia Atreides (Regent). 
@@ -737,8 +737,8 @@ He wears traditional Fremen robes and carries himself with the quiet authority o
     char.db.determination = 3
     
     # Languages
-    char.db.languages = ["Fremen Chakobsa", "Galach"]
     char.db.speaking_language = "Chakobsa"
+    char.set_languages(["Fremen Chakobsa", "Galach"])
     
     # Relationships
     char.db.relationships = """Guardian to Leto II and Ghanima. Naib of Sietch Tabr. Faithful 
@@ -839,8 +839,8 @@ a master warrior."""
     char.db.determination = 3
     
     # Languages
-    char.db.languages = ["Galach", "Chakobsa", "Various military dialects"]
     char.db.speaking_language = "Galach"
+    char.set_languages(["Galach", "Chakobsa", "Various military dialects"])
     
     # Relationships
     char.db.relationships = """Warmaster of House Atreides. Served Duke Leto (deceased) and 
@@ -0,0 +1,7 @@
+"""
+Scene Logging
+
+Django app holding compacted scene logs. Poses, says and emits are
+buffered in memory by world.scenes.logger.SCENE_LOGGER and written here
+in batches, one compressed record per scene.
+"""
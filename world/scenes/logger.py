@@ -0,0 +1,169 @@
+"""
+Buffered scene logger.
+
+Recording a pose is a single append to a per-room in-memory buffer. The
+buffers are written to the database in batches when the scene log script
+ticks, when a log is read, on server stop, and just after the pose that
+fills a room's buffer; never from inside the pose itself. Scenes that
+have ended are compacted into one record by the scene log script.
+"""
+
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+from django.db import transaction
+
+from evennia.utils import logger
+from evennia.utils.utils import delay
+
+# Entries per room after which a flush is scheduled without waiting for
+# the next tick
+SCENE_LOG_BUFFER_SIZE = 50
+
+# Hard cap per room; if flushing keeps failing the oldest entries are dropped
+SCENE_LOG_BUFFER_MAX = SCENE_LOG_BUFFER_SIZE * 20
+
+# Ended scenes compacted per tick
+SCENE_LOG_COMPACT_BATCH = 20
+
+# Seconds between timed flushes (see typeclasses.scenes.SceneLogScript)
+SCENE_LOG_FLUSH_INTERVAL = 60
+
+# Seconds of silence in a room after which the next line starts a new scene
+SCENE_IDLE_TIMEOUT = 60 * 60
+
+
+class SceneLogger:
+    """
+    Per-room ring buffers of scene activity with batched persistence.
+    """
+
+    def __init__(self):
+        self._buffers = {}      # room id -> deque of entries
+        self._room_names = {}   # room id -> room key at time of logging
+        self._scenes = {}       # room id -> SceneLog currently being written
+
+    def record(self, room, speaker, kind, text, language=None, hidden_text=None):
+        """
+        Buffer one line of scene activity.
+
+        Args:
+            room (Room): Where it happened
+            speaker (Character): Who posed, said or emitted it
+            kind (str): "say", "pose" or "emit"
+            text (str): The text as seen by those who understand it
+            language (str, optional): Language of any tagged speech
+            hidden_text (str, optional): The text as seen by those who
+                don't understand the language
+        """
+        buffer = self._buffers.get(room.id)
+        if buffer is None:
+            buffer = deque(maxlen=SCENE_LOG_BUFFER_MAX)
+            self._buffers[room.id] = buffer
+        self._room_names[room.id] = room.key
+        buffer.append((time.time(), speaker.key, kind, language, text, hidden_text))
+        if len(buffer) == SCENE_LOG_BUFFER_SIZE:
+            # Write the batch once the command is done. A buffer left over
+            # from a failed flush is already past this size, so it waits
+            # for the next tick instead of retrying on every pose.
+            delay(0, self.flush, room.id)
+
+    def flush(self, room_id=None):
+        """
+        Write buffered entries to their scene records.
+
+        Args:
+            room_id (int, optional): Only flush this room
+
+        Returns:
+            int: Number of entries written
+        """
+        room_ids = [room_id] if room_id is not None else list(self._buffers)
+        written = 0
+        for rid in room_ids:
+            buffer = self._buffers.get(rid)
+            if not buffer:
+                continue
+            entries = list(buffer)
+            buffer.clear()
+            try:
+                with transaction.atomic():
+                    self._persist(rid, entries)
+                written += len(entries)
+            except Exception:
+                logger.log_trace(f"Scene log flush failed for room #{rid}; entries kept in buffer.")
+                # The cached scene may hold unsaved changes; reload it next time
+                self._scenes.pop(rid, None)
+                buffer.extendleft(reversed(entries))
+        return written
+
+    def get_current_scene(self, room_id):
+        """
+        Get the scene currently being logged in a room, flushing it first.
+
+        Args:
+            room_id (int): The room's id
+
+        Returns:
+            SceneLog or None: The most recent scene for the room
+        """
+        from world.scenes.models import SceneLog
+
+        self.flush(room_id)
+        scene = self._scenes.get(room_id)
+        if scene is None:
+            scene = SceneLog.objects.filter(room_id=room_id).first()
+        return scene
+
+    def _persist(self, room_id, entries):
+        """
+        Append entries to the room's scene, starting new scenes at idle gaps.
+        """
+        from world.scenes.models import SceneLog
+
+        scene = self._scenes.get(room_id)
+        if scene is None:
+            scene = SceneLog.objects.filter(room_id=room_id).first()
+        last_ts = scene.last_activity.timestamp() if scene else None
+
+        pending = []
+        for entry in entries:
+            if scene is None or entry[0] - last_ts > SCENE_IDLE_TIMEOUT:
+                if pending:
+                    scene.append_entries(pending)
+                    pending = []
+                started = datetime.fromtimestamp(entry[0], tz=timezone.utc)
+                scene = SceneLog(room_id=room_id, room_name=self._room_names.get(room_id, ""),
+                                 started_at=started, last_activity=started)
+            pending.append(entry)
+            last_ts = entry[0]
+
+        if pending:
+            scene.append_entries(pending)
+        self._scenes[room_id] = scene
+
+    def compact_ended(self, limit=SCENE_LOG_COMPACT_BATCH):
+        """
+        Merge the chunks of scenes that have gone idle into their records.
+
+        Args:
+            limit (int): Most scenes to compact
+
+        Returns:
+            int: Number of scenes compacted
+        """
+        from world.scenes.models import SceneLog
+
+        cutoff = datetime.fromtimestamp(time.time() - SCENE_IDLE_TIMEOUT, tz=timezone.utc)
+        scenes = list(SceneLog.objects.filter(last_activity__lt=cutoff, chunks__isnull=False)
+                      .distinct()[:limit])
+        for scene in scenes:
+            # Safe even if more lines arrive later: they become new chunks
+            # after the compacted record
+            with transaction.atomic():
+                scene.compact()
+        return len(scenes)
+
+
+SCENE_LOGGER = SceneLogger()
@@ -0,0 +1,43 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SceneLog",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("room_id", models.IntegerField(db_index=True)),
+                ("room_name", models.CharField(blank=True, max_length=255)),
+                ("started_at", models.DateTimeField()),
+                ("last_activity", models.DateTimeField()),
+                ("entry_count", models.PositiveIntegerField(default=0)),
+                ("participants", models.TextField(blank=True)),
+                ("data", models.BinaryField(default=b"")),
+            ],
+            options={
+                "ordering": ["-last_activity"],
+                "indexes": [
+                    models.Index(fields=["room_id", "-last_activity"], name="scenelog_room_activity"),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="SceneLogChunk",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("data", models.BinaryField()),
+                ("scene", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE,
+                                            related_name="chunks", to="scenes.scenelog")),
+            ],
+            options={
+                "ordering": ["id"],
+            },
+        ),
+    ]
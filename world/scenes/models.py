@@ -0,0 +1,121 @@
+"""
+Scene log models.
+"""
+
+import json
+import zlib
+from datetime import datetime, timezone
+
+from django.db import models
+
+
+def _pack_entries(entries):
+    return zlib.compress(json.dumps([list(entry) for entry in entries]).encode("utf-8"))
+
+
+def _unpack_entries(data):
+    if not data:
+        return []
+    return json.loads(zlib.decompress(bytes(data)).decode("utf-8"))
+
+
+class SceneLog(models.Model):
+    """
+    One compacted log record per scene.
+
+    While a scene is running, each batch flush adds a SceneLogChunk row,
+    so logging more of it never rewrites what is already stored. Once the
+    scene goes idle its chunks are merged into data, a zlib-compressed
+    JSON list of rows, and deleted.
+    """
+
+    room_id = models.IntegerField(db_index=True)
+    room_name = models.CharField(max_length=255, blank=True)
+    started_at = models.DateTimeField()
+    last_activity = models.DateTimeField()
+    entry_count = models.PositiveIntegerField(default=0)
+    participants = models.TextField(blank=True)
+    data = models.BinaryField(default=b"")
+
+    class Meta:
+        ordering = ["-last_activity"]
+        indexes = [
+            models.Index(fields=["room_id", "-last_activity"], name="scenelog_room_activity"),
+        ]
+
+    def __str__(self):
+        return f"Scene #{self.id} in {self.room_name}"
+
+    def get_entries(self):
+        """
+        Decompress the stored entries.
+
+        Returns:
+            list: [timestamp, speaker, kind, language, text, hidden_text]
+                rows, in the order they happened
+        """
+        entries = _unpack_entries(self.data)
+        for data in self.chunks.order_by("id").values_list("data", flat=True):
+            entries.extend(_unpack_entries(data))
+        return entries
+
+    def get_participants(self):
+        """
+        Returns:
+            list: Names of everyone who spoke in the scene
+        """
+        return [name for name in self.participants.split(",") if name]
+
+    def append_entries(self, entries):
+        """
+        Store a batch of new entries as a chunk and save the scene.
+
+        Args:
+            entries (list): (timestamp, speaker, kind, language, text,
+                hidden_text) rows
+        """
+        if not entries:
+            return
+        self.entry_count += len(entries)
+        self.last_activity = datetime.fromtimestamp(entries[-1][0], tz=timezone.utc)
+
+        participants = self.get_participants()
+        for entry in entries:
+            if entry[1] not in participants:
+                participants.append(entry[1])
+        self.participants = ",".join(participants)
+        if self.pk is None:
+            self.save()
+        else:
+            # data is left alone; it may have been compacted since this
+            # instance was loaded
+            self.save(update_fields=["entry_count", "last_activity", "participants"])
+        SceneLogChunk.objects.create(scene=self, data=_pack_entries(entries))
+
+    def compact(self):
+        """
+        Merge the scene's chunks into its compressed record and delete
+        them. Call inside a transaction, once the scene has ended.
+        """
+        chunks = list(self.chunks.order_by("id").values_list("id", "data"))
+        if not chunks:
+            return
+        entries = _unpack_entries(self.data)
+        for _, data in chunks:
+            entries.extend(_unpack_entries(data))
+        self.data = _pack_entries(entries)
+        self.save(update_fields=["data"])
+        SceneLogChunk.objects.filter(id__in=[chunk_id for chunk_id, _ in chunks]).delete()
+
+
+class SceneLogChunk(models.Model):
+    """
+    One flushed batch of a running scene's entries, stored as a
+    zlib-compressed JSON list of rows until the scene is compacted.
+    """
+
+    scene = models.ForeignKey(SceneLog, on_delete=models.CASCADE, related_name="chunks")
+    data = models.BinaryField()
+
+    class Meta:
+        ordering = ["id"]
@@ -1,10 +1,10 @@
-from evennia import create_object
-from typeclasses.bbs_controller import BBSController
+from world.bbs.storage import BBS_STORAGE
 
 def get_or_create_bbs_controller():
-    try:
-        controller = BBSController.objects.get(db_key="BBSController")
-    except BBSController.DoesNotExist:
-        controller = create_object(BBSController, key="BBSController")
-        controller.db.boards = {}  # Initialize with an empty boards dictionary
-    return controller
\ No newline at end of file
+    """
+    Get the bulletin board controller.
+
+    Boards live in the world.bbs tables, so there is nothing to create;
+    this returns the shared storage controller.
+    """
+    return BBS_STORAGE
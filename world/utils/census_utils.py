@@ -0,0 +1,257 @@
+"""
+Incrementally maintained census counters for +census.
+
+Each approved character contributes a small set of (bucket, name) keys:
+its template, its template sub-category and every positive stat in the
+census stat categories. The counters keep the per-character keys and the
+totals; updating one character subtracts its old keys and adds its new
+ones. A background reconciliation pass (typeclasses.census.CensusScript)
+re-reads characters in batches to catch changes made outside the hooks,
+such as approval through @set.
+"""
+
+# Stat categories +census can break down
+CENSUS_STAT_CATEGORIES = ("attributes", "skills", "merits", "advantages")
+
+# Template-specific bio fields - PRIMARY field comes first
+TEMPLATE_FIELDS = {
+    'Vampire': ['clan', 'covenant'],
+    'Mage': ['path', 'order', 'legacy'],
+    'Changeling': ['seeming', 'kith', 'court', 'entitlement'],
+    'Werewolf': ['tribe', 'auspice', 'lodge'],
+    'Hunter': ['compact', 'profession'],
+    'Mortal': ['profession', 'organization'],
+    'Mortal+': ['type', 'organization'],
+    'Demon': ['incarnation', 'agenda', 'catalyst'],
+    'Beast': ['family', 'hunger', 'horror'],
+    'Deviant': ['origin', 'clade', 'scar'],
+    'Promethean': ['lineage', 'refinement', 'creator'],
+    'Geist': ['archetype', 'threshold']
+}
+DEFAULT_TEMPLATE_FIELDS = ['clan', 'covenant', 'tribe', 'court', 'order']
+
+# Templates whose sub-category is shown as "Primary (Secondary)"
+COMBINED_FIELDS = {
+    'Changeling': ('seeming', 'court'),
+    'Vampire': ('clan', 'covenant'),
+    'Werewolf': ('tribe', 'auspice'),
+    'Mage': ('path', 'order'),
+}
+
+# Characters re-read per reconciliation tick
+CENSUS_BATCH_SIZE = 200
+
+# Seconds between the end of one reconciliation pass and the start of the next
+CENSUS_RECONCILE_INTERVAL = 60 * 60
+
+
+def _is_set(value):
+    return bool(value) and value != "<not set>" and bool(str(value).strip())
+
+
+def get_subcategory(template, bio):
+    """
+    Get the +census <template> category a character falls under.
+
+    Args:
+        template (str): The character's template
+        bio (dict): The character's bio stats
+
+    Returns:
+        str: Category name, or "Unspecified"
+    """
+    fields = TEMPLATE_FIELDS.get(template, DEFAULT_TEMPLATE_FIELDS)
+    if not _is_set(bio.get(fields[0])):
+        return "Unspecified"
+
+    if template in COMBINED_FIELDS:
+        primary, secondary = (bio.get(field, '') for field in COMBINED_FIELDS[template])
+        if not _is_set(primary):
+            return "Unspecified"
+        if _is_set(secondary):
+            return f"{primary} ({secondary})"
+        return f"{primary}"
+    return f"{bio.get(fields[0])}"
+
+
+def get_census_keys(character):
+    """
+    Get the census keys a character contributes.
+
+    Args:
+        character (Character): The character to count
+
+    Returns:
+        tuple: (bucket, name) pairs; empty if the character is not
+            approved or has no stats
+    """
+    if not character.db.approved:
+        return ()
+    stats = character.db.stats
+    if not stats:
+        return ()
+
+    raw_template = stats.get("other", {}).get("template", "Unknown")
+    template = "Mortal" if raw_template == "Unknown" else raw_template
+    keys = [("template", template),
+            (f"template:{raw_template}", get_subcategory(raw_template, stats.get("bio", {})))]
+
+    for category in CENSUS_STAT_CATEGORIES:
+        for stat_name, value in stats.get(category, {}).items():
+            if category == "merits":
+                counted = isinstance(value, dict) and value.get("dots", 0) > 0
+            else:
+                counted = isinstance(value, (int, float)) and value > 0
+            if counted:
+                keys.append((category, stat_name.replace('_', ' ').title()))
+    return tuple(keys)
+
+
+class CensusCounters:
+    """
+    Character id -> census keys, plus bucket -> {name: count} totals.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._totals = {}
+        self.loaded = False
+        self.dirty = False
+
+        # State of the reconciliation pass in progress
+        self._pass_entries = None
+        self._pass_touched = set()
+        self._pass_last_id = 0
+
+    def _apply(self, keys, delta):
+        for bucket, name in keys:
+            counts = self._totals.setdefault(bucket, {})
+            counts[name] = counts.get(name, 0) + delta
+            if counts[name] <= 0:
+                del counts[name]
+
+    def load(self, entries):
+        """
+        Restore counters from saved per-character keys.
+
+        Args:
+            entries (dict): Character id -> census keys
+        """
+        self._entries = {}
+        self._totals = {}
+        for char_id, keys in entries.items():
+            keys = tuple(tuple(key) for key in keys)
+            self._entries[char_id] = keys
+            self._apply(keys, 1)
+        self.loaded = True
+        self.dirty = False
+
+    def export(self):
+        """Get the per-character keys for saving."""
+        self.dirty = False
+        return dict(self._entries)
+
+    def update(self, character):
+        """
+        Recount one character after its approval or stats changed.
+
+        Args:
+            character (Character): The changed character
+        """
+        keys = get_census_keys(character)
+        old = self._entries.get(character.id, ())
+        if self._pass_entries is not None:
+            self._pass_touched.add(character.id)
+        if keys == old:
+            return
+        self._apply(old, -1)
+        self._apply(keys, 1)
+        if keys:
+            self._entries[character.id] = keys
+        else:
+            self._entries.pop(character.id, None)
+        self.dirty = True
+
+    def remove(self, character):
+        """Stop counting a deleted character."""
+        old = self._entries.pop(character.id, None)
+        if old:
+            self._apply(old, -1)
+            self.dirty = True
+        if self._pass_entries is not None:
+            self._pass_entries.pop(character.id, None)
+
+    def get_counts(self, bucket):
+        """
+        Get the counts for one census bucket.
+
+        Args:
+            bucket (str): "template", "template:<Template>" or a stat category
+
+        Returns:
+            dict: Name -> count
+        """
+        return dict(self._totals.get(bucket, {}))
+
+    def reconcile_batch(self, batch_size=CENSUS_BATCH_SIZE):
+        """
+        Re-read the next batch of characters in the current reconciliation
+        pass, starting a pass if none is running.
+
+        Returns:
+            bool: True if this batch finished the pass
+        """
+        from typeclasses.characters import Character
+
+        if self._pass_entries is None:
+            self._pass_entries = {}
+            self._pass_touched = set()
+            self._pass_last_id = 0
+
+        batch = list(Character.objects.all_family()
+                     .filter(id__gt=self._pass_last_id).order_by("id")[:batch_size])
+        for character in batch:
+            keys = get_census_keys(character)
+            if keys:
+                self._pass_entries[character.id] = keys
+            self._pass_last_id = character.id
+        if len(batch) == batch_size:
+            return False
+
+        # Characters updated through the hooks during the pass keep their
+        # live keys; everything else takes the freshly read ones
+        entries = self._pass_entries
+        for char_id in self._pass_touched:
+            if char_id in self._entries:
+                entries[char_id] = self._entries[char_id]
+            else:
+                entries.pop(char_id, None)
+        self._pass_entries = None
+        if entries != self._entries:
+            self.load(entries)
+            self.dirty = True
+        self.loaded = True
+        return True
+
+
+CENSUS = CensusCounters()
+
+
+def get_census():
+    """
+    Get the census counters, loading saved ones on first use after a
+    restart. With nothing saved yet the counters stay partial (only what
+    the hooks have counted) until the census script finishes a pass;
+    check CENSUS.loaded.
+
+    Returns:
+        CensusCounters: The shared counters
+    """
+    if not CENSUS.loaded:
+        from evennia import GLOBAL_SCRIPTS
+
+        script = GLOBAL_SCRIPTS.census
+        entries = script.db.entries if script else None
+        if entries is not None:
+            CENSUS.load(entries)
+    return CENSUS
@@ -0,0 +1,146 @@
+"""
+Deferred delivery for +jobs notifications.
+
+Job commands queue their mail, staff notices and Jobs channel posts here
+instead of creating mail and walking sessions while the command runs. The
+queue is delivered JOB_NOTIFY_DELAY seconds after the first update comes
+in, once the command has returned. Everything queued for the same job and
+recipient in that window is collapsed into one digest: one mail holding
+every update, and one notice line for online staff. Mail rows, their
+sender and receiver links and their tags are written with bulk inserts.
+"""
+
+from django.db import connection, transaction
+
+from evennia.comms.models import Msg
+from evennia.typeclasses.tags import Tag
+from evennia.utils import create, logger
+from evennia.utils.utils import delay
+
+# Seconds updates are collected before delivery; updates to the same job in
+# this window become one digest
+JOB_NOTIFY_DELAY = 5
+
+# Tags every job mail carries so it shows up as new @mail
+JOB_MAIL_TAGS = ("new", "mail", "job")
+
+
+def _get_mail_tags():
+    tags = []
+    for key in JOB_MAIL_TAGS:
+        tag = Tag.objects.filter(db_key=key, db_category="mail", db_model="msg", db_tagtype=None).first()
+        tags.append(tag or Tag.objects.create(db_key=key, db_category="mail", db_model="msg", db_tagtype=None))
+    return tags
+
+
+def _create_one_mail(sender, receiver, subject, body):
+    mail = create.create_message(sender, body, receivers=receiver, header=subject)
+    for key in JOB_MAIL_TAGS:
+        mail.tags.add(key, category="mail")
+
+
+def _create_mail(mails):
+    """
+    Create job mail in bulk. Needs a backend that returns ids from bulk
+    inserts.
+
+    Args:
+        mails (list): (sender account, receiver account, subject, body)
+    """
+    with transaction.atomic():
+        messages = Msg.objects.bulk_create([Msg(db_header=subject, db_message=body)
+                                            for _, _, subject, body in mails])
+        senders = Msg.db_sender_accounts.through
+        receivers = Msg.db_receivers_accounts.through
+        tagged = Msg.db_tags.through
+        senders.objects.bulk_create([senders(msg_id=message.id, accountdb_id=sender.id)
+                                     for message, (sender, _, _, _) in zip(messages, mails)])
+        receivers.objects.bulk_create([receivers(msg_id=message.id, accountdb_id=receiver.id)
+                                       for message, (_, receiver, _, _) in zip(messages, mails)])
+        tags = _get_mail_tags()
+        tagged.objects.bulk_create([tagged(msg_id=message.id, tag_id=tag.id)
+                                    for message in messages for tag in tags])
+
+
+class JobNotificationQueue:
+    """
+    Job notifications waiting to be delivered, collapsed per job and
+    recipient.
+    """
+
+    def __init__(self):
+        self._mail = {}         # (job id, account id) -> [job, sender, account, [messages]]
+        self._notices = {}      # (job id, account id) -> [job, account, [actor names]]
+        self._channel_posts = []
+        self._scheduled = False
+
+    def _schedule(self):
+        if not self._scheduled:
+            self._scheduled = True
+            delay(JOB_NOTIFY_DELAY, self.flush)
+
+    def queue_mail(self, job, sender, recipient, message):
+        """
+        Queue a mail about a job.
+
+        Args:
+            job (Job): The job
+            sender (Account): Account the mail is from
+            recipient (Account): Account to mail
+            message (str): The update, without the job header
+        """
+        entry = self._mail.setdefault((job.id, recipient.id), [job, sender, recipient, []])
+        entry[3].append(message)
+        self._schedule()
+
+    def queue_staff_notice(self, job, account, actor_name):
+        """Queue a one-line notice to a staff account about a job change."""
+        entry = self._notices.setdefault((job.id, account.id), [job, account, []])
+        if actor_name not in entry[2]:
+            entry[2].append(actor_name)
+        self._schedule()
+
+    def queue_channel_post(self, channel, text):
+        """Queue a message to the Jobs channel."""
+        self._channel_posts.append((channel, text))
+        self._schedule()
+
+    def flush(self):
+        """Deliver everything queued."""
+        mail, notices, channel_posts = self._mail, self._notices, self._channel_posts
+        self._mail, self._notices, self._channel_posts = {}, {}, []
+        self._scheduled = False
+
+        mails = [
+            (sender, recipient,
+             f"Job #{job.id} Update" if len(messages) == 1 else f"Job #{job.id} Updates ({len(messages)})",
+             f"Job #{job.id}: {job.title}\n\n" + "\n\n".join(messages))
+            for job, sender, recipient, messages in mail.values()
+        ]
+        delivered = []
+        if mails and connection.features.can_return_rows_from_bulk_insert:
+            try:
+                _create_mail(mails)
+                delivered = list(mail.values())
+            except Exception:
+                # Don't let one bad mail sink the batch; retry each on its own
+                logger.log_trace("Failed to create job notification mail in bulk; sending one by one.")
+        if len(delivered) < len(mails):
+            for entry, args in zip(mail.values(), mails):
+                try:
+                    _create_one_mail(*args)
+                    delivered.append(entry)
+                except Exception:
+                    logger.log_trace(f"Failed to create job #{entry[0].id} mail to {entry[2]}.")
+
+        for job, _, recipient, _ in delivered:
+            if recipient.is_connected:
+                recipient.msg(f"|yYou have received new mail about job #{job.id}. Type '@mail' to view.|n")
+        for job, account, actors in notices.values():
+            if account.is_connected:
+                account.msg(f"|yJob #{job.id} update: {', '.join(actors)} made changes to this job.|n")
+        for channel, text in channel_posts:
+            channel.msg(text)
+
+
+JOB_NOTIFIER = JobNotificationQueue()
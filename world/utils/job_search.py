@@ -0,0 +1,227 @@
+"""
+Search index for +jobs/search.
+
+Keeps an inverted index (token -> {job id: occurrences}) over the title,
+description and comments of every job, live and archived, along with the
+fields +jobs/search filters on. After a restart the job_search script
+builds it one batch per tick; from then on the job commands re-index a
+job every time they save it, so a search only touches the postings for
+its own terms and never scans job text.
+"""
+
+import math
+
+from world.bbs.search import SEARCH_STOPWORDS, get_query_tokens, tokenize
+
+# Jobs read per tick while building the index
+JOB_SEARCH_BATCH_SIZE = 500
+
+# Build phases: live jobs, then archived jobs whose live row is gone
+_PHASE_LIVE, _PHASE_ARCHIVED, _PHASE_DONE = range(3)
+
+
+def _epoch(value):
+    return int(value.timestamp()) if value else None
+
+
+class JobDoc:
+    """
+    The searchable fields of one job.
+    """
+
+    __slots__ = ("job_id", "title", "status", "queue", "requester", "created_at",
+                 "archived", "strategic", "houses", "orgs", "counts")
+
+    def __init__(self, job, from_archive=False):
+        """
+        Args:
+            job (Job or ArchivedJob): The job; an ArchivedJob is indexed
+                under its original job number
+            from_archive (bool): Whether job is an ArchivedJob
+        """
+        self.job_id = job.original_id if from_archive else job.id
+        self.archived = from_archive or job.archive_id is not None
+        self.title = job.title
+        self.status = job.status
+        self.queue = job.queue.name if job.queue else ""
+        self.requester = job.requester.username if job.requester else ""
+        self.created_at = _epoch(job.created_at)
+
+        db = getattr(job, "db", None)
+        strategic_data = (db.strategic_data or {}) if db and db.strategic else {}
+        self.strategic = bool(db and db.strategic)
+        self.houses = {name.lower() for name in strategic_data.get('houses_involved', [])}
+        self.orgs = {name.lower() for name in strategic_data.get('organizations_involved', [])}
+
+        comments = job.comments or []
+        if isinstance(comments, str):
+            comments = [comments]
+        else:
+            comments = [comment.get('text', '') for comment in comments]
+        self.counts = {}
+        for token in tokenize(" ".join([job.title, job.description or ""] + comments)):
+            if token not in SEARCH_STOPWORDS:
+                self.counts[token] = self.counts.get(token, 0) + 1
+
+    def matches(self, filters):
+        """
+        Check a job against +jobs/search filters.
+
+        Args:
+            filters (dict): Any of 'queue', 'status', 'requester', 'house',
+                'org' (case-insensitive names), 'after' and 'before' (epoch
+                seconds) and 'strategic' (bool)
+
+        Returns:
+            bool: True if the job passes every filter
+        """
+        for field in ("queue", "status", "requester"):
+            if field in filters and getattr(self, field).lower() != filters[field].lower():
+                return False
+        if "after" in filters and (self.created_at or 0) < filters["after"]:
+            return False
+        if "before" in filters and (self.created_at or 0) >= filters["before"]:
+            return False
+        if "strategic" in filters and self.strategic != filters["strategic"]:
+            return False
+        if "house" in filters and filters["house"].lower() not in self.houses:
+            return False
+        if "org" in filters and filters["org"].lower() not in self.orgs:
+            return False
+        return True
+
+
+class JobSearchIndex:
+    """
+    Job id -> JobDoc, plus token -> {job id: occurrences}.
+    """
+
+    def __init__(self):
+        self._docs = {}
+        self._postings = {}
+        self._phase = _PHASE_LIVE
+        self._last_id = 0
+
+    def reset(self):
+        """
+        Drop the whole index and start building it again from the first
+        job, for when job numbers have changed under it.
+        """
+        self._docs = {}
+        self._postings = {}
+        self._phase = _PHASE_LIVE
+        self._last_id = 0
+
+    @property
+    def ready(self):
+        """Whether every job has been indexed since the server started."""
+        return self._phase == _PHASE_DONE
+
+    def _add(self, doc):
+        self._remove(doc.job_id)
+        self._docs[doc.job_id] = doc
+        for token, count in doc.counts.items():
+            self._postings.setdefault(token, {})[doc.job_id] = count
+
+    def _remove(self, job_id):
+        doc = self._docs.pop(job_id, None)
+        if not doc:
+            return
+        for token in doc.counts:
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(job_id, None)
+                if not postings:
+                    del self._postings[token]
+
+    def build_batch(self, batch_size=JOB_SEARCH_BATCH_SIZE):
+        """
+        Index the next batch of jobs, resuming where the last batch ended.
+
+        Args:
+            batch_size (int): Most jobs to read
+
+        Returns:
+            int: Number of jobs indexed
+        """
+        from world.jobs.models import ArchivedJob, Job
+
+        if self._phase == _PHASE_LIVE:
+            model, from_archive = Job, False
+            queryset = Job.objects.all()
+        elif self._phase == _PHASE_ARCHIVED:
+            model, from_archive = ArchivedJob, True
+            queryset = ArchivedJob.objects.exclude(original_id__in=Job.objects.values("id"))
+        else:
+            return 0
+
+        queryset = queryset.filter(id__gt=self._last_id).select_related("queue", "requester")
+        if hasattr(model, "db_attributes"):
+            # Strategic data is read from attributes; load them with the batch
+            queryset = queryset.prefetch_related("db_attributes")
+        jobs = list(queryset.order_by("id")[:batch_size])
+        for job in jobs:
+            if from_archive and job.original_id in self._docs:
+                # Already indexed from its live row
+                continue
+            self._add(JobDoc(job, from_archive=from_archive))
+
+        if len(jobs) < batch_size:
+            self._phase += 1
+            self._last_id = 0
+        else:
+            self._last_id = jobs[-1].id
+        return len(jobs)
+
+    def update_job(self, job):
+        """
+        Re-index a job after it was saved.
+
+        Args:
+            job (Job): The changed job
+        """
+        self._add(JobDoc(job))
+
+    def search(self, terms, filters=None, limit=20):
+        """
+        Find jobs containing every search term that pass the filters.
+
+        Args:
+            terms (str): Words to search for; may be empty to list every
+                job that passes the filters
+            filters (dict, optional): See JobDoc.matches
+            limit (int): Most results to return
+
+        Returns:
+            tuple: (list of JobDoc, best match first; total number of matches).
+                Until the index is ready, only jobs indexed so far are found.
+        """
+        filters = filters or {}
+        tokens = get_query_tokens(terms)
+
+        if tokens:
+            postings = [self._postings.get(token, {}) for token in tokens]
+            if not all(postings):
+                return [], 0
+            postings.sort(key=len)
+            candidates = [job_id for job_id in postings[0]
+                          if all(job_id in other for other in postings[1:])]
+        else:
+            candidates = list(self._docs)
+
+        total = len(self._docs)
+        idf = {token: math.log(1 + total / len(self._postings[token])) for token in tokens}
+        results = []
+        for job_id in candidates:
+            doc = self._docs[job_id]
+            if not doc.matches(filters):
+                continue
+            score = sum(doc.counts[token] * idf[token] for token in tokens)
+            results.append((score, job_id))
+
+        # Best score first; newest job first among equals
+        results.sort(key=lambda result: (-result[0], -result[1]))
+        return [self._docs[job_id] for _, job_id in results[:limit]], len(results)
+
+
+JOB_SEARCH = JobSearchIndex()
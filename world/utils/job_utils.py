@@ -0,0 +1,108 @@
+"""
+Helpers shared by the +jobs commands: archive numbering, comment paging
+and archive browsing.
+
+Archive numbers come from one counter row in Evennia's ServerConfig table.
+The row is locked with SELECT ... FOR UPDATE while it is advanced, so
+concurrent approvals each get the next number in one round trip instead of
+taking the max over the job tables and probing for collisions. The counter
+is seeded from the highest archive id already in use the first time it is
+needed, and starts over when the archive is cleared.
+"""
+
+from django.db import transaction
+from django.db.models import Max, Q
+
+from evennia.server.models import ServerConfig
+
+# ServerConfig key holding the last archive id handed out
+JOB_ARCHIVE_COUNTER_KEY = "JOB_ARCHIVE_LAST_ID"
+
+# Comments shown per page of +jobs <#>
+JOB_COMMENTS_PER_PAGE = 10
+
+# Archived jobs shown per page of +jobs/archive
+JOB_ARCHIVE_PAGE_SIZE = 20
+
+
+def _highest_archive_id():
+    from world.jobs.models import ArchivedJob, Job
+
+    max_archived = ArchivedJob.objects.aggregate(last=Max("archive_id"))["last"] or 0
+    max_job = Job.objects.aggregate(last=Max("archive_id"))["last"] or 0
+    return max(max_archived, max_job)
+
+
+def allocate_archive_id():
+    """
+    Get the next unused archive id.
+
+    Call it inside the transaction that archives the job: the counter row
+    stays locked until that transaction ends, and a rolled-back archive
+    gives its number back.
+
+    Returns:
+        int: The archive id
+    """
+    with transaction.atomic():
+        counter = ServerConfig.objects.select_for_update().filter(db_key=JOB_ARCHIVE_COUNTER_KEY)
+        # Read the value from the locked row, not the idmapper cache
+        last_id = counter.values_list("db_value", flat=True).first()
+        if last_id is None:
+            ServerConfig.objects.get_or_create(db_key=JOB_ARCHIVE_COUNTER_KEY,
+                                               defaults={"db_value": _highest_archive_id()})
+            last_id = counter.values_list("db_value", flat=True).first()
+        counter.update(db_value=last_id + 1)
+    return last_id + 1
+
+
+def reset_archive_ids():
+    """Start archive numbering over, after the archive has been cleared."""
+    ServerConfig.objects.filter(db_key=JOB_ARCHIVE_COUNTER_KEY).delete()
+
+
+def get_comment_page(count, page=None, per_page=JOB_COMMENTS_PER_PAGE):
+    """
+    Work out which comments to show on one page of a job.
+
+    Args:
+        count (int): Number of comments on the job
+        page (int, optional): 1-based page; defaults to the last page, which
+            holds the newest comments. Out-of-range pages are clamped.
+        per_page (int): Comments per page
+
+    Returns:
+        tuple: (start index, end index, page, number of pages)
+    """
+    pages = max(1, -(-count // per_page))
+    page = pages if page is None else min(max(page, 1), pages)
+    start = (page - 1) * per_page
+    return start, min(start + per_page, count), page, pages
+
+
+def get_archive_page(archived_jobs, cursor=None, page_size=JOB_ARCHIVE_PAGE_SIZE):
+    """
+    Get one page of archived jobs, most recently closed first.
+
+    Pages are found by keyset on (closed_at, id) rather than by offset, so
+    a page deep into the archive costs the same as the first one.
+
+    Args:
+        archived_jobs (QuerySet): Filtered ArchivedJob queryset
+        cursor (tuple, optional): (closed_at, id) of the last job on the
+            previous page
+        page_size (int): Jobs per page
+
+    Returns:
+        tuple: (list of archived jobs, cursor for the next page or None if
+            this is the last page)
+    """
+    if cursor:
+        closed_at, last_id = cursor
+        archived_jobs = archived_jobs.filter(Q(closed_at__lt=closed_at) |
+                                             Q(closed_at=closed_at, id__lt=last_id))
+    jobs = list(archived_jobs.order_by("-closed_at", "-id")[:page_size + 1])
+    if len(jobs) <= page_size:
+        return jobs, None
+    jobs = jobs[:page_size]
+    return jobs, (jobs[-1].closed_at, jobs[-1].id)
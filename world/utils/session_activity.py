@@ -0,0 +1,141 @@
+"""
+Server-wide session activity index.
+
+Maps each puppeted character to its last visible activity and its connected
+sessions, so idle times can be read in O(1) per character instead of
+scanning every session. Activity is recorded from the command pipeline by
+server.conf.serversession.ServerSession; session membership is synced on
+puppet and unpuppet.
+"""
+
+import time
+
+
+class SessionActivityIndex:
+    """
+    Puppet id -> [last activity timestamp, {session id: connection time}].
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._puppets = {}      # puppet id -> puppet, for online listings
+        self._built = False
+
+    def _ensure_built(self):
+        """Seed the index from the session handler, e.g. after a reload."""
+        if self._built:
+            return
+        self._built = True
+        from evennia.server.sessionhandler import SESSIONS
+
+        for session in SESSIONS.get_sessions():
+            puppet = session.get_puppet() if session.logged_in else None
+            if puppet:
+                self._add_session(puppet, session)
+
+    def _add_session(self, puppet, session):
+        entry = self._entries.get(puppet.id)
+        if entry is None:
+            entry = [0, {}]
+            self._entries[puppet.id] = entry
+            self._puppets[puppet.id] = puppet
+        entry[0] = max(entry[0], session.cmd_last_visible or 0)
+        entry[1][session.sessid] = session.conn_time
+
+    def touch(self, puppet, timestamp=None):
+        """
+        Record visible activity for a puppet.
+
+        Args:
+            puppet (Object): The puppet that ran a command
+            timestamp (float, optional): When; defaults to now
+        """
+        self._ensure_built()
+        entry = self._entries.get(puppet.id)
+        if entry is not None:
+            entry[0] = timestamp or time.time()
+
+    def sync(self, puppet):
+        """
+        Re-read a puppet's sessions after it is puppeted or unpuppeted.
+
+        Args:
+            puppet (Object): The character whose sessions changed
+        """
+        self._ensure_built()
+        sessions = puppet.sessions.all()
+        if not sessions:
+            self.remove(puppet)
+            return
+        entry = self._entries.get(puppet.id)
+        last_activity = entry[0] if entry else 0
+        self._entries[puppet.id] = [last_activity, {}]
+        self._puppets[puppet.id] = puppet
+        for session in sessions:
+            self._add_session(puppet, session)
+
+    def remove(self, puppet):
+        """Drop a puppet from the index."""
+        self._entries.pop(puppet.id, None)
+        self._puppets.pop(puppet.id, None)
+
+    def is_online(self, puppet):
+        """Check whether a puppet has any connected session."""
+        self._ensure_built()
+        return puppet.id in self._entries
+
+    def get_session_count(self, puppet):
+        """Get the number of sessions puppeting a character."""
+        self._ensure_built()
+        entry = self._entries.get(puppet.id)
+        return len(entry[1]) if entry else 0
+
+    def get_last_activity(self, puppet):
+        """
+        Get when a puppet last ran a visible command.
+
+        Returns:
+            float or None: Timestamp, or None if offline or never active
+        """
+        self._ensure_built()
+        entry = self._entries.get(puppet.id)
+        return (entry[0] or None) if entry else None
+
+    def get_idle_seconds(self, puppet):
+        """
+        Get how long a puppet has been idle.
+
+        Returns:
+            float or None: Seconds since last activity, or None if offline
+        """
+        self._ensure_built()
+        entry = self._entries.get(puppet.id)
+        if entry is None:
+            return None
+        return time.time() - entry[0] if entry[0] else 0
+
+    def get_connected_seconds(self, puppet):
+        """
+        Get how long a puppet's oldest session has been connected.
+
+        Returns:
+            float or None: Seconds connected, or None if offline
+        """
+        self._ensure_built()
+        entry = self._entries.get(puppet.id)
+        if not entry or not entry[1]:
+            return None
+        return time.time() - min(entry[1].values())
+
+    def get_online_puppets(self):
+        """
+        Get every puppeted character.
+
+        Returns:
+            list: Online characters
+        """
+        self._ensure_built()
+        return list(self._puppets.values())
+
+
+SESSION_ACTIVITY = SessionActivityIndex()
@@ -6,6 +6,48 @@ import pytz
 from evennia.utils.utils import lazy_property
 from evennia.utils.logger import log_info
 
+class TimeFormatter:
+    """
+    Formats epoch timestamps in one resolved timezone.
+
+    Get one from TIME_MANAGER.get_formatter(character) once per listing and
+    reuse it for every row, rather than resolving the timezone per row.
+    """
+
+    DATETIME_FORMAT = "%Y-%m-%d %H:%M"
+    DATE_FORMAT = "%Y-%m-%d"
+
+    def __init__(self, tz):
+        self.tz = tz
+
+    def format(self, timestamp, fmt=DATETIME_FORMAT):
+        """
+        Format a timestamp in this formatter's timezone.
+
+        Args:
+            timestamp (int, float or datetime): Epoch seconds, or an aware
+                datetime (naive datetimes are taken as UTC). Strings saved
+                by older code are returned unchanged.
+            fmt (str, optional): strftime format
+
+        Returns:
+            str or None: The formatted time, or None if timestamp is empty
+        """
+        if timestamp is None or timestamp == "":
+            return None
+        if isinstance(timestamp, str):
+            return timestamp
+        if isinstance(timestamp, datetime):
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=pytz.UTC)
+            return timestamp.astimezone(self.tz).strftime(fmt)
+        return datetime.fromtimestamp(timestamp, self.tz).strftime(fmt)
+
+    def format_date(self, timestamp):
+        """Format a timestamp as a date only."""
+        return self.format(timestamp, self.DATE_FORMAT)
+
+
 class TimeManager:
     """
     Handles timezone conversions and time formatting based on player location.
@@ -66,6 +108,9 @@ class TimeManager:
         'India': 'Asia/Kolkata',
     }
     
+    def __init__(self):
+        self._formatters = {}   # timezone attribute value -> TimeFormatter
+
     @lazy_property
     def default_timezone(self):
         """Default timezone if none is set."""
@@ -138,6 +183,32 @@ class TimeManager:
         log_info(f"Falling back to UTC for player {player.key}")
         return self.default_timezone
         
+    def get_formatter(self, player):
+        """
+        Get the formatter for a character's timezone setting.
+
+        Formatters are cached by the raw timezone attribute, so the name is
+        normalized and the pytz zone built once per distinct setting.
+        Unknown or missing timezones format in UTC.
+
+        Args:
+            player (Character or Account): Whose timezone to use
+
+        Returns:
+            TimeFormatter: The formatter
+        """
+        tz_name = player.attributes.get("timezone", None) if player else None
+        formatter = self._formatters.get(tz_name)
+        if formatter is None:
+            normalized_tz = self.normalize_timezone_name(tz_name)
+            try:
+                tz = pytz.timezone(normalized_tz) if normalized_tz else pytz.UTC
+            except (pytz.exceptions.UnknownTimeZoneError, AttributeError, ValueError):
+                tz = pytz.UTC
+            formatter = TimeFormatter(tz)
+            self._formatters[tz_name] = formatter
+        return formatter
+
     def convert_to_player_time(self, timestamp, player):
         """
         Convert a UTC timestamp to the player's local time.
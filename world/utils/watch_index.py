@@ -0,0 +1,122 @@
+"""
+Reverse index for the +watch system.
+
+Maps each watched character name to the online characters watching it, plus
+the set of online characters watching everyone, so a connect or disconnect
+only touches its actual watchers. Also caches who is hidden from +watch and
+whom they permit. Kept in sync by CmdWatch and by puppet/unpuppet.
+"""
+
+from world.utils.session_activity import SESSION_ACTIVITY
+
+
+class WatchIndex:
+    """
+    Watched name (lowercase) -> watcher ids, for online, active watchers.
+    """
+
+    def __init__(self):
+        self._by_watched = {}   # watched name -> set of watcher ids
+        self._watch_all = set() # watcher ids watching all activity
+        self._watchers = {}     # watcher id -> (watcher, watched names)
+        self._visibility = {}   # character id -> (hidden, permitted names)
+        self._built = False
+
+    def _ensure_built(self):
+        """Index every online character, e.g. after a reload."""
+        if self._built:
+            return
+        self._built = True
+        for puppet in SESSION_ACTIVITY.get_online_puppets():
+            self.refresh_watcher(puppet)
+
+    def refresh_watcher(self, watcher):
+        """
+        Re-read a character's watch settings into the index.
+
+        Call after changing watch_list, watch_active or watch_all, and when
+        the character comes online.
+
+        Args:
+            watcher (Character): The watching character
+        """
+        self._ensure_built()
+        self._unindex(watcher.id)
+
+        attrs = watcher.attributes
+        if not attrs.get("watch_active", True):
+            return
+        watched = {name.lower() for name in attrs.get("watch_list", []) or []}
+        watch_all = attrs.get("watch_all", False)
+        if not watched and not watch_all:
+            return
+
+        self._watchers[watcher.id] = (watcher, watched)
+        for name in watched:
+            self._by_watched.setdefault(name, set()).add(watcher.id)
+        if watch_all:
+            self._watch_all.add(watcher.id)
+
+    def remove_watcher(self, watcher):
+        """Drop a character that went offline from the index."""
+        self._unindex(watcher.id)
+        self._visibility.pop(watcher.id, None)
+
+    def _unindex(self, watcher_id):
+        entry = self._watchers.pop(watcher_id, None)
+        if entry:
+            for name in entry[1]:
+                ids = self._by_watched.get(name)
+                if ids:
+                    ids.discard(watcher_id)
+                    if not ids:
+                        del self._by_watched[name]
+        self._watch_all.discard(watcher_id)
+
+    def refresh_visibility(self, character):
+        """Forget cached hide/permit settings after they change."""
+        self._visibility.pop(character.id, None)
+
+    def get_visibility(self, character):
+        """
+        Get whether a character hides from +watch, and whom they permit.
+
+        Returns:
+            tuple: (hidden, set of permitted lowercase names)
+        """
+        visibility = self._visibility.get(character.id)
+        if visibility is None:
+            hidden = bool(character.attributes.get("watch_hidden", False))
+            permitted = {name.lower() for name in character.attributes.get("watch_permitted", []) or []}
+            visibility = (hidden, permitted)
+            self._visibility[character.id] = visibility
+        return visibility
+
+    def get_watchers(self, character):
+        """
+        Get the online characters who should hear about a character.
+
+        Args:
+            character (Character): The character connecting or disconnecting
+
+        Returns:
+            list: Watching characters, excluding the character itself and
+                watchers it hides from
+        """
+        self._ensure_built()
+        ids = self._watch_all.union(self._by_watched.get(character.key.lower(), ()))
+        ids.discard(character.id)
+        if not ids:
+            return []
+
+        hidden, permitted = self.get_visibility(character)
+        watchers = []
+        for watcher_id in ids:
+            watcher = self._watchers[watcher_id][0]
+            if hidden and watcher.key.lower() not in permitted:
+                continue
+            watchers.append(watcher)
+        return watchers
+
+
+WATCH_INDEX = WatchIndex()
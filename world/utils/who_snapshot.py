@@ -0,0 +1,129 @@
+"""
+Shared snapshot of who is online, for +who.
+
+Keeps one pre-computed row per puppeted character, updated when characters
+connect, disconnect, move or change a flag shown on +who (staff, dark mode,
+umbra, LFRP). A +who call only filters and pages the sorted rows, so its cost
+does not grow with the number of sessions it would otherwise walk. The
+who_snapshot script rebuilds every row when it starts and then every
+WHO_SNAPSHOT_REBUILD_INTERVAL seconds, to pick up flags changed outside the
+tracked hooks (e.g. @set on unfindable); +who itself never rebuilds.
+"""
+
+from evennia.utils import utils
+from evennia.utils.ansi import strip_ansi
+
+from world.utils.session_activity import SESSION_ACTIVITY
+
+# Seconds between full rebuilds by the who_snapshot script
+WHO_SNAPSHOT_REBUILD_INTERVAL = 60
+
+
+class WhoRow:
+    """
+    One online character as shown on +who.
+    """
+
+    __slots__ = ("puppet", "sort_key", "suffix", "location", "room_unfindable",
+                 "unfindable", "dark", "staff", "_names")
+
+    def __init__(self, puppet):
+        self.puppet = puppet
+        self.sort_key = puppet.key
+        account = puppet.account
+
+        # Indicators shown before the name
+        suffix = ""
+        if puppet.check_permstring("builders"):
+            suffix += "*"
+        if puppet.tags.has("in_umbra", category="state"):
+            suffix = f"@{suffix}"
+        if puppet.db.lfrp:
+            suffix = f"${suffix}"
+        self.suffix = suffix or " "
+
+        location = puppet.location
+        self.location = location.key if location else None
+        self.room_unfindable = bool(location and location.db.unfindable)
+        self.unfindable = bool(puppet.db.unfindable)
+        self.dark = bool((account and account.tags.get("dark_mode", category="staff_status"))
+                         or puppet.tags.get("dark_mode", category="staff_status"))
+        self.staff = bool((account and account.tags.get("staff", category="role"))
+                          or puppet.tags.get("staff", category="role"))
+        self._names = {}
+
+    def get_name(self, viewer, viewer_is_builder):
+        """
+        Get the cropped name column, rendered once per kind of viewer.
+
+        Args:
+            viewer (Account): The account running +who
+            viewer_is_builder (bool): Whether the viewer sees builder details
+
+        Returns:
+            str: Name with indicators, cropped to 17 characters
+        """
+        name = self._names.get(viewer_is_builder)
+        if name is None:
+            clean_name = strip_ansi(self.puppet.get_display_name(viewer))
+            name = utils.crop(f"{self.suffix}{clean_name}", width=17)
+            self._names[viewer_is_builder] = name
+        return name
+
+    def get_location(self, viewer_is_builder):
+        """Get the room column, respecting unfindable characters and rooms."""
+        if not self.location:
+            return "None"
+        if viewer_is_builder:
+            return self.location
+        if self.unfindable or self.room_unfindable:
+            return "(Hidden)"
+        return self.location
+
+    def is_visible_to(self, viewer_puppet, viewer_is_staff):
+        """Check whether dark mode hides this row from a viewer."""
+        if self.puppet == viewer_puppet or not self.dark:
+            return True
+        return viewer_is_staff and self.staff
+
+
+class WhoSnapshot:
+    """
+    Puppet id -> WhoRow for every online character, plus a sorted view.
+    """
+
+    def __init__(self):
+        self._rows = {}
+        self._ordered = None
+
+    def rebuild(self):
+        """Recompute every online character's row."""
+        self._rows = {puppet.id: WhoRow(puppet) for puppet in SESSION_ACTIVITY.get_online_puppets()}
+        self._ordered = None
+
+    def refresh(self, puppet):
+        """
+        Recompute one character's row, or drop it if they went offline.
+
+        Args:
+            puppet (Character): The character whose +who details changed
+        """
+        if SESSION_ACTIVITY.is_online(puppet):
+            self._rows[puppet.id] = WhoRow(puppet)
+        else:
+            self._rows.pop(puppet.id, None)
+        self._ordered = None
+
+    def get_rows(self):
+        """
+        Get all rows, sorted by character name.
+
+        Returns:
+            list: WhoRow objects
+        """
+        if self._ordered is None:
+            self._ordered = sorted(self._rows.values(), key=lambda row: row.sort_key)
+        return self._ordered
+
+
+WHO_SNAPSHOT = WhoSnapshot()